@@ -0,0 +1,84 @@
+"""Benchmark communication app import time with lazily and eagerly imported client drivers.
+
+Runs ``python -X importtime`` in fresh interpreters and reports the cumulative
+import time of the communication app, the heaviest top-level packages and
+which driver libraries got loaded. The eager run also imports the PLC and
+SSH clients, like the app did before clients were created through the registry.
+
+Run from the repository root:
+
+    python benchmarks/bench_import_time.py [--runs 5] [--top 8]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+APP = "micro_cold_spray.api.communication.communication_app"
+DRIVERS = ("productivity", "pymodbus", "asyncssh", "cryptography")
+EAGER_CLIENTS = (
+    "micro_cold_spray.api.communication.clients.plc",
+    "micro_cold_spray.api.communication.clients.ssh",
+)
+
+
+def import_times(modules: List[str]) -> List[Tuple[str, int, int, bool]]:
+    """Import modules in a fresh interpreter.
+    
+    Returns:
+        (module, self us, cumulative us, top level) for every imported module
+    """
+    env = dict(os.environ, PYTHONPATH=str(SRC))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "; ".join(f"import {module}" for module in modules)],
+        capture_output=True, text=True, env=env, check=True
+    )
+    times = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        # Nested imports are indented below the module importing them
+        times.append((name.strip(), int(self_us), int(cumulative_us), not name.startswith("  ")))
+    return times
+
+
+def measure(name: str, modules: List[str], runs: int, top: int) -> float:
+    """Time imports over several runs and print the fastest one."""
+    best = None
+    for _ in range(runs):
+        times = import_times(modules)
+        total = sum(cumulative for module, _, cumulative, top_level in times if top_level and module in modules)
+        if best is None or total < best[0]:
+            best = (total, times)
+    total, times = best
+    
+    packages: Dict[str, int] = {}
+    for module, self_us, _, _ in times:
+        package = module.split(".")[0]
+        packages[package] = packages.get(package, 0) + self_us
+    loaded = [driver for driver in DRIVERS if driver in packages]
+    heaviest = sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]
+    
+    print(f"{name:>6}: {total / 1e3:8.1f} ms, drivers loaded: {', '.join(loaded) or 'none'}")
+    print("        " + ", ".join(f"{package} {us / 1e3:.1f} ms" for package, us in heaviest))
+    return total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per measurement, fastest is kept")
+    parser.add_argument("--top", type=int, default=8, help="Number of heaviest packages to list")
+    args = parser.parse_args()
+    
+    eager = measure("eager", [APP, *EAGER_CLIENTS], args.runs, args.top)
+    lazy = measure("lazy", [APP], args.runs, args.top)
+    print(f"{'saved':>6}: {(eager - lazy) / 1e3:8.1f} ms ({eager / lazy:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Benchmark tag cache poll cycle cost with and without the precompiled poll plan.
+
+Run from the repository root:
+
+    python benchmarks/bench_poll_plan.py [--tags 1000] [--cycles 500]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from loguru import logger  # noqa: E402
+
+from micro_cold_spray.api.communication.services.tag_cache import TagCacheService  # noqa: E402
+from micro_cold_spray.api.communication.services.tag_mapping import TagMappingService  # noqa: E402
+
+
+class FakePLCClient:
+    """PLC client that answers bulk reads from memory."""
+
+    def __init__(self, tags: Dict[str, Any]):
+        self._tags = tags
+
+    async def read_tag(self, tag: str) -> Any:
+        return self._tags[tag]
+
+    async def read_many(self, tags: List[str]) -> Dict[str, Any]:
+        return {tag: self._tags[tag] for tag in tags if tag in self._tags}
+
+
+def build_services(tag_count: int) -> TagCacheService:
+    """Build a tag cache over a synthetic tag map."""
+    config = {"communication": {"polling": {"interval": 0.2, "batch_size": 0}}}
+    mapping = TagMappingService(config)
+    for i in range(tag_count):
+        if i % 10 == 0:
+            mapping._tag_map[f"group{i // 100}.internal{i}"] = {"internal": True, "type": "bool"}
+        else:
+            mapping._tag_map[f"group{i // 100}.tag{i}"] = {"mapped": True, "plc_tag": f"PLC{i}", "type": "float"}
+    mapping._map_version = 1
+    mapping._is_running = True
+
+    plc_values = {info["plc_tag"]: 1.0 for info in mapping._tag_map.values() if "plc_tag" in info}
+    cache = TagCacheService(FakePLCClient(plc_values), None, mapping)
+    for tag in mapping._tag_map:
+        cache._cache[tag] = None
+    cache._rebuild_poll_plan()
+    return cache
+
+
+async def legacy_cycle(cache: TagCacheService) -> Dict[str, Any]:
+    """Resolve and read every tag the way the poll loop did before the plan."""
+    plc_tags: Dict[str, List[str]] = {}
+    for tag in cache._cache.keys():
+        tag_info = cache._tag_mapping.get_tag_info(tag)
+        if not tag_info:
+            continue
+        if "plc_tag" in tag_info:
+            plc_tags.setdefault(tag_info["plc_tag"], []).append(tag)
+        elif tag.startswith("ssh."):
+            tag.replace("ssh.", "")
+
+    plc_values = await cache._plc_client.read_many(list(plc_tags.keys()))
+    values = {}
+    for plc_tag, value in plc_values.items():
+        for tag in plc_tags.get(plc_tag, ()):
+            values[tag] = value
+    return values
+
+
+async def plan_cycle(cache: TagCacheService) -> Dict[str, Any]:
+    """Read every tag through the precompiled poll plan."""
+    group = cache._poll_plan[0]
+    return await cache._read_tags_batched(list(group.plc_names), list(group.plc_tags))
+
+
+async def measure(name: str, cycle, cache: TagCacheService, cycles: int, tag_count: int) -> float:
+    """Time a cycle function and print the cost per 1,000 tags."""
+    await cycle(cache)  # Warm up
+    start = time.perf_counter()
+    for _ in range(cycles):
+        await cycle(cache)
+    per_cycle = (time.perf_counter() - start) / cycles
+    print(f"{name:>8}: {per_cycle * 1e6:9.1f} us/cycle, {per_cycle * 1e6 * 1000 / tag_count:9.1f} us per 1,000 tags")
+    return per_cycle
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tags", type=int, default=1000, help="Number of synthetic tags")
+    parser.add_argument("--cycles", type=int, default=500, help="Number of poll cycles to time")
+    args = parser.parse_args()
+
+    logger.remove()
+    cache = build_services(args.tags)
+    before = await measure("before", legacy_cycle, cache, args.cycles, args.tags)
+    after = await measure("after", plan_cycle, cache, args.cycles, args.tags)
+    print(f"{'speedup':>8}: {before / after:9.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
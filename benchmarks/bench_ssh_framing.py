@@ -0,0 +1,177 @@
+"""Benchmark feeder command latency with fixed-sleep and prompt-framed responses.
+
+Starts a local fake gpascii server over SSH and times read_tag round trips,
+then compares reading the feeder registers one by one with one read_tags query.
+
+Run from the repository root:
+
+    python benchmarks/bench_ssh_framing.py [--commands 200] [--legacy-commands 3] [--reply-delay 0.002]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import asyncssh
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from loguru import logger  # noqa: E402
+
+from micro_cold_spray.api.communication.clients.ssh import SSHClient  # noqa: E402
+
+
+class FakeGpasciiSession(asyncssh.SSHServerSession):
+    """Shell that answers P-variable reads and writes like gpascii -2."""
+
+    def __init__(self, registers: Dict[str, str], reply_delay: float):
+        self._registers = registers
+        self._reply_delay = reply_delay
+        self._channel = None
+        self._buffer = ""
+        self._gpascii = False
+
+    def connection_made(self, chan) -> None:
+        self._channel = chan
+
+    def pty_requested(self, term_type, term_size, term_modes) -> bool:
+        return True
+
+    def shell_requested(self) -> bool:
+        return True
+
+    def session_started(self) -> None:
+        self._channel.write("root@ppmac:~# ")
+
+    def data_received(self, data: str, datatype) -> None:
+        self._buffer += data.replace("\r", "\n")
+        while "\n" in self._buffer:
+            line, self._buffer = self._buffer.split("\n", 1)
+            if line.strip():
+                asyncio.get_running_loop().call_later(self._reply_delay, self._reply, line.strip())
+
+    def _reply(self, line: str) -> None:
+        if not self._gpascii:
+            if line.startswith("gpascii"):
+                self._gpascii = True
+                self._channel.write("STDIN Open for ASCII Input\r\n")
+            return
+        reply = ""
+        for token in line.split():
+            if "=" in token:
+                name, value = token.split("=", 1)
+                self._registers[name] = value
+            elif token.startswith("P"):
+                reply += f"{token}={self._registers.get(token, 0)}\r\n"
+        self._channel.write(reply + "\x06\r\n")
+
+
+class FakeGpasciiServer(asyncssh.SSHServer):
+    """SSH server accepting any password and serving fake gpascii shells."""
+
+    def __init__(self, registers: Dict[str, str], reply_delay: float):
+        self._registers = registers
+        self._reply_delay = reply_delay
+
+    def begin_auth(self, username: str) -> bool:
+        return True
+
+    def password_auth_supported(self) -> bool:
+        return True
+
+    def validate_password(self, username: str, password: str) -> bool:
+        return True
+
+    def session_requested(self) -> FakeGpasciiSession:
+        return FakeGpasciiSession(self._registers, self._reply_delay)
+
+
+class LegacySSHClient(SSHClient):
+    """SSH client that waits a fixed command timeout, as before response framing."""
+
+    async def _send_command(self, command: str) -> List[str]:
+        async with self._command_lock:
+            await self._read_response()
+            await self._send_raw(command)
+            await asyncio.sleep(self._command_timeout)
+            response = (await self._read_response()).split("\r\n")
+            return [msg for msg in response if msg != ""]
+
+
+async def measure(name: str, client: SSHClient, commands: int) -> float:
+    """Time read_tag round trips and print the mean latency."""
+    await client.read_tag("P6")  # Warm up
+    start = time.perf_counter()
+    for _ in range(commands):
+        await client.read_tag("P6")
+    per_command = (time.perf_counter() - start) / commands
+    print(f"{name:>8}: {per_command * 1e3:10.2f} ms/command over {commands} commands")
+    return per_command
+
+
+async def measure_poll(client: SSHClient, registers: List[str], polls: int) -> None:
+    """Time a feeder poll done with one query per register and with one combined query."""
+    start = time.perf_counter()
+    for _ in range(polls):
+        for register in registers:
+            await client.read_tag(register)
+    single = (time.perf_counter() - start) / polls
+    
+    start = time.perf_counter()
+    for _ in range(polls):
+        await client.read_tags(registers)
+    combined = (time.perf_counter() - start) / polls
+    
+    print(f"{'per-tag':>8}: {single * 1e3:10.2f} ms/poll of {len(registers)} registers")
+    print(f"{'combined':>8}: {combined * 1e3:10.2f} ms/poll of {len(registers)} registers ({single / combined:.1f}x)")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--commands", type=int, default=200, help="Number of framed commands to time")
+    parser.add_argument("--legacy-commands", type=int, default=3, help="Number of fixed-sleep commands to time")
+    parser.add_argument("--reply-delay", type=float, default=0.002, help="Simulated device reply time in seconds")
+    parser.add_argument("--command-timeout", type=float, default=5.0, help="SSH command_timeout setting")
+    args = parser.parse_args()
+
+    logger.remove()
+    registers = {"P6": "1", "P10": "1", "P12": "0", "P13": "0"}
+    server = await asyncssh.create_server(
+        lambda: FakeGpasciiServer(registers, args.reply_delay),
+        "127.0.0.1",
+        0,
+        server_host_keys=[asyncssh.generate_private_key("ssh-ed25519")],
+        line_editor=False
+    )
+    port = server.sockets[0].getsockname()[1]
+    config = {"communication": {"hardware": {"network": {"ssh": {
+        "host": "127.0.0.1",
+        "port": port,
+        "username": "root",
+        "password": "fake",
+        "command_timeout": args.command_timeout
+    }}}}}
+
+    try:
+        results = {}
+        for name, client_class, commands in (
+            ("before", LegacySSHClient, args.legacy_commands),
+            ("after", SSHClient, args.commands)
+        ):
+            client = client_class(config)
+            await client.connect()
+            results[name] = await measure(name, client, commands)
+            if client_class is SSHClient:
+                await measure_poll(client, list(registers), args.commands)
+            await client.disconnect()
+        print(f"{'speedup':>8}: {results['before'] / results['after']:10.0f}x")
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
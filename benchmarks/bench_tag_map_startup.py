@@ -0,0 +1,71 @@
+"""Benchmark loading the tag map at startup from YAML and from the compiled cache.
+
+Each round loads config/tags.yaml into a fresh TagMappingService, the way
+the communication service does on startup.
+
+Run from the repository root:
+
+    python benchmarks/bench_tag_map_startup.py [--rounds 20] [--debug-log]
+"""
+
+import argparse
+import io
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from loguru import logger  # noqa: E402
+
+from micro_cold_spray.api.communication.services import tag_mapping  # noqa: E402
+from micro_cold_spray.api.communication.services.tag_mapping import TagMappingService  # noqa: E402
+
+
+def make_config(cache_path: Optional[Path]) -> Dict[str, Any]:
+    """Build a tag mapping config, with the compiled cache at cache_path if given."""
+    return {"communication": {"services": {"tag_mapping": {
+        "config_file": "config/tags.yaml",
+        "compiled_cache": str(cache_path) if cache_path else None
+    }}}}
+
+
+def measure(name: str, config: Dict[str, Any], rounds: int) -> float:
+    """Time loading the tag map into a fresh service and print the cost per load."""
+    TagMappingService(config)._load_config()  # Warm up, fills the cache
+    start = time.perf_counter()
+    for _ in range(rounds):
+        TagMappingService(config)._load_config()
+    per_load = (time.perf_counter() - start) / rounds
+    print(f"{name:>10}: {per_load * 1e3:8.2f} ms/load")
+    return per_load
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=20, help="Loads per measurement")
+    parser.add_argument("--debug-log", action="store_true", help="Format debug logs like the default log setup")
+    args = parser.parse_args()
+    
+    logger.remove()
+    if args.debug_log:
+        logger.add(io.StringIO(), level="DEBUG")
+    
+    loader = tag_mapping._YAML_LOADER
+    tag_mapping._YAML_LOADER = yaml.SafeLoader
+    before = measure("yaml", make_config(None), args.rounds)
+    tag_mapping._YAML_LOADER = loader
+    if loader is not yaml.SafeLoader:
+        measure("libyaml", make_config(None), args.rounds)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        after = measure("compiled", make_config(Path(tmp) / "tags.cache"), args.rounds)
+    print(f"{'speedup':>10}: {before / after:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Benchmark tag name translation with the old map scans and the load-time indexes.
+
+Run from the repository root:
+
+    python benchmarks/bench_tag_mapping.py [--tags 1000] [--rounds 20]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from loguru import logger  # noqa: E402
+
+from micro_cold_spray.api.communication.services.tag_mapping import TagMappingService  # noqa: E402
+
+
+def build_mapping(tag_count: int) -> TagMappingService:
+    """Build a mapping service over a synthetic tag map."""
+    mapping = TagMappingService({"communication": {}})
+    for i in range(tag_count):
+        mapping._tag_map[f"group{i // 100}.tag{i}"] = {"mapped": True, "plc_tag": f"PLC{i}", "type": "float"}
+    mapping._build_indexes()
+    mapping._is_running = True
+    return mapping
+
+
+def legacy_get_plc_tag(mapping: TagMappingService, internal_tag: str) -> Optional[str]:
+    """Look up a PLC tag the way get_plc_tag did before the indexes."""
+    logger.debug(f"Looking up PLC tag for {internal_tag}")
+    if internal_tag not in mapping._tag_map:
+        return None
+    tag_info = mapping._tag_map[internal_tag]
+    logger.debug(f"Found tag info: {tag_info}")
+    if not tag_info.get("mapped", False):
+        return None
+    return tag_info.get("plc_tag")
+
+
+def legacy_get_internal_tag(mapping: TagMappingService, plc_tag: str) -> Optional[str]:
+    """Look up an internal tag the way get_internal_tag did before the indexes."""
+    for internal_name, tag_info in mapping._tag_map.items():
+        if tag_info.get("mapped", False) and tag_info.get("plc_tag") == plc_tag:
+            return internal_name
+    return None
+
+
+def measure(name: str, translate: Callable[[], Dict[str, Any]], rounds: int, count: int) -> float:
+    """Time translating every tag once per round and print the cost per tag."""
+    translate()  # Warm up
+    start = time.perf_counter()
+    for _ in range(rounds):
+        translate()
+    per_tag = (time.perf_counter() - start) / rounds / count
+    print(f"{name:>24}: {per_tag * 1e9:10.0f} ns/tag")
+    return per_tag
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tags", type=int, default=1000, help="Number of synthetic tags")
+    parser.add_argument("--rounds", type=int, default=20, help="Times every tag is translated")
+    args = parser.parse_args()
+    
+    logger.remove()
+    mapping = build_mapping(args.tags)
+    internal_values = {name: 1.0 for name in mapping._tag_map}
+    plc_values = {info["plc_tag"]: 1.0 for info in mapping._tag_map.values()}
+    
+    before = measure(
+        "to internal, scan",
+        lambda: {legacy_get_internal_tag(mapping, tag): value for tag, value in plc_values.items()},
+        args.rounds, args.tags
+    )
+    after = measure("to internal, batch", lambda: mapping.translate_many(plc_values), args.rounds, args.tags)
+    print(f"{'speedup':>24}: {before / after:10.1f}x")
+    
+    before = measure(
+        "to PLC, get_plc_tag (old)",
+        lambda: {legacy_get_plc_tag(mapping, tag): value for tag, value in internal_values.items()},
+        args.rounds, args.tags
+    )
+    measure(
+        "to PLC, get_plc_tag",
+        lambda: {mapping.get_plc_tag(tag): value for tag, value in internal_values.items()},
+        args.rounds, args.tags
+    )
+    after = measure("to PLC, batch", lambda: mapping.translate_many(internal_values, to_plc=True), args.rounds, args.tags)
+    print(f"{'speedup':>24}: {before / after:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
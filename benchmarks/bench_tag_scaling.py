@@ -0,0 +1,76 @@
+"""Benchmark scaling a poll batch per tag and with a precomputed TagScaler.
+
+Run from the repository root:
+
+    python benchmarks/bench_tag_scaling.py [--tags 200] [--rounds 2000]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from loguru import logger  # noqa: E402
+
+from micro_cold_spray.api.communication.services.tag_mapping import TagMappingService  # noqa: E402
+
+
+def build_mapping(tag_count: int) -> TagMappingService:
+    """Build a mapping service over a synthetic tag map, every other tag scaled."""
+    mapping = TagMappingService({"communication": {}})
+    for i in range(tag_count):
+        tag_info: Dict[str, Any] = {"mapped": True, "plc_tag": f"PLC{i}", "type": "float"}
+        if i % 2 == 0:
+            tag_info.update(scaling="12bit_linear" if i % 4 else "12bit_dac", range=[0.0, 100.0 + i])
+        mapping._tag_map[f"group{i // 100}.tag{i}"] = tag_info
+    mapping._build_indexes()
+    mapping._is_running = True
+    return mapping
+
+
+def scale_per_tag(mapping: TagMappingService, values: Dict[str, Any]) -> Dict[str, Any]:
+    """Scale a batch by looking at every tag's definition, without precomputed parameters."""
+    scaled = {}
+    for tag, value in values.items():
+        tag_info = mapping._tag_map[tag]
+        scaling = tag_info.get("scaling")
+        if scaling == "12bit_linear" or scaling == "12bit_dac":
+            low, high = tag_info["range"]
+            scaled[tag] = low + value * (high - low) / 4095
+        else:
+            scaled[tag] = value
+    return scaled
+
+
+def measure(name: str, scale: Callable[[], Any], rounds: int, count: int) -> float:
+    """Time scaling the batch once per round and print the cost per tag."""
+    scale()  # Warm up
+    start = time.perf_counter()
+    for _ in range(rounds):
+        scale()
+    per_tag = (time.perf_counter() - start) / rounds / count
+    print(f"{name:>12}: {per_tag * 1e9:10.0f} ns/tag")
+    return per_tag
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tags", type=int, default=200, help="Number of synthetic tags in the poll batch")
+    parser.add_argument("--rounds", type=int, default=2000, help="Times the batch is scaled")
+    args = parser.parse_args()
+    
+    logger.remove()
+    mapping = build_mapping(args.tags)
+    scaler = mapping.get_scaler(mapping._tag_map)
+    values = {tag: 2048 for tag in mapping._tag_map}
+    
+    before = measure("per tag", lambda: scale_per_tag(mapping, values), args.rounds, args.tags)
+    after = measure("vectorized", lambda: {**values, **scaler.to_engineering(values)}, args.rounds, args.tags)
+    print(f"{'speedup':>12}: {before / after:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Benchmark resolving hardware set tags by string formatting and through compiled templates.
+
+Resolves every ``hardware_sets.set{1|2}`` tag of the atomic actions in
+config/process.yaml for both hardware sets.
+
+Run from the repository root:
+
+    python benchmarks/bench_tag_templates.py [--rounds 20000]
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from loguru import logger  # noqa: E402
+
+from micro_cold_spray.api.communication.services.tag_mapping import TagMappingService  # noqa: E402
+from micro_cold_spray.api.communication.services.tag_templates import resolve_hardware_set  # noqa: E402
+
+SETS = (1, 2)
+
+
+def measure(name: str, resolve: Callable[[], List[str]], rounds: int, count: int) -> float:
+    """Time resolving every template once per round and print the cost per tag."""
+    resolve()  # Warm up
+    start = time.perf_counter()
+    for _ in range(rounds):
+        resolve()
+    per_tag = (time.perf_counter() - start) / rounds / count
+    print(f"{name:>10}: {per_tag * 1e9:8.0f} ns/tag")
+    return per_tag
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=20000, help="Times every template is resolved")
+    args = parser.parse_args()
+    
+    logger.remove()
+    mapping = TagMappingService({"communication": {"services": {"tag_mapping": {"config_file": "config/tags.yaml"}}}})
+    mapping._load_config()
+    mapping._is_running = True
+    
+    templates = sorted(set(re.findall(r"hardware_sets\.set\{1\|2\}[\w.]+", Path("config/process.yaml").read_text())))
+    formats = [template.replace("{1|2}", "{}") for template in templates]
+    handles = list(mapping.compile_templates(templates).values())
+    hardware_sets = mapping._hardware_sets
+    tag_map = mapping._tag_map
+    count = len(templates) * len(SETS)
+    
+    def format_names() -> List[str]:
+        tags = []
+        for set_id in SETS:
+            for fmt in formats:
+                tag = resolve_hardware_set(fmt.format(set_id), hardware_sets)
+                if tag not in tag_map:
+                    raise KeyError(tag)
+                tags.append(tag)
+        return tags
+    
+    before = measure("format", format_names, args.rounds, count)
+    after = measure("compiled", lambda: [handle.resolve(set_id) for set_id in SETS for handle in handles], args.rounds, count)
+    print(f"{'speedup':>10}: {before / after:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Benchmark an offline pump-down and gas flow run on the wall clock and a virtual clock.
+
+Drives the mock PLC through the tag cache the way a sequence does: pump down,
+wait for chamber pressure, flow gas and hold, then stop. Both runs use the
+same simulation seed, readings differ only by measurement noise.
+
+Run from the repository root:
+
+    python benchmarks/bench_virtual_clock.py [--hold 60] [--skip-real]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from loguru import logger  # noqa: E402
+
+from micro_cold_spray.api.communication.clients.mock import MockPLCClient  # noqa: E402
+from micro_cold_spray.api.communication.services.tag_cache import TagCacheService  # noqa: E402
+from micro_cold_spray.api.communication.services.tag_mapping import TagMappingService  # noqa: E402
+from micro_cold_spray.utils import clock  # noqa: E402
+from micro_cold_spray.utils.clock import VirtualClockEventLoop  # noqa: E402
+
+
+def load_config() -> Dict[str, Any]:
+    """Load communication config with the mock client enabled."""
+    with open("config/communication.yaml") as f:
+        config = yaml.safe_load(f)
+    config["communication"]["hardware"]["network"]["force_mock"] = True
+    return config
+
+
+async def run_recipe(config: Dict[str, Any], hold: float) -> Dict[str, Any]:
+    """Pump down, flow gas for the hold time and stop.
+
+    Returns:
+        Simulated seconds and final readings
+    """
+    mapping = TagMappingService(config)
+    await mapping.start()
+    cache = TagCacheService(MockPLCClient(config, mapping.get_plc_scaler), None, mapping)
+    await cache.start()
+    started = clock.monotonic()
+    try:
+        await cache.set_tags({
+            "gas_control.main_valve.open": False,
+            "gas_control.feeder_valve.open": False,
+            "vacuum.vent_valve": False,
+            "vacuum.gate_valve.open": True,
+            "vacuum.mechanical_pump.start": True
+        })
+        await cache.wait_for("vacuum.chamber_pressure", lambda p: p is not None and p < 10.0, timeout=600)
+        await cache.set_tag("vacuum.booster_pump.start", True)
+        await cache.wait_for("vacuum.chamber_pressure", lambda p: p < 1.0, timeout=600)
+        pumped_down = await cache.get_tag("vacuum.chamber_pressure")
+        
+        await cache.set_tags({"gas_control.main_flow.setpoint": 80.0, "gas_control.main_valve.open": True})
+        await asyncio.sleep(hold)
+        flow = await cache.get_tag("gas_control.main_flow.measured")
+        
+        await cache.set_tags({"gas_control.main_valve.open": False, "vacuum.booster_pump.stop": True})
+        return {
+            "simulated_s": clock.monotonic() - started,
+            "pumped_down_torr": pumped_down,
+            "flow": flow
+        }
+    finally:
+        await cache.stop()
+        await mapping.stop()
+
+
+def measure(name: str, loop: asyncio.AbstractEventLoop, config: Dict[str, Any], hold: float) -> float:
+    """Run the recipe on a loop and print simulated and wall time."""
+    start = time.perf_counter()
+    try:
+        result = loop.run_until_complete(run_recipe(config, hold))
+    finally:
+        loop.close()
+    wall = time.perf_counter() - start
+    print(
+        f"{name:>8}: {result['simulated_s']:8.1f} s simulated in {wall:8.2f} s "
+        f"({result['simulated_s'] / wall:7.1f}x), chamber {result['pumped_down_torr']:.3f} torr, "
+        f"flow {result['flow']:.2f}"
+    )
+    return wall
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hold", type=float, default=60.0, help="Simulated gas flow hold time in seconds")
+    parser.add_argument("--skip-real", action="store_true", help="Only run on the virtual clock")
+    args = parser.parse_args()
+
+    logger.remove()
+    config = load_config()
+    virtual = measure("virtual", VirtualClockEventLoop(), config, args.hold)
+    if not args.skip_real:
+        real = measure("real", asyncio.new_event_loop(), config, args.hold)
+        print(f"{'speedup':>8}: {real / virtual:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
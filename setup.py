@@ -17,9 +17,9 @@ setup(
         "PyQt6>=6.4.0",
         "PySide6>=6.4.0",
         "pyyaml>=6.0.1",
-        "paramiko>=3.4.0",
         "loguru>=0.7.0",
         "productivity>=0.11.1",
+        "numpy>=1.24.0",
         
         # API Dependencies
         "fastapi>=0.95.0",
@@ -1,11 +1,13 @@
 """Communication service startup script."""
 
+import asyncio
 import os
 import sys
 import uvicorn
 from loguru import logger
 
 from micro_cold_spray.api.communication.communication_app import create_communication_service, load_config
+from micro_cold_spray.utils.clock import install_virtual_clock, virtual_clock_enabled
 
 
 def main():
@@ -19,6 +21,14 @@ def main():
         # Create app instance with config
         app = create_communication_service()
         
+        if virtual_clock_enabled():
+            # Serve on our own loop so uvicorn does not replace the virtual clock
+            logger.warning("Running on a virtual clock, only use with the mock client")
+            install_virtual_clock()
+            server = uvicorn.Server(uvicorn.Config(app, host=host, port=port, loop="none", log_level="info"))
+            asyncio.run(server.serve())
+            return
+        
         # Run service
         uvicorn.run(
             app,
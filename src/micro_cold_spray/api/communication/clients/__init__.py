@@ -1,11 +1,47 @@
-"""Communication client implementations."""
+"""Communication client implementations.
+
+Driver backed clients are imported on first access, create them through
+``create_client`` to only load the driver in use.
+"""
+
+from importlib import import_module
+from typing import Any
+
+from micro_cold_spray.api.communication.clients.base import TagClient
+from micro_cold_spray.api.communication.clients.recording import (
+    RecordingClient,
+    ReplayPLCClient,
+    SessionRecorder,
+    read_recording
+)
+from micro_cold_spray.api.communication.clients.registry import create_client, get_client_class, register_client
+from micro_cold_spray.api.communication.clients.supervisor import ConnectionSupervisor
+
+# Exported clients imported on first access
+_LAZY_CLIENTS = {
+    "MockPLCClient": "micro_cold_spray.api.communication.clients.mock",
+    "PLCClient": "micro_cold_spray.api.communication.clients.plc",
+    "SSHClient": "micro_cold_spray.api.communication.clients.ssh",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_CLIENTS:
+        return getattr(import_module(_LAZY_CLIENTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-from micro_cold_spray.api.communication.clients.mock import MockPLCClient
-from micro_cold_spray.api.communication.clients.plc import PLCClient
-from micro_cold_spray.api.communication.clients.ssh import SSHClient
 
 __all__ = [
+    "ConnectionSupervisor",
     "MockPLCClient",
     "PLCClient",
+    "RecordingClient",
+    "ReplayPLCClient",
+    "SessionRecorder",
     "SSHClient",
+    "TagClient",
+    "create_client",
+    "get_client_class",
+    "read_recording",
+    "register_client",
 ]
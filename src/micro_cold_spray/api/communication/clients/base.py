@@ -0,0 +1,52 @@
+"""Common interface of PLC clients."""
+
+from typing import Any, Dict, List, Protocol, runtime_checkable
+
+
+@runtime_checkable
+class TagClient(Protocol):
+    """Async tag client interface shared by the real and mock PLC clients.
+
+    Higher layers should batch through ``read_many``/``write_many`` and never
+    need to know which client they are talking to.
+    """
+
+    async def connect(self) -> None:
+        """Connect to the device."""
+        ...
+
+    async def disconnect(self) -> None:
+        """Disconnect from the device."""
+        ...
+
+    def is_connected(self) -> bool:
+        """Check if client is connected."""
+        ...
+
+    async def read_tag(self, tag: str) -> Any:
+        """Read one tag value."""
+        ...
+
+    async def write_tag(self, tag: str, value: Any) -> None:
+        """Write one tag value."""
+        ...
+
+    async def read_many(self, tags: List[str]) -> Dict[str, Any]:
+        """Read several tag values in one request.
+        
+        Args:
+            tags: Tag names to read
+        
+        Returns:
+            Dict mapping tag names to values, tags the device does not know
+            may be omitted
+        """
+        ...
+
+    async def write_many(self, values: Dict[str, Any]) -> None:
+        """Write several tag values in one request.
+        
+        Args:
+            values: Dict mapping tag names to values
+        """
+        ...
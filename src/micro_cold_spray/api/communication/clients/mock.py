@@ -2,19 +2,32 @@
 
 import asyncio
 import yaml
-from typing import Any, Dict, Optional, List
+from typing import Any, Callable, Dict, Optional, List
 from pathlib import Path
 from loguru import logger
 
+from micro_cold_spray.api.communication.clients.simulator import PlantSimulator
+from micro_cold_spray.api.communication.services.tag_scaling import EMPTY_SCALER, TagScaler
+
 
 class MockPLCClient:
-    """Mock client that simulates PLC behavior."""
+    """Mock client that simulates PLC behavior, implements TagClient.
+    
+    The simulation works in engineering units. Like the real PLC, the client
+    exchanges analog tags as raw counts, using the scaling of the current
+    tag map (see TagMappingService.get_plc_scaler), so reloads apply.
+    """
+    
+    # Seconds between simulation updates
+    UPDATE_INTERVAL = 0.02
     
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], get_scaler: Optional[Callable[[], TagScaler]] = None):
         """Initialize mock client.
         
         Args:
             config: Client configuration
+            get_scaler: Returns the analog tag scaling by PLC tag, called on every
+                request. Values are exchanged unscaled if None
         """
         self._connected = False
         self._config = config
@@ -29,14 +42,27 @@ class MockPLCClient:
                 self._mock_data = yaml.safe_load(f)
             logger.info(f"Loaded mock data from {mock_data_path}")
             
-        # Initialize mock tag values
-        self._plc_tags = self._mock_data.get("plc_tags", {})
+        # Initialize mock tag values and the process simulation behind them
+        simulation = config.get("communication", {}).get("simulation", {})
+        self._simulator = PlantSimulator(
+            self._mock_data.get("plc_tags", {}),
+            seed=simulation.get("seed"),
+            step=simulation.get("step", 0.01),
+            noise=simulation.get("noise", True)
+        )
+        self._plc_tags = self._simulator.tags
+        self._get_scaler = get_scaler or (lambda: EMPTY_SCALER)
         
         # Add simulated behavior
         self._update_task = None
         self._running = False
         logger.info(f"Mock client initialized with {len(self._plc_tags)} tags")
 
+    @property
+    def simulator(self) -> PlantSimulator:
+        """Get process simulation."""
+        return self._simulator
+
     async def connect(self) -> None:
         """Simulate connection."""
         await asyncio.sleep(0.1)  # Simulate connection delay
@@ -74,7 +100,8 @@ class MockPLCClient:
             raise ConnectionError("Mock client not connected")
             
         # Return mock value if exists, otherwise 0
-        value = self._plc_tags.get(tag, 0)
+        value = self._simulator.read(tag)
+        value = self._get_scaler().to_raw({tag: value}).get(tag, value)
         logger.debug(f"Read mock tag {tag} = {value}")
         return value
 
@@ -89,9 +116,23 @@ class MockPLCClient:
             raise ConnectionError("Mock client not connected")
             
         # Update mock value
-        self._plc_tags[tag] = value
+        value = self._get_scaler().to_engineering({tag: value}).get(tag, value)
+        self._simulator.write(tag, value)
         logger.debug(f"Wrote mock tag {tag} = {value}")
 
+    async def write_many(self, values: Dict[str, Any]) -> None:
+        """Write multiple mock tag values.
+        
+        Args:
+            values: Dictionary mapping tag names to values
+        """
+        if not self._connected:
+            raise ConnectionError("Mock client not connected")
+            
+        for tag, value in {**values, **self._get_scaler().to_engineering(values)}.items():
+            self._simulator.write(tag, value)
+        logger.debug(f"Wrote mock tags: {values}")
+
     def is_connected(self) -> bool:
         """Check if mock client is connected.
         
@@ -100,7 +141,7 @@ class MockPLCClient:
         """
         return self._connected
 
-    async def get(self, tags: List[str]) -> Dict[str, Any]:
+    async def read_many(self, tags: List[str]) -> Dict[str, Any]:
         """Read multiple mock tag values.
         
         Args:
@@ -113,26 +154,21 @@ class MockPLCClient:
             raise ConnectionError("Mock client not connected")
             
         # Return mock values for all requested tags
-        values = {tag: self._plc_tags.get(tag, 0) for tag in tags}
+        values = {tag: self._simulator.read(tag) for tag in tags}
+        values.update(self._get_scaler().to_raw(values))
         logger.debug(f"Read mock tags: {values}")
         return values
 
     async def _simulate_updates(self) -> None:
-        """Background task to simulate tag value updates."""
+        """Background task advancing the simulation in real time."""
         try:
+            loop = asyncio.get_running_loop()
+            last = loop.time()
             while self._running:
-                # Simulate some tag value changes
-                for tag in self._plc_tags:
-                    if "Position" in tag:
-                        # Simulate small position changes
-                        current = self._plc_tags[tag]
-                        self._plc_tags[tag] = current + (0.1 if current < 100 else -0.1)
-                    elif "Pressure" in tag:
-                        # Simulate pressure fluctuations
-                        current = self._plc_tags[tag]
-                        self._plc_tags[tag] = current + (0.05 if current < 5 else -0.05)
-                        
-                await asyncio.sleep(0.1)  # Update every 100ms
+                await asyncio.sleep(self.UPDATE_INTERVAL)
+                now = loop.time()
+                self._simulator.advance(now - last)
+                last = now
                 
         except asyncio.CancelledError:
             logger.debug("Mock update simulation stopped")
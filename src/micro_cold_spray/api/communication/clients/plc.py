@@ -1,12 +1,12 @@
 """PLC communication client."""
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from loguru import logger
 from productivity import ProductivityPLC
 
 
 class PLCClient:
-    """Client for communicating with Productivity PLC."""
+    """Client for communicating with Productivity PLC, implements TagClient."""
     
     def __init__(self, config: Dict[str, Any]):
         """Initialize PLC client.
@@ -81,6 +81,27 @@ class PLCClient:
             logger.error(f"Failed to read tag '{tag}' from PLC: {str(e)}")
             raise
 
+    async def read_many(self, tags: List[str]) -> Dict[str, Any]:
+        """Read multiple tag values in a single PLC request.
+        
+        Args:
+            tags: List of tag names to read
+        
+        Returns:
+            Dictionary mapping tag names to values (unknown tags are omitted)
+        """
+        if not self._connected:
+            raise ConnectionError("PLC not connected")
+        
+        try:
+            # One request returns every tag, filter down to the requested ones
+            values = await self._plc.get()
+            return {tag: values[tag] for tag in tags if tag in values}
+        
+        except Exception as e:
+            logger.error(f"Failed to read {len(tags)} tags from PLC: {str(e)}")
+            raise
+
     async def write_tag(self, tag: str, value: Any) -> None:
         """Write tag value.
         
@@ -103,6 +124,30 @@ class PLCClient:
             logger.error(f"Failed to write tag '{tag}' = {value} to PLC: {str(e)}")
             raise
 
+    async def write_many(self, values: Dict[str, Any]) -> None:
+        """Write multiple tag values in a single PLC request.
+        
+        The library writes all discrete values before any registers, so
+        callers needing a strict order must split their writes.
+        
+        Args:
+            values: Dictionary mapping tag names to values
+        """
+        if not self._connected:
+            raise ConnectionError("PLC not connected")
+        
+        unknown = [tag for tag in values if tag not in self._tags]
+        if unknown:
+            raise ValueError(f"Tags not found in PLC: {', '.join(unknown)}")
+        
+        try:
+            await self._plc.set(values)
+            logger.debug(f"Wrote {len(values)} tags: {values}")
+        
+        except Exception as e:
+            logger.error(f"Failed to write {len(values)} tags to PLC: {str(e)}")
+            raise
+
     def is_connected(self) -> bool:
         """Check if client is connected.
         
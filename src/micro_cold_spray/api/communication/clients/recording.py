@@ -0,0 +1,363 @@
+"""Session recording and replay of client traffic.
+
+Recordings are a compact binary log: a magic header followed by records of
+``<timestamp float64><kind uint8><source uint8><count uint16>`` and
+``count`` (tag id, typed value) pairs. Tag names are stored once, in a
+definition record written the first time a tag is seen.
+"""
+
+import struct
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+from loguru import logger
+
+from micro_cold_spray.utils import clock
+
+
+MAGIC = b"MCSREC1\n"
+
+# Record kinds
+DEFINE = 0
+READ = 1
+WRITE = 2
+
+SOURCES: Tuple[str, ...] = ("plc", "ssh")
+
+_RECORD = struct.Struct("<dBBH")
+_DEFINE = struct.Struct("<HH")
+_TAG_ID = struct.Struct("<H")
+_INT = struct.Struct("<q")
+_FLOAT = struct.Struct("<d")
+_LENGTH = struct.Struct("<H")
+
+# Value type codes
+_NONE, _FALSE, _TRUE, _INT_CODE, _FLOAT_CODE, _STR_CODE = range(6)
+
+
+class RecordedEvent(NamedTuple):
+    """One read result or write from a recording."""
+    time: float
+    kind: int
+    source: str
+    values: Dict[str, Any]
+
+
+def _encode_value(value: Any) -> bytes:
+    """Encode a tag value as a type code and packed data."""
+    if value is None:
+        return bytes((_NONE,))
+    if isinstance(value, bool):
+        return bytes((_TRUE if value else _FALSE,))
+    if isinstance(value, int) and -2 ** 63 <= value < 2 ** 63:
+        return bytes((_INT_CODE,)) + _INT.pack(value)
+    if isinstance(value, float):
+        return bytes((_FLOAT_CODE,)) + _FLOAT.pack(value)
+    data = str(value).encode()
+    return bytes((_STR_CODE,)) + _LENGTH.pack(len(data)) + data
+
+
+def _decode_value(data: bytes, offset: int) -> Tuple[Any, int]:
+    """Decode a tag value, returning it and the offset after it."""
+    code = data[offset]
+    offset += 1
+    if code == _NONE:
+        return None, offset
+    if code in (_FALSE, _TRUE):
+        return code == _TRUE, offset
+    if code == _INT_CODE:
+        return _INT.unpack_from(data, offset)[0], offset + _INT.size
+    if code == _FLOAT_CODE:
+        return _FLOAT.unpack_from(data, offset)[0], offset + _FLOAT.size
+    if code == _STR_CODE:
+        length = _LENGTH.unpack_from(data, offset)[0]
+        offset += _LENGTH.size
+        return data[offset:offset + length].decode(), offset + length
+    raise ValueError(f"Unknown value type {code} at offset {offset - 1}")
+
+
+class SessionRecorder:
+    """Appends client reads and writes to a binary session log."""
+
+    def __init__(self, path: Union[str, Path]):
+        """Open a new recording, replacing any file at the path.
+        
+        Args:
+            path: Recording file path
+        """
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._file: Optional[BinaryIO] = open(self._path, "wb")
+        self._file.write(MAGIC)
+        self._tag_ids: Dict[str, int] = {}
+        self._records = 0
+        logger.info(f"Recording client traffic to {self._path}")
+
+    @property
+    def path(self) -> Path:
+        """Get recording file path."""
+        return self._path
+
+    @property
+    def records(self) -> int:
+        """Get number of read and write records written."""
+        return self._records
+
+    def record(self, kind: int, source: str, values: Dict[str, Any]) -> None:
+        """Append a read result or write.
+        
+        Args:
+            kind: READ or WRITE
+            source: Client the values came from or went to (plc or ssh)
+            values: Dict mapping client tag names to values
+        """
+        if self._file is None or not values:
+            return
+        now = clock.monotonic()
+        source_id = SOURCES.index(source)
+        chunks: List[bytes] = []
+        body: List[bytes] = []
+        for tag, value in values.items():
+            tag_id = self._tag_ids.get(tag)
+            if tag_id is None:
+                tag_id = self._tag_ids[tag] = len(self._tag_ids)
+                name = tag.encode()
+                chunks.append(_RECORD.pack(now, DEFINE, source_id, 0) + _DEFINE.pack(tag_id, len(name)) + name)
+            body.append(_TAG_ID.pack(tag_id) + _encode_value(value))
+        chunks.append(_RECORD.pack(now, kind, source_id, len(body)))
+        chunks.extend(body)
+        # Flush every record so a crash on the line keeps everything before it
+        self._file.write(b"".join(chunks))
+        self._file.flush()
+        self._records += 1
+
+    def close(self) -> None:
+        """Close the recording."""
+        if self._file is not None:
+            file, self._file = self._file, None
+            file.close()
+            logger.info(f"Recorded {self._records} records to {self._path}")
+
+
+def read_recording(path: Union[str, Path]) -> Iterator[RecordedEvent]:
+    """Read the read and write records of a session recording.
+    
+    Args:
+        path: Recording file path
+    
+    Yields:
+        Recorded events in recording order
+    
+    Raises:
+        ValueError: If the file is not a session recording
+    """
+    data = Path(path).read_bytes()
+    if not data.startswith(MAGIC):
+        raise ValueError(f"Not a session recording: {path}")
+    
+    names: Dict[int, str] = {}
+    offset = len(MAGIC)
+    while offset + _RECORD.size <= len(data):
+        timestamp, kind, source_id, count = _RECORD.unpack_from(data, offset)
+        offset += _RECORD.size
+        if kind == DEFINE:
+            tag_id, length = _DEFINE.unpack_from(data, offset)
+            offset += _DEFINE.size
+            names[tag_id] = data[offset:offset + length].decode()
+            offset += length
+            continue
+        
+        values = {}
+        for _ in range(count):
+            tag_id = _TAG_ID.unpack_from(data, offset)[0]
+            value, offset = _decode_value(data, offset + _TAG_ID.size)
+            values[names[tag_id]] = value
+        yield RecordedEvent(timestamp, kind, SOURCES[source_id], values)
+
+
+class RecordingClient:
+    """Client wrapper recording every read result and write.
+
+    Wraps a PLC client (read_tag/read_many/write_tag/write_many) or the SSH
+    client (read_tags/write_tags), everything else is passed through.
+    """
+
+    def __init__(self, client: Any, recorder: SessionRecorder, source: str):
+        """Initialize wrapper.
+        
+        Args:
+            client: Client to wrap
+            recorder: Recorder shared by all wrapped clients
+            source: Source name stored with each record (plc or ssh)
+        """
+        self._client = client
+        self._recorder = recorder
+        self._source = source
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+    async def connect(self) -> None:
+        """Connect the wrapped client."""
+        await self._client.connect()
+
+    async def disconnect(self) -> None:
+        """Disconnect the wrapped client."""
+        await self._client.disconnect()
+
+    def is_connected(self) -> bool:
+        """Check if the wrapped client is connected."""
+        return self._client.is_connected()
+
+    def _record(self, kind: int, values: Dict[str, Any]) -> None:
+        """Record values, stopping the recording if that fails.
+        
+        The read or write already went through, a broken recording must not
+        turn it into a client failure.
+        """
+        try:
+            self._recorder.record(kind, self._source, values)
+        except Exception as e:
+            logger.error(f"Stopping recording to {self._recorder.path}, failed to write record: {str(e)}")
+            try:
+                self._recorder.close()
+            except Exception:
+                pass
+
+    async def read_tag(self, tag: str) -> Any:
+        """Read and record one tag value."""
+        value = await self._client.read_tag(tag)
+        self._record(READ, {tag: value})
+        return value
+
+    async def read_many(self, tags: List[str]) -> Dict[str, Any]:
+        """Read and record several tag values."""
+        values = await self._client.read_many(tags)
+        self._record(READ, values)
+        return values
+
+    async def read_tags(self, tags: List[str]) -> Dict[str, Any]:
+        """Read and record several SSH registers."""
+        values = await self._client.read_tags(tags)
+        self._record(READ, values)
+        return values
+
+    async def write_tag(self, tag: str, value: Any) -> None:
+        """Write and record one tag value."""
+        await self._client.write_tag(tag, value)
+        self._record(WRITE, {tag: value})
+
+    async def write_many(self, values: Dict[str, Any]) -> None:
+        """Write and record several tag values."""
+        await self._client.write_many(values)
+        self._record(WRITE, values)
+
+    async def write_tags(self, values: Dict[str, Any]) -> None:
+        """Write and record several SSH registers."""
+        await self._client.write_tags(values)
+        self._record(WRITE, values)
+
+
+class ReplayPLCClient:
+    """Client feeding a session recording back, implements TagClient.
+
+    Reads return the recorded values as of the replay time, which runs
+    ``speed`` times faster than the event loop clock from ``connect``. On a
+    virtual clock loop the replay runs as fast as the CPU allows. Writes are
+    applied to the replayed values until the recording overwrites them.
+    """
+
+    def __init__(self, path: Union[str, Path], source: str = "plc", speed: float = 1.0):
+        """Load a recording.
+        
+        Args:
+            path: Recording file path
+            source: Which client's reads to replay (plc or ssh)
+            speed: Playback speed, 1.0 is real time
+        """
+        if speed <= 0:
+            raise ValueError(f"Replay speed must be positive, got {speed}")
+        self._path = Path(path)
+        self._source = source
+        self._speed = speed
+        self._events = [
+            (event.time, event.values)
+            for event in read_recording(self._path)
+            if event.kind == READ and event.source == source
+        ]
+        self._first = self._events[0][0] if self._events else 0.0
+        self._values: Dict[str, Any] = {}
+        self._cursor = 0
+        self._start = 0.0
+        self._connected = False
+        logger.info(f"Loaded {len(self._events)} {source} reads ({self.duration:.1f}s) from {self._path}")
+
+    @property
+    def duration(self) -> float:
+        """Get recorded duration in seconds."""
+        return self._events[-1][0] - self._first if self._events else 0.0
+
+    @property
+    def has_events(self) -> bool:
+        """Check if the recording has reads for this source."""
+        return bool(self._events)
+
+    @property
+    def finished(self) -> bool:
+        """Check if every recorded read has been replayed."""
+        return self._cursor >= len(self._events)
+
+    async def connect(self) -> None:
+        """Start replay from the beginning of the recording."""
+        self._values = {}
+        self._cursor = 0
+        self._start = clock.monotonic()
+        self._connected = True
+        logger.info(f"Replaying {self._path} at {self._speed:g}x")
+
+    async def disconnect(self) -> None:
+        """Stop replay."""
+        self._connected = False
+
+    def is_connected(self) -> bool:
+        """Check if replay is running."""
+        return self._connected
+
+    def _advance(self) -> None:
+        """Apply every recorded read up to the current replay time."""
+        if not self._connected:
+            raise ConnectionError("Replay client not connected")
+        replay_time = self._first + (clock.monotonic() - self._start) * self._speed
+        events = self._events
+        while self._cursor < len(events) and events[self._cursor][0] <= replay_time:
+            self._values.update(events[self._cursor][1])
+            self._cursor += 1
+
+    async def read_tag(self, tag: str) -> Any:
+        """Read a replayed tag value.
+        
+        Raises:
+            ValueError: If the tag has not been recorded yet
+        """
+        self._advance()
+        if tag not in self._values:
+            raise ValueError(f"Tag '{tag}' not in recording yet")
+        return self._values[tag]
+
+    async def read_many(self, tags: List[str]) -> Dict[str, Any]:
+        """Read replayed tag values, omitting tags not recorded yet."""
+        self._advance()
+        return {tag: self._values[tag] for tag in tags if tag in self._values}
+
+    async def write_tag(self, tag: str, value: Any) -> None:
+        """Apply a write to the replayed values."""
+        await self.write_many({tag: value})
+
+    async def write_many(self, values: Dict[str, Any]) -> None:
+        """Apply writes to the replayed values."""
+        self._advance()
+        self._values.update(values)
+        logger.debug(f"Replay write {values}")
+
+    # SSH client interface, for replaying feeder traffic
+    read_tags = read_many
+    write_tags = write_many
@@ -0,0 +1,61 @@
+"""Client registry with lazy imports.
+
+Clients are registered by import path and only imported when first used, so
+the service does not load driver libraries (productivity, asyncssh) for
+clients it never creates.
+"""
+
+from importlib import import_module
+from typing import Any, Dict
+
+
+# Client name -> "module:attribute"
+CLIENTS: Dict[str, str] = {
+    "mock": "micro_cold_spray.api.communication.clients.mock:MockPLCClient",
+    "plc": "micro_cold_spray.api.communication.clients.plc:PLCClient",
+    "ssh": "micro_cold_spray.api.communication.clients.ssh:SSHClient",
+    "replay": "micro_cold_spray.api.communication.clients.recording:ReplayPLCClient",
+}
+
+
+def register_client(name: str, path: str) -> None:
+    """Register a client class.
+    
+    Args:
+        name: Client name used to create it
+        path: Import path as "module:attribute"
+    """
+    CLIENTS[name] = path
+
+
+def get_client_class(name: str) -> type:
+    """Import a registered client class.
+    
+    Args:
+        name: Client name
+    
+    Returns:
+        Client class
+    
+    Raises:
+        ValueError: If no client is registered under the name
+    """
+    try:
+        module_path, attribute = CLIENTS[name].split(":")
+    except KeyError:
+        raise ValueError(f"Unknown client '{name}', expected one of: {', '.join(CLIENTS)}")
+    return getattr(import_module(module_path), attribute)
+
+
+def create_client(name: str, *args: Any, **kwargs: Any) -> Any:
+    """Import and create a registered client.
+    
+    Args:
+        name: Client name
+        *args: Client constructor arguments
+        **kwargs: Client constructor keyword arguments
+    
+    Returns:
+        Client instance
+    """
+    return get_client_class(name)(*args, **kwargs)
@@ -0,0 +1,359 @@
+"""Deterministic process simulation behind the mock PLC client."""
+
+import math
+import random
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class TrapezoidProfile:
+    """Point-to-point move with a trapezoidal velocity profile.
+
+    Short moves that never reach full speed get a triangular profile.
+    """
+
+    def __init__(self, distance: float, velocity: float, accel: float, decel: float):
+        """Initialize profile.
+        
+        Args:
+            distance: Move length (positive)
+            velocity: Maximum velocity
+            accel: Acceleration
+            decel: Deceleration
+        """
+        self.distance = abs(distance)
+        accel = max(accel, 1e-9)
+        decel = max(decel, 1e-9)
+        velocity = max(velocity, 1e-9)
+        
+        # Drop the peak velocity if the ramps alone would overshoot
+        if self.distance < velocity ** 2 / (2 * accel) + velocity ** 2 / (2 * decel):
+            velocity = math.sqrt(2 * self.distance * accel * decel / (accel + decel))
+        
+        self._velocity = velocity
+        self._accel = accel
+        self._decel = decel
+        self._t_accel = velocity / accel if velocity > 0 else 0.0
+        self._t_decel = velocity / decel if velocity > 0 else 0.0
+        cruise = self.distance - velocity ** 2 / (2 * accel) - velocity ** 2 / (2 * decel)
+        self._t_cruise = max(cruise, 0.0) / velocity if velocity > 0 else 0.0
+        self.duration = self._t_accel + self._t_cruise + self._t_decel
+
+    def travelled(self, t: float) -> float:
+        """Get distance covered after t seconds.
+        
+        Args:
+            t: Time since the move started in seconds
+        
+        Returns:
+            Distance from the start position
+        """
+        if t <= 0:
+            return 0.0
+        if t >= self.duration:
+            return self.distance
+        if t < self._t_accel:
+            return 0.5 * self._accel * t * t
+        if t < self._t_accel + self._t_cruise:
+            return 0.5 * self._accel * self._t_accel ** 2 + self._velocity * (t - self._t_accel)
+        remaining = self.duration - t
+        return self.distance - 0.5 * self._decel * remaining * remaining
+
+
+class _Move:
+    """Move in progress on one or more axes."""
+
+    def __init__(
+        self,
+        axes: Tuple[str, ...],
+        start: Tuple[float, ...],
+        end: Tuple[float, ...],
+        profile: TrapezoidProfile,
+        tags: Tuple[str, str, str]
+    ):
+        self.axes = axes
+        self.start = start
+        self.end = end
+        self.profile = profile
+        self.trigger_tag, self.in_progress_tag, self.complete_tag = tags
+        self.elapsed = 0.0
+
+    def positions(self) -> Tuple[float, ...]:
+        """Get axis positions at the current elapsed time."""
+        if self.profile.distance == 0:
+            return self.end
+        fraction = self.profile.travelled(self.elapsed) / self.profile.distance
+        return tuple(s + (e - s) * fraction for s, e in zip(self.start, self.end))
+
+
+class PlantSimulator:
+    """Deterministic, seedable model of the spray system's PLC I/O.
+
+    Works on PLC tag names, with analog values in engineering units. Writes
+    take effect immediately, readings only move when the simulation is
+    advanced, and time is always advanced in fixed steps, so the same seed,
+    writes and advance calls always produce the same readings.
+    """
+
+    # Gas lines: (setpoint tag, measured tag, valve tag, maximum SLPM, time constant in s)
+    GAS_LINES: Tuple[Tuple[str, str, str, float, float], ...] = (
+        ("AOS32-0.1.2.1", "MainFlowRate", "MainSwitch", 100.0, 0.8),
+        ("AOS32-0.1.2.2", "FeederFlowRate", "FeederSwitch", 10.0, 0.5),
+    )
+
+    # Chamber, pumping rates are pumping speed over chamber volume (1/s)
+    ATMOSPHERE = 760.0  # torr
+    BASE_PRESSURE = 0.02  # torr
+    MECH_PUMP_RATE = 0.2
+    BOOSTER_PUMP_RATE = 1.0
+    BOOSTER_MAX_PRESSURE = 10.0  # torr, booster only pumps below this
+    GATE_PARTIAL_FACTOR = 0.3
+    VENT_RATE = 0.5
+    LEAK_RATE = 0.001  # torr/s
+    GAS_LOAD = 0.1  # torr/s per SLPM of gas into the chamber
+    NOZZLE_PRESSURE_PER_SLPM = 10.0  # torr above chamber
+    PRESSURE_TIME_CONSTANT = 0.3  # s
+
+    # Feeders: (frequency tag, running tag), frequency limits in Hz
+    FEEDERS: Tuple[Tuple[str, str], ...] = (("P6", "P10"), ("P106", "P110"))
+    FEEDER_MIN_FREQUENCY = 200
+    FEEDER_MAX_FREQUENCY = 1200
+    POWDER_PRESSURE_PER_HZ = 0.005  # torr of feeder back pressure per Hz
+
+    # Motion axes: axis -> (position, velocity, accel, decel, distance, trigger, in progress, complete)
+    AXES: Dict[str, Tuple[str, ...]] = {
+        axis: (
+            f"AMC.Ax{index}Position",
+            f"{axis.upper()}Axis.Velocity",
+            f"{axis.upper()}Axis.Accel",
+            f"{axis.upper()}Axis.Decel",
+            f"{axis.upper()}Axis.Distance",
+            f"Move{axis.upper()}",
+            f"{axis.upper()}Axis.InProgress",
+            f"{axis.upper()}Axis.Complete",
+        )
+        for index, axis in enumerate(("x", "y", "z"), start=1)
+    }
+
+    # Measurement noise, standard deviation as a fraction of the reading
+    NOISE: Dict[str, float] = {
+        "MainFlowRate": 0.002,
+        "FeederFlowRate": 0.002,
+        "ChamberPressure": 0.005,
+        "NozzlePressure": 0.002,
+        "FeederPressure": 0.002,
+        "MainGasPressure": 0.001,
+        "RegulatorPressure": 0.001,
+    }
+
+    def __init__(
+        self,
+        tags: Dict[str, Any],
+        seed: Optional[int] = None,
+        step: float = 0.01,
+        noise: bool = True
+    ):
+        """Initialize simulator.
+        
+        Args:
+            tags: Initial PLC tag values
+            seed: Noise seed
+            step: Simulation time step in seconds
+            noise: Add measurement noise to analog readings
+        """
+        self._tags: Dict[str, Any] = dict(tags)
+        self._random = random.Random(seed)
+        self._step = step
+        self._noise = noise
+        self._pending = 0.0
+        self._time = 0.0
+        self._moves: Dict[str, _Move] = {}
+        
+        # Noise-free process state behind the published readings
+        self._state: Dict[str, float] = {tag: float(self._tags.get(tag, 0.0)) for tag in self.NOISE}
+        self._state["ChamberPressure"] = float(self._tags.get("ChamberPressure", self.ATMOSPHERE))
+
+    @property
+    def time(self) -> float:
+        """Get simulated time in seconds."""
+        return self._time
+
+    @property
+    def tags(self) -> Dict[str, Any]:
+        """Get current tag values."""
+        return self._tags
+
+    def read(self, tag: str) -> Any:
+        """Read a tag value, 0 if the tag is unknown.
+        
+        Args:
+            tag: PLC tag name
+        
+        Returns:
+            Tag value
+        """
+        return self._tags.get(tag, 0)
+
+    def write(self, tag: str, value: Any) -> None:
+        """Write a tag value and apply its immediate effects.
+        
+        Args:
+            tag: PLC tag name
+            value: Value to write
+        """
+        for frequency_tag, _ in self.FEEDERS:
+            if tag == frequency_tag and value:
+                value = min(max(value, self.FEEDER_MIN_FREQUENCY), self.FEEDER_MAX_FREQUENCY)
+        self._tags[tag] = value
+        if not value:
+            return
+        
+        if tag == "MoveXY":
+            self._start_xy_move()
+        elif tag == "SetHome":
+            for key in list(self._moves):
+                self._cancel_move(key)
+            for axis_tags in self.AXES.values():
+                self._tags[axis_tags[0]] = 0.0
+            self._tags[tag] = False
+        else:
+            for axis, axis_tags in self.AXES.items():
+                if tag == axis_tags[5]:
+                    self._start_axis_move(axis)
+
+    def advance(self, seconds: float) -> None:
+        """Advance the simulation in fixed steps.
+        
+        Time that does not fill a whole step is carried over to the next call.
+        
+        Args:
+            seconds: Time to advance in seconds
+        """
+        self._pending += seconds
+        while self._pending >= self._step:
+            self._pending -= self._step
+            self._advance_step(self._step)
+
+    def _advance_step(self, dt: float) -> None:
+        """Advance all models by one time step."""
+        self._time += dt
+        state = self._state
+        
+        # Gas flow follows its setpoint with a first-order lag while the valve is open
+        total_flow = 0.0
+        for setpoint_tag, measured_tag, valve_tag, max_flow, time_constant in self.GAS_LINES:
+            target = 0.0
+            if self._tags.get(valve_tag):
+                target = min(max(float(self._tags.get(setpoint_tag, 0)), 0.0), max_flow)
+            state[measured_tag] += (target - state[measured_tag]) * (1 - math.exp(-dt / time_constant))
+            total_flow += state[measured_tag]
+        
+        # Chamber pressure: gas load and leaks against the pumps, vent towards atmosphere
+        pressure = state["ChamberPressure"]
+        pump_rate = 0.0
+        if self._tags.get("MechPumpStart") and not self._tags.get("MechPumpStop"):
+            pump_rate += self.MECH_PUMP_RATE
+            if (
+                self._tags.get("BoosterPumpStart") and not self._tags.get("BoosterPumpStop")
+                and pressure < self.BOOSTER_MAX_PRESSURE
+            ):
+                pump_rate += self.BOOSTER_PUMP_RATE
+        if self._tags.get("Open"):
+            gate = 1.0
+        elif self._tags.get("Partial"):
+            gate = self.GATE_PARTIAL_FACTOR
+        else:
+            gate = 0.0
+        rate = self.LEAK_RATE + self.GAS_LOAD * total_flow - pump_rate * gate * (pressure - self.BASE_PRESSURE)
+        if self._tags.get("VentSwitch"):
+            rate += self.VENT_RATE * (self.ATMOSPHERE - pressure)
+        state["ChamberPressure"] = min(max(pressure + rate * dt, self.BASE_PRESSURE), self.ATMOSPHERE)
+        
+        # Nozzle and feeder pressures sit above the chamber, driven by gas flow and powder load
+        main_flow = state["MainFlowRate"]
+        powder = sum(
+            float(self._tags.get(frequency_tag, 0)) * self.POWDER_PRESSURE_PER_HZ
+            for frequency_tag, running_tag in self.FEEDERS if self._tags.get(running_tag)
+        )
+        nozzle_target = state["ChamberPressure"] + self.NOZZLE_PRESSURE_PER_SLPM * main_flow
+        lag = 1 - math.exp(-dt / self.PRESSURE_TIME_CONSTANT)
+        state["NozzlePressure"] += (nozzle_target - state["NozzlePressure"]) * lag
+        state["FeederPressure"] += (nozzle_target - 1.0 + powder - state["FeederPressure"]) * lag
+        
+        # Publish readings
+        for tag, value in state.items():
+            if self._noise and tag in self.NOISE:
+                value *= 1 + self._random.gauss(0.0, self.NOISE[tag])
+            self._tags[tag] = value
+        
+        self._advance_moves(dt)
+
+    def _advance_moves(self, dt: float) -> None:
+        """Advance moves in progress, completing the ones that reached their target."""
+        finished: List[str] = []
+        for key, move in self._moves.items():
+            move.elapsed += dt
+            for axis, position in zip(move.axes, move.positions()):
+                self._tags[self.AXES[axis][0]] = position
+            if move.elapsed >= move.profile.duration:
+                finished.append(key)
+        
+        for key in finished:
+            move = self._moves.pop(key)
+            self._tags[move.trigger_tag] = False
+            self._tags[move.in_progress_tag] = False
+            self._tags[move.complete_tag] = True
+
+    def _cancel_move(self, key: str) -> None:
+        """Stop a move where it is, without flagging it complete."""
+        move = self._moves.pop(key, None)
+        if move:
+            self._tags[move.trigger_tag] = False
+            self._tags[move.in_progress_tag] = False
+
+    def _start_move(
+        self,
+        key: str,
+        axes: Tuple[str, ...],
+        end: Tuple[float, ...],
+        profile_args: Tuple[float, float, float],
+        tags: Tuple[str, str, str]
+    ) -> None:
+        """Start a move from the current axis positions."""
+        self._cancel_move(key)
+        start = tuple(float(self._tags.get(self.AXES[axis][0], 0.0)) for axis in axes)
+        distance = math.dist(start, end)
+        velocity, accel, decel = profile_args
+        self._moves[key] = _Move(axes, start, end, TrapezoidProfile(distance, velocity, accel, decel), tags)
+        self._tags[tags[1]] = True
+        self._tags[tags[2]] = False
+
+    def _start_xy_move(self) -> None:
+        """Start a coordinated XY move to the XYMove target."""
+        # A coordinated move takes over both axes
+        for axis in ("x", "y"):
+            self._cancel_move(axis)
+        x_tags, y_tags = self.AXES["x"], self.AXES["y"]
+        self._start_move(
+            "xy",
+            ("x", "y"),
+            (float(self._tags.get("XYMove.XPosition", 0.0)), float(self._tags.get("XYMove.YPosition", 0.0))),
+            (
+                float(self._tags.get("XYMove.LINVelocity", 0.0)),
+                min(float(self._tags.get(x_tags[2], 0.0)), float(self._tags.get(y_tags[2], 0.0))),
+                min(float(self._tags.get(x_tags[3], 0.0)), float(self._tags.get(y_tags[3], 0.0))),
+            ),
+            ("MoveXY", "XYMove.InProgress", "XYMove.Complete")
+        )
+
+    def _start_axis_move(self, axis: str) -> None:
+        """Start a relative move of one axis by its Distance tag."""
+        if axis in ("x", "y"):
+            self._cancel_move("xy")
+        position, velocity, accel, decel, distance, trigger, in_progress, complete = self.AXES[axis]
+        self._start_move(
+            axis,
+            (axis,),
+            (float(self._tags.get(position, 0.0)) + float(self._tags.get(distance, 0.0)),),
+            (float(self._tags.get(velocity, 0.0)), float(self._tags.get(accel, 0.0)), float(self._tags.get(decel, 0.0))),
+            (trigger, in_progress, complete)
+        )
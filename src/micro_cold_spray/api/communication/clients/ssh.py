@@ -1,10 +1,68 @@
 """SSH communication client."""
 
 import asyncio
-import time
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Optional, List, Tuple
 from loguru import logger
-import paramiko
+import asyncssh
+
+
+class _TerminalSession(asyncssh.SSHClientSession):
+    """Collects terminal output as it arrives."""
+
+    def __init__(self):
+        """Initialize session."""
+        self._buffer = ""
+        self._received = asyncio.Event()
+        self.closed = False
+
+    def data_received(self, data: str, datatype: Optional[int]) -> None:
+        """Buffer received output."""
+        self._buffer += data
+        self._received.set()
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        """Mark session closed."""
+        self.closed = True
+        self._received.set()
+
+    def drain(self) -> str:
+        """Take all output received so far.
+        
+        Returns:
+            Buffered output
+        """
+        data, self._buffer = self._buffer, ""
+        return data
+
+    async def read_until(self, markers: Tuple[str, ...], timeout: float) -> str:
+        """Take output up to and including the first marker.
+        
+        Output after the marker stays buffered for the next read.
+        
+        Args:
+            markers: Strings that end a response
+            timeout: Maximum seconds to wait
+            
+        Returns:
+            Output up to and including the marker
+            
+        Raises:
+            ConnectionError: If the session closes first
+            asyncio.TimeoutError: If no marker arrives in time
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            ends = [self._buffer.find(marker) + len(marker) for marker in markers if marker in self._buffer]
+            if ends:
+                end = min(ends)
+                data, self._buffer = self._buffer[:end], self._buffer[end:]
+                return data
+            if self.closed:
+                raise ConnectionError("SSH session closed")
+            
+            self._received.clear()
+            await asyncio.wait_for(self._received.wait(), max(deadline - loop.time(), 0))
 
 
 class SSHClient:
@@ -16,6 +74,9 @@ class SSHClient:
     # Maximum number of commands in queue
     MAX_QUEUE_SIZE = 100
     
+    # gpascii -2 ends every command response with an ACK
+    RESPONSE_TERMINATOR = "\x06"
+    
     def __init__(self, config: Dict[str, Any]):
         """Initialize SSH client.
         
@@ -33,14 +94,16 @@ class SSHClient:
         self._password = ssh_config["password"]
         self._timeout = ssh_config.get("timeout", 30.0)  # 30s default timeout
         self._command_timeout = ssh_config.get("command_timeout", 5.0)  # 5s default command timeout
+        self._terminator = ssh_config.get("terminator", self.RESPONSE_TERMINATOR)
         self._retry = ssh_config.get("retry", {
             "max_attempts": 3,
             "delay": 5.0
         })
         
         # Initialize client
-        self._client: Optional[paramiko.SSHClient] = None
-        self._terminal = None
+        self._conn: Optional[asyncssh.SSHClientConnection] = None
+        self._channel: Optional[asyncssh.SSHClientChannel] = None
+        self._terminal: Optional[_TerminalSession] = None
         
         # Command queue and lock
         self._command_queue: asyncio.Queue = asyncio.Queue(maxsize=self.MAX_QUEUE_SIZE)
@@ -49,32 +112,38 @@ class SSHClient:
         logger.info(f"Initialized SSH client for {self._host}")
 
     async def connect(self) -> None:
-        """Connect to device over SSH."""
+        """Connect to device over SSH.
+        
+        All waits are non-blocking, so the event loop keeps serving
+        polling and API requests while the feeder connects or retries.
+        """
         attempt = 0
         while True:
             try:
-                # Create SSH client
-                self._client = paramiko.SSHClient()
-                self._client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-                
                 # Connect and get shell
-                self._client.connect(
-                    self._host,
-                    port=self._port,
-                    username=self._username,
-                    password=self._password,
+                self._conn = await asyncio.wait_for(
+                    asyncssh.connect(
+                        self._host,
+                        port=self._port,
+                        username=self._username,
+                        password=self._password,
+                        known_hosts=None
+                    ),
                     timeout=self._timeout
                 )
                 
                 # Set up terminal
-                self._client.get_transport().window_size = 2 * 1024 * 1024
-                self._terminal = self._client.invoke_shell(term="vt100")
+                self._channel, self._terminal = await self._conn.create_session(
+                    _TerminalSession,
+                    term_type="vt100",
+                    window=2 * 1024 * 1024
+                )
                 
                 # Initialize gpascii
-                time.sleep(0.2)
+                await asyncio.sleep(0.2)
                 response = await self._read_response()
                 await self._send_raw("gpascii -2\r\n")
-                time.sleep(1.0)
+                await asyncio.sleep(1.0)
                 
                 response = await self._read_response()
                 logger.debug(f"gpascii response: {response}")
@@ -82,16 +151,16 @@ class SSHClient:
                 # Handle error case where we need to retry
                 if "Err" in response:
                     logger.warning("gpascii error, retrying after delay")
-                    time.sleep(18)
+                    await asyncio.sleep(18)
                     await self._send_raw("gpascii -2\r\n")
-                    time.sleep(1)
+                    await asyncio.sleep(1)
                     response = await self._read_response()
                     logger.debug(f"gpascii retry response: {response}")
                 
                 # Test echo
                 if not ("Err" in response):
                     await self._send_raw("echo1\n\r")
-                    response = await self._read_response(size=256)
+                    response = await self._terminal.read_until((self._terminator,), self._command_timeout)
                     logger.debug(f"echo response: {response}")
                 
                 self._connected = True
@@ -99,46 +168,49 @@ class SSHClient:
                 break
             
             except Exception as e:
+                await self._close()
                 attempt += 1
                 if attempt >= self._retry["max_attempts"]:
                     logger.error(f"Failed to connect to SSH at {self._host} after {attempt} attempts: {str(e)}")
                     raise
                     
                 logger.warning(f"Connection attempt {attempt} failed, retrying in {self._retry['delay']}s")
-                time.sleep(self._retry["delay"])
+                await asyncio.sleep(self._retry["delay"])
 
     async def disconnect(self) -> None:
         """Disconnect from SSH."""
-        if self._client:
-            self._client.close()
-            self._client = None
-            self._terminal = None
+        await self._close()
         self._connected = False
         logger.info(f"Disconnected from SSH at {self._host}")
 
+    async def _close(self) -> None:
+        """Close connection and terminal, if open."""
+        if self._conn:
+            self._conn.close()
+            try:
+                await self._conn.wait_closed()
+            except Exception:
+                pass  # Already broken, nothing left to close
+        self._conn = None
+        self._channel = None
+        self._terminal = None
+
     async def _read_response(self, size: int = BUFFER_SIZE) -> str:
         """Read response from terminal with proper buffer handling.
         
         Args:
-            size: Buffer size to read
+            size: Buffer size to read (kept for API compatibility, output
+                is buffered as it arrives)
             
         Returns:
             Response string
         """
-        if not self._terminal:
+        if not self._terminal or self._terminal.closed:
+            self._connected = False
             raise ConnectionError("SSH not connected")
             
-        # Read in chunks until we get a complete response
-        chunks = []
-        while self._terminal.recv_ready():
-            chunk = self._terminal.recv(size)
-            if not chunk:
-                break
-            chunks.append(chunk)
-            
-        # Combine and decode
-        response = b"".join(chunks).decode("utf8")
-        return response
+        # Take everything received since the last read
+        return self._terminal.drain()
 
     async def _send_raw(self, data: str) -> None:
         """Send raw data to terminal.
@@ -146,10 +218,11 @@ class SSHClient:
         Args:
             data: Data to send
         """
-        if not self._terminal:
+        if not self._channel or self._terminal.closed:
+            self._connected = False
             raise ConnectionError("SSH not connected")
             
-        self._terminal.send(data)
+        self._channel.write(data)
 
     async def _send_command(self, command: str) -> List[str]:
         """Send command and get response with queueing.
@@ -172,14 +245,17 @@ class SSHClient:
                 # Get command from queue
                 command = await self._command_queue.get()
                 
-                # Send command
+                # Drop late output of earlier commands, then send command
+                await self._read_response()
                 await self._send_raw(command)
-                await asyncio.sleep(self._command_timeout)
                 
-                # Get and parse response
-                response = await self._read_response()
-                response = response.split("\r\n")
-                response = [msg for msg in response if msg != ""]
+                # Read until the terminator, the reply is complete once it arrives
+                try:
+                    response = await self._terminal.read_until((self._terminator,), self._command_timeout)
+                except asyncio.TimeoutError:
+                    raise TimeoutError(f"No response within {self._command_timeout}s")
+                response = response.replace(self._terminator, "").split("\r\n")
+                response = [msg.strip() for msg in response if msg.strip()]
                 
                 logger.debug(f"Command '{command}' response: {response}")
                 return response
@@ -210,8 +286,9 @@ class SSHClient:
             raise ValueError(f"No response reading tag '{tag}' from {self._host}")
             
         try:
-            # Response format is "P12=1"
-            value = response[0].split("=")[1].strip()
+            # Response format is "P12=1", skip any other output
+            line = next(msg for msg in response if msg.startswith(f"{tag}="))
+            value = line.split("=")[1].strip()
             return int(value)  # Convert to int
             
         except Exception as e:
@@ -232,8 +309,8 @@ class SSHClient:
         try:
             response = await self._send_command(f"{tag}={value}\n")
             
-            # Check response
-            if not response or "Error" in str(response):
+            # Check response, a bare terminator acknowledges the write
+            if "Error" in str(response):
                 raise RuntimeError(f"Error writing tag '{tag}' = {value} to {self._host}: {response}")
                 
             logger.debug(f"Wrote tag {tag} = {value}")
@@ -242,10 +319,71 @@ class SSHClient:
             logger.error(f"Failed to write tag '{tag}' = {value} to {self._host}: {str(e)}")
             raise
 
+    async def read_tags(self, tags: List[str]) -> Dict[str, Any]:
+        """Read several tag values in one command.
+        
+        gpascii answers a space separated query (e.g. "P12 P13") with one
+        "P12=1" assignment per register before the terminator.
+        
+        Args:
+            tags: Tag names to read
+            
+        Returns:
+            Dictionary mapping tag names to values
+        """
+        if not self._connected:
+            raise ConnectionError("SSH not connected")
+        if not tags:
+            return {}
+            
+        response = await self._send_command(f"{' '.join(tags)}\n")
+        
+        # Parse every assignment, however the device splits them over lines
+        values = {}
+        for assignment in " ".join(response).split():
+            name, sep, value = assignment.partition("=")
+            if sep and name in tags:
+                try:
+                    values[name] = int(value)  # Convert to int
+                except ValueError:
+                    logger.error(f"Failed to parse value of tag '{name}' from {self._host}: {assignment}")
+                    raise
+        
+        missing = [tag for tag in tags if tag not in values]
+        if missing:
+            raise ValueError(f"No response reading tags {missing} from {self._host}: {response}")
+        return values
+
+    async def write_tags(self, values: Dict[str, Any]) -> None:
+        """Write several tag values in one command.
+        
+        Args:
+            values: Dictionary mapping tag names to values
+        """
+        if not self._connected:
+            raise ConnectionError("SSH not connected")
+        if not values:
+            return
+            
+        # Send write command (e.g. P12=1 P13=0)
+        command = " ".join(f"{tag}={value}" for tag, value in values.items())
+        try:
+            response = await self._send_command(f"{command}\n")
+            
+            # Check response, a bare terminator acknowledges the write
+            if "Error" in str(response):
+                raise RuntimeError(f"Error writing '{command}' to {self._host}: {response}")
+                
+            logger.debug(f"Wrote tags {command}")
+            
+        except Exception as e:
+            logger.error(f"Failed to write '{command}' to {self._host}: {str(e)}")
+            raise
+
     def is_connected(self) -> bool:
         """Check if client is connected.
         
         Returns:
             Connection status
         """
-        return self._connected
+        return self._connected and self._terminal is not None and not self._terminal.closed
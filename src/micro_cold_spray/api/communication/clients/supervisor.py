@@ -0,0 +1,185 @@
+"""Connection supervision with automatic reconnect."""
+
+import asyncio
+import random
+from typing import Any, Dict, Optional
+from loguru import logger
+
+from micro_cold_spray.utils import clock
+
+
+class ConnectionSupervisor:
+    """Keeps a client connected, reconnecting with jittered exponential backoff.
+
+    Callers report the outcome of each request with ``record_success`` and
+    ``record_failure``. After ``failure_threshold`` consecutive failures, or as
+    soon as the client reports itself disconnected, the link is marked down
+    and a background task reconnects until it succeeds or the supervisor stops.
+    """
+
+    def __init__(self, name: str, client: Any, config: Optional[Dict[str, Any]] = None):
+        """Initialize supervisor.
+        
+        Args:
+            name: Link name used in logs and health (e.g. plc, ssh)
+            client: Client with async connect/disconnect and is_connected
+            config: Reconnect configuration from communication.yaml
+        """
+        config = config or {}
+        self.name = name
+        self._client = client
+        self._failure_threshold = config.get("failure_threshold", 3)
+        self._initial_delay = config.get("initial_delay", 0.5)
+        self._max_delay = config.get("max_delay", 30.0)
+        
+        self._running = False
+        self._connected = False
+        self._consecutive_failures = 0
+        self._attempts = 0
+        self._reconnects = 0
+        self._last_error: Optional[str] = None
+        self._down_since: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def connected(self) -> bool:
+        """Check if link is up."""
+        return self._connected
+
+    async def start(self, wait: bool = True) -> None:
+        """Connect the client.
+        
+        Args:
+            wait: Wait for the first connect attempt. A failed attempt is
+                retried in the background either way.
+        """
+        self._running = True
+        if not wait:
+            self._mark_down("Not connected yet", reconnect_now=True)
+            return
+        
+        try:
+            await self._client.connect()
+            self._mark_up()
+        except Exception as e:
+            self._mark_down(str(e))
+
+    async def stop(self) -> None:
+        """Stop reconnecting and disconnect the client."""
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        
+        try:
+            await self._client.disconnect()
+        except Exception as e:
+            logger.warning(f"Error disconnecting {self.name} link: {str(e)}")
+        self._connected = False
+
+    def record_success(self) -> None:
+        """Record a successful request."""
+        self._consecutive_failures = 0
+
+    def record_failure(self, error: Exception) -> None:
+        """Record a failed request, marking the link down if it looks broken.
+        
+        Args:
+            error: Error raised by the request
+        """
+        self._consecutive_failures += 1
+        self._last_error = str(error)
+        if not self._connected:
+            return
+        if self._consecutive_failures >= self._failure_threshold or not self._client.is_connected():
+            self._mark_down(str(error))
+
+    def backoff(self, attempt: int) -> float:
+        """Get delay before a reconnect attempt.
+        
+        Args:
+            attempt: Number of attempts already made
+        
+        Returns:
+            Delay in seconds, between half and all of the exponential step
+        """
+        delay = min(self._initial_delay * 2 ** attempt, self._max_delay)
+        return random.uniform(delay / 2, delay)
+
+    def _mark_up(self) -> None:
+        """Mark link up."""
+        if self._down_since is not None:
+            logger.info(f"{self.name} link restored after {clock.monotonic() - self._down_since:.1f}s")
+        self._connected = True
+        self._consecutive_failures = 0
+        self._attempts = 0
+        self._down_since = None
+        self._last_error = None
+
+    def _mark_down(self, error: str, reconnect_now: bool = False) -> None:
+        """Mark link down and start reconnecting.
+        
+        Args:
+            error: Why the link went down
+            reconnect_now: Make the first attempt without waiting
+        """
+        if self._connected:
+            logger.warning(f"{self.name} link down: {error}")
+        self._connected = False
+        self._last_error = error
+        if self._down_since is None:
+            self._down_since = clock.monotonic()
+        if self._running and (self._task is None or self._task.done()):
+            self._task = asyncio.create_task(self._reconnect(reconnect_now))
+
+    async def _reconnect(self, immediate: bool) -> None:
+        """Reconnect until it succeeds or the supervisor stops.
+        
+        Args:
+            immediate: Make the first attempt without waiting
+        """
+        while self._running:
+            if not immediate:
+                await asyncio.sleep(self.backoff(self._attempts))
+            immediate = False
+            self._attempts += 1
+            
+            try:
+                await self._client.disconnect()
+                await self._client.connect()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._last_error = str(e)
+                logger.warning(f"{self.name} reconnect attempt {self._attempts} failed: {str(e)}")
+                continue
+            
+            self._reconnects += 1
+            self._mark_up()
+            return
+
+    def health(self) -> Dict[str, Any]:
+        """Get link health component.
+        
+        Returns:
+            Component dict with status, error and reconnect details
+        """
+        down_for = clock.monotonic() - self._down_since if self._down_since is not None else 0.0
+        return {
+            "status": "ok" if self._connected else "error",
+            "error": None if self._connected else (
+                f"{self.name} link down for {down_for:.0f}s "
+                f"({self._attempts} reconnect attempts): {self._last_error}"
+            ),
+            "details": {
+                "connected": self._connected,
+                "consecutive_failures": self._consecutive_failures,
+                "reconnect_attempts": self._attempts,
+                "reconnects": self._reconnects,
+                "down_seconds": down_for
+            }
+        }
@@ -169,15 +169,8 @@ def create_communication_service(config: Optional[Dict[str, Any]] = None) -> Fas
             service_health = await service.health()
             uptime = (datetime.now() - app.state.start_time).total_seconds() if app.state.start_time else 0
             
-            # Convert component health to new format
-            components = {}
-            if service_health and isinstance(service_health, dict):
-                for name, component_status in service_health.items():
-                    if isinstance(component_status, dict):
-                        components[name] = ComponentHealth(
-                            status="ok" if component_status.get("status") == "ok" else "error",
-                            error=component_status.get("error")
-                        )
+            # Forward component health from the service
+            components = service_health.components or {}
             
             return ServiceHealth(
                 status="ok" if service.is_running else "error",
@@ -200,6 +193,20 @@ def create_communication_service(config: Optional[Dict[str, Any]] = None) -> Fas
                 "timestamp": datetime.now()
             }
 
+    @app.get("/metrics")
+    async def metrics() -> Dict[str, Any]:
+        """Get tag polling metrics."""
+        if not service.is_running or not service.tag_cache:
+            raise create_error(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                message="Service not running"
+            )
+        return {
+            "service": config["service"]["name"],
+            "timestamp": datetime.now(),
+            "tag_cache": service.tag_cache.metrics()
+        }
+
     # Include routers
     app.include_router(state_router)
     app.include_router(equipment_router)
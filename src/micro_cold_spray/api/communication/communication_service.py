@@ -17,9 +17,9 @@ from micro_cold_spray.api.communication.services import (
     TagMappingService
 )
 from micro_cold_spray.api.communication.clients import (
-    MockPLCClient,
-    PLCClient,
-    SSHClient
+    RecordingClient,
+    SessionRecorder,
+    create_client
 )
 
 
@@ -39,6 +39,7 @@ class CommunicationService:
         # Initialize services
         self._tag_mapping = TagMappingService(config)
         self._tag_cache = None  # Initialized in start()
+        self._recorder: Optional[SessionRecorder] = None
         self._equipment = EquipmentService(config)
         self._motion = MotionService(config)
         
@@ -52,14 +53,28 @@ class CommunicationService:
             # Start tag mapping service
             await self._tag_mapping.start()
             
-            # Initialize clients based on mode
+            # Initialize clients based on mode, only importing the drivers in use
             mode = self._config.get("mode", "mock")
             if mode == "mock":
-                plc_client = MockPLCClient(self._config)
+                plc_client = create_client("mock", self._config, self._tag_mapping.get_plc_scaler)
                 ssh_client = None
+            elif mode == "replay":
+                replay = self._config["communication"]["replay"]
+                plc_client = create_client("replay", replay["path"], "plc", replay.get("speed", 1.0))
+                ssh_client = create_client("replay", replay["path"], "ssh", replay.get("speed", 1.0))
+                if not ssh_client.has_events:
+                    ssh_client = None
             else:
-                plc_client = PLCClient(self._config)
-                ssh_client = SSHClient(self._config)
+                plc_client = create_client("plc", self._config)
+                ssh_client = create_client("ssh", self._config)
+            
+            # Record client traffic for offline replay
+            recording = self._config["communication"].get("recording", {})
+            if recording.get("enabled") and mode != "replay":
+                self._recorder = SessionRecorder(recording["path"])
+                plc_client = RecordingClient(plc_client, self._recorder, "plc")
+                if ssh_client:
+                    ssh_client = RecordingClient(ssh_client, self._recorder, "ssh")
             
             # Initialize and start tag cache service
             self._tag_cache = TagCacheService(plc_client, ssh_client, self._tag_mapping)
@@ -94,6 +109,9 @@ class CommunicationService:
             if self._tag_cache:
                 await self._tag_cache.stop()
             await self._tag_mapping.stop()
+            if self._recorder:
+                self._recorder.close()
+                self._recorder = None
             
             self._is_running = False
             logger.info("Communication service stopped")
@@ -170,6 +188,12 @@ class CommunicationService:
                 }
             }
             
+            # Include tag cache component details (polling, history)
+            if self._tag_cache and self._tag_cache.is_running:
+                tag_cache_health = await self._tag_cache.health()
+                for name, component in (tag_cache_health.components or {}).items():
+                    components[f"tag_cache.{name}"] = component
+            
             return ServiceHealth(
                 status="ok" if self.is_running else "error",
                 service="communication",
@@ -107,4 +107,64 @@ async def websocket_state(websocket: WebSocket):
         logger.error(f"Failed to handle system state WebSocket connection: {str(e)}")
         await websocket.close(code=status.WS_1011_INTERNAL_ERROR)
 
+
+@router.websocket("/ws/tags")
+async def websocket_tags(
+    websocket: WebSocket,
+    patterns: str = "*",
+    min_interval: float = 0.0,
+    deadband: float = 0.0
+):
+    """WebSocket endpoint for filtered tag changes.
+    Sends only tags matching the comma separated glob patterns whose value moved by more than the deadband."""
+    try:
+        # Get service from app state
+        service = websocket.app.state.service
+        if not service.is_running or not service.tag_cache:
+            await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
+            return
+        
+        # Accept connection
+        await websocket.accept()
+        subscription = service.tag_cache.subscribe(
+            [pattern.strip() for pattern in patterns.split(",") if pattern.strip()],
+            min_interval=min_interval,
+            deadband=deadband
+        )
+        logger.info(f"Tag WebSocket client connected for {subscription.patterns}")
+        
+        async def send_changes() -> None:
+            async for changes in subscription:
+                await websocket.send_json({
+                    "type": "tag_update",
+                    "data": changes
+                })
+        
+        async def wait_for_disconnect() -> None:
+            # Clients only listen, so this returns once the client goes away
+            while (await websocket.receive())["type"] != "websocket.disconnect":
+                pass
+        
+        # Watch for disconnects while sending, quiet tags may not send for a long time
+        sender = asyncio.create_task(send_changes())
+        receiver = asyncio.create_task(wait_for_disconnect())
+        try:
+            done, _ = await asyncio.wait((sender, receiver), return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                task.result()
+            logger.info("Tag WebSocket client disconnected")
+        
+        except WebSocketDisconnect:
+            logger.info("Tag WebSocket client disconnected")
+        except Exception as e:
+            logger.error(f"Tag WebSocket error: {str(e)}")
+        finally:
+            subscription.close()
+            sender.cancel()
+            receiver.cancel()
+
+    except Exception as e:
+        logger.error(f"Failed to handle tag WebSocket connection: {str(e)}")
+        await websocket.close(code=status.WS_1011_INTERNAL_ERROR)
+
 __all__ = ["router"]
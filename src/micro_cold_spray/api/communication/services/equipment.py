@@ -1,12 +1,13 @@
 """Equipment service implementation."""
 
-from typing import Dict, Any, Optional, Callable, List
+from typing import Dict, Any, Optional, Callable, List, Tuple
 from datetime import datetime
-from fastapi import status
+from fastapi import HTTPException, status
 from loguru import logger
 
 from micro_cold_spray.utils.errors import create_error
 from micro_cold_spray.api.communication.services.tag_cache import TagCacheService
+from micro_cold_spray.api.communication.services.tag_templates import TagTemplate
 from micro_cold_spray.api.communication.models.equipment import (
     GasState, VacuumState, FeederState, NozzleState, EquipmentState
 )
@@ -26,6 +27,8 @@ class EquipmentService:
         self._version = "1.0.0"
         self._config = config
         self._tag_cache: Optional[TagCacheService] = None
+        self._deagg_duty_cycle: Optional[TagTemplate] = None
+        self._deagg_frequency: Optional[TagTemplate] = None
         self._is_running = False
         self._start_time = None
         self._state_callbacks: List[Callable[[EquipmentState], None]] = []
@@ -702,15 +705,10 @@ class EquipmentService:
                 )
 
             # Set gate valve state based on position
-            if position == "open":
-                await self._tag_cache.set_tag("vacuum.gate_valve.open", True)
-                await self._tag_cache.set_tag("vacuum.gate_valve.partial", False)
-            elif position == "partial":
-                await self._tag_cache.set_tag("vacuum.gate_valve.open", False)
-                await self._tag_cache.set_tag("vacuum.gate_valve.partial", True)
-            else:  # closed
-                await self._tag_cache.set_tag("vacuum.gate_valve.open", False)
-                await self._tag_cache.set_tag("vacuum.gate_valve.partial", False)
+            await self._tag_cache.set_tags({
+                "vacuum.gate_valve.open": position == "open",
+                "vacuum.gate_valve.partial": position == "partial"
+            })
 
             logger.info(f"Set gate valve position to {position}")
 
@@ -883,8 +881,10 @@ class EquipmentService:
                 )
 
             # Write parameters
-            await self._tag_cache.set_tag(f"deagg{deagg_id}.duty_cycle.setpoint", duty_cycle)
-            await self._tag_cache.set_tag(f"deagg{deagg_id}.frequency.setpoint", frequency)
+            await self._tag_cache.set_tags({
+                f"deagg{deagg_id}.duty_cycle.setpoint": duty_cycle,
+                f"deagg{deagg_id}.frequency.setpoint": frequency
+            })
             logger.info(f"Set deagglomerator {deagg_id} parameters: duty cycle={duty_cycle}%, frequency={frequency}Hz")
 
         except Exception as e:
@@ -895,6 +895,31 @@ class EquipmentService:
                 message=error_msg
             )
 
+    def _deagg_tags(self, deagg_id: int) -> Tuple[str, str]:
+        """Get the duty cycle and frequency tags of a deagglomerator.
+        
+        The hardware set templates are compiled on first use. If tags.yaml
+        does not define the hardware set, the deagglomerator's tags are
+        addressed directly.
+        
+        Args:
+            deagg_id: Deagglomerator ID (1 or 2)
+            
+        Returns:
+            Tuple of (duty cycle tag, frequency tag)
+        """
+        try:
+            tag_mapping = self._tag_cache.tag_mapping
+            if self._deagg_duty_cycle is None:
+                self._deagg_duty_cycle = tag_mapping.compile_template("hardware_sets.set{1|2}.deagglomerator.duty_cycle")
+            if self._deagg_frequency is None:
+                self._deagg_frequency = tag_mapping.compile_template("hardware_sets.set{1|2}.deagglomerator.frequency")
+            return self._deagg_duty_cycle.resolve(deagg_id), self._deagg_frequency.resolve(deagg_id)
+        except (HTTPException, ValueError) as e:
+            reason = e.detail["message"] if isinstance(e, HTTPException) else str(e)
+            logger.warning(f"Hardware set {deagg_id} deagglomerator tags not resolved, using deagg{deagg_id} tags: {reason}")
+            return f"deagglomerators.deagg{deagg_id}.duty_cycle", f"deagglomerators.deagg{deagg_id}.frequency"
+
     async def set_deagglomerator_speed(self, deagg_id: int, speed: str) -> None:
         """Set deagglomerator speed using predefined settings.
         
@@ -935,8 +960,11 @@ class EquipmentService:
 
             # Set duty cycle and fixed frequency
             duty_cycle = duty_cycles[speed]
-            await self._tag_cache.set_tag(f"gas_control.hardware_sets.set{deagg_id}.deagglomerator.duty_cycle", duty_cycle)
-            await self._tag_cache.set_tag(f"gas_control.hardware_sets.set{deagg_id}.deagglomerator.frequency", 500)  # Fixed at 500Hz
+            duty_cycle_tag, frequency_tag = self._deagg_tags(deagg_id)
+            await self._tag_cache.set_tags({
+                duty_cycle_tag: duty_cycle,
+                frequency_tag: 500  # Fixed at 500Hz
+            })
 
             logger.info(f"Set deagglomerator {deagg_id} to {speed} speed (duty cycle: {duty_cycle}%)")
 
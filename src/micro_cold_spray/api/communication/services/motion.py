@@ -306,18 +306,20 @@ class MotionService:
                     message="Service not running"
                 )
 
-            # Set XY move parameters
-            await self._tag_cache.set_tag("motion.motion_control.coordinated_move.xy_move.parameters.x_position", x)
-            await self._tag_cache.set_tag("motion.motion_control.coordinated_move.xy_move.parameters.y_position", y)
-            await self._tag_cache.set_tag("motion.motion_control.coordinated_move.xy_move.parameters.velocity", velocity)
+            # Set XY and Z move parameters
+            await self._tag_cache.set_tags({
+                "motion.motion_control.coordinated_move.xy_move.parameters.x_position": x,
+                "motion.motion_control.coordinated_move.xy_move.parameters.y_position": y,
+                "motion.motion_control.coordinated_move.xy_move.parameters.velocity": velocity,
+                "motion.motion_control.relative_move.z_move.parameters.position": z,
+                "motion.motion_control.relative_move.z_move.parameters.velocity": velocity
+            })
             
-            # Trigger XY move
-            await self._tag_cache.set_tag("motion.motion_control.coordinated_move.xy_move.trigger", True)
-            
-            # Set Z position and trigger move
-            await self._tag_cache.set_tag("motion.motion_control.relative_move.z_move.parameters.position", z)
-            await self._tag_cache.set_tag("motion.motion_control.relative_move.z_move.parameters.velocity", velocity)
-            await self._tag_cache.set_tag("motion.motion_control.relative_move.z_move.trigger", True)
+            # Trigger XY and Z moves once the parameters are in place
+            await self._tag_cache.set_tags({
+                "motion.motion_control.coordinated_move.xy_move.trigger": True,
+                "motion.motion_control.relative_move.z_move.trigger": True
+            })
 
             # Notify state change
             await self._notify_state_changed()
@@ -357,8 +359,10 @@ class MotionService:
 
             # Set velocity and trigger move
             move_tag = f"motion.motion_control.relative_move.{axis}_move"
-            await self._tag_cache.set_tag(f"{move_tag}.parameters.position", distance)
-            await self._tag_cache.set_tag(f"{move_tag}.parameters.velocity", velocity)
+            await self._tag_cache.set_tags({
+                f"{move_tag}.parameters.position": distance,
+                f"{move_tag}.parameters.velocity": velocity
+            })
             await self._tag_cache.set_tag(f"{move_tag}.trigger", True)
 
             # Notify state change
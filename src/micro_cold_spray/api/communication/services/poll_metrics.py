@@ -0,0 +1,105 @@
+"""Poll loop timing metrics."""
+
+from typing import Any, Dict, Tuple
+
+
+class LatencyHistogram:
+    """Fixed-bucket histogram of durations."""
+
+    # Upper bucket bounds in seconds, the last bucket is open ended
+    BOUNDS: Tuple[float, ...] = (0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0, 5.0)
+
+    def __init__(self):
+        """Initialize histogram."""
+        self._counts = [0] * (len(self.BOUNDS) + 1)
+        self._count = 0
+        self._total = 0.0
+        self._max = 0.0
+        self._last = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Record a duration.
+        
+        Args:
+            seconds: Duration in seconds
+        """
+        index = 0
+        while index < len(self.BOUNDS) and seconds > self.BOUNDS[index]:
+            index += 1
+        self._counts[index] += 1
+        self._count += 1
+        self._total += seconds
+        self._last = seconds
+        if seconds > self._max:
+            self._max = seconds
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get histogram summary.
+        
+        Returns:
+            Dict with count, last/mean/max in milliseconds and bucket counts
+        """
+        buckets = {f"le_{bound * 1000:g}ms": count for bound, count in zip(self.BOUNDS, self._counts)}
+        buckets["inf"] = self._counts[-1]
+        return {
+            "count": self._count,
+            "last_ms": self._last * 1000,
+            "mean_ms": self._total / self._count * 1000 if self._count else 0.0,
+            "max_ms": self._max * 1000,
+            "buckets": buckets
+        }
+
+
+class PollMetrics:
+    """Cycle time, jitter, missed deadlines and read latency of the poll loop."""
+
+    def __init__(self):
+        """Initialize metrics."""
+        self.cycle = LatencyHistogram()
+        self.jitter = LatencyHistogram()
+        self.reads: Dict[str, LatencyHistogram] = {"plc": LatencyHistogram(), "ssh": LatencyHistogram()}
+        self.missed_deadlines: Dict[float, int] = {}
+        self.read_errors: Dict[str, int] = {"plc": 0, "ssh": 0}
+
+    @property
+    def total_missed(self) -> int:
+        """Get number of missed deadlines over all poll groups."""
+        return sum(self.missed_deadlines.values())
+
+    def observe_read(self, source: str, seconds: float, ok: bool = True) -> None:
+        """Record one client request.
+        
+        Args:
+            source: Client the request went to (plc or ssh)
+            seconds: Request duration in seconds
+            ok: Whether the request succeeded
+        """
+        self.reads.setdefault(source, LatencyHistogram()).observe(seconds)
+        if not ok:
+            self.read_errors[source] = self.read_errors.get(source, 0) + 1
+
+    def miss_deadline(self, period: float) -> int:
+        """Record a missed deadline for a poll group.
+        
+        Args:
+            period: Poll group period in seconds
+        
+        Returns:
+            Missed deadlines for that group so far
+        """
+        self.missed_deadlines[period] = self.missed_deadlines.get(period, 0) + 1
+        return self.missed_deadlines[period]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get all metrics.
+        
+        Returns:
+            JSON serializable metrics dict
+        """
+        return {
+            "cycle": self.cycle.snapshot(),
+            "jitter": self.jitter.snapshot(),
+            "missed_deadlines": {f"{period:g}s": count for period, count in self.missed_deadlines.items()},
+            "reads": {source: histogram.snapshot() for source, histogram in self.reads.items()},
+            "read_errors": dict(self.read_errors)
+        }
@@ -1,26 +1,80 @@
 """Tag cache service implementation."""
 
 import asyncio
-from typing import Dict, Any, Optional, List, Callable
+import math
+import time
+from typing import TYPE_CHECKING, Dict, Any, FrozenSet, Optional, List, Callable, NamedTuple, Tuple
 from datetime import datetime
+import numpy as np
 from fastapi import status
 from loguru import logger
 
+from micro_cold_spray.utils import clock
 from micro_cold_spray.utils.errors import create_error
-from micro_cold_spray.api.communication.clients.mock import MockPLCClient
-from micro_cold_spray.api.communication.clients.plc import PLCClient
-from micro_cold_spray.api.communication.clients.ssh import SSHClient
-from micro_cold_spray.api.communication.services.tag_mapping import TagMappingService
+from micro_cold_spray.api.communication.clients.base import TagClient
+from micro_cold_spray.api.communication.clients.supervisor import ConnectionSupervisor
+from micro_cold_spray.api.communication.services.tag_mapping import TagMappingService, same_value_source
+from micro_cold_spray.api.communication.services.tag_scaling import TagScaler
+from micro_cold_spray.api.communication.services.tag_history import TagHistory
+from micro_cold_spray.api.communication.services.poll_metrics import PollMetrics
+from micro_cold_spray.api.communication.services.tag_subscription import TagSubscription
 from micro_cold_spray.api.communication.models.equipment import (
     GasState, VacuumState, FeederState, NozzleState, EquipmentState, DeagglomeratorState, PressureState
 )
 from micro_cold_spray.utils.health import get_uptime, ServiceHealth
+from micro_cold_spray.utils.tag_snapshot import DEFAULT_NAME, DEFAULT_SIZE, TagSnapshotPublisher
+
+if TYPE_CHECKING:
+    from micro_cold_spray.api.communication.clients.ssh import SSHClient
+
+
+class PollGroup(NamedTuple):
+    """Precompiled set of tags polled at the same period."""
+    period: float
+    plc_tags: Tuple[Tuple[str, str], ...]  # (internal name, PLC tag)
+    ssh_tags: Tuple[Tuple[str, str], ...]  # (internal name, SSH register)
+    plc_names: Tuple[str, ...]  # Unique PLC tags to request
+    scaler: TagScaler  # Raw counts -> engineering units for the scaled PLC tags
 
 
 class TagCacheService:
     """Service for caching PLC tag values."""
 
-    def __init__(self, plc_client: Any, ssh_client: Optional[SSHClient], tag_mapping: TagMappingService):
+    # Groups due within this many seconds of each other are read together
+    SCHEDULE_SLACK = 0.002
+    
+    # Tags each equipment sub-state is built from
+    STATE_TAGS: Dict[str, Tuple[str, ...]] = {
+        "gas": (
+            "gas_control.main_flow.setpoint",
+            "gas_control.main_flow.measured",
+            "gas_control.feeder_flow.setpoint",
+            "gas_control.feeder_flow.measured",
+            "gas_control.main_valve.open",
+            "gas_control.feeder_valve.open",
+        ),
+        "vacuum": (
+            "vacuum.chamber_pressure",
+            "vacuum.gate_valve.open",
+            "vacuum.mechanical_pump.start",
+            "vacuum.booster_pump.start",
+            "vacuum.vent_valve",
+        ),
+        "feeder1": ("feeders.feeder1.running", "feeders.feeder1.frequency"),
+        "feeder2": ("feeders.feeder2.running", "feeders.feeder2.frequency"),
+        "nozzle": ("nozzle.select", "nozzle.shutter.open", "nozzle.pressure"),
+        "pressures": (
+            "nozzle.pressure",
+            "vacuum.chamber_pressure",
+            "pressure.feeder_pressure",
+            "pressure.main_supply_pressure",
+            "pressure.regulator_pressure",
+        ),
+        "deagg1": ("deagglomerators.deagg1.duty_cycle", "deagglomerators.deagg1.frequency"),
+        "deagg2": ("deagglomerators.deagg2.duty_cycle", "deagglomerators.deagg2.frequency"),
+    }
+
+    def __init__(self, plc_client: TagClient, ssh_client: Optional["SSHClient"], tag_mapping: TagMappingService):
         """Initialize tag cache service.
         
         Args:
@@ -34,6 +88,14 @@ class TagCacheService:
         self._cache: Dict[str, Any] = {}
         self._state_cache: Dict[str, Any] = {}
         self._polling_task: Optional[asyncio.Task] = None
+        self._ssh_polling_task: Optional[asyncio.Task] = None
+        self._ssh_updated: Dict[str, float] = {}
+        self._poll_plan: Tuple[PollGroup, ...] = ()
+        self._poll_plan_version: Optional[int] = None
+        self._poll_plan_tag_map: Dict[str, Dict[str, Any]] = {}  # Tag map the cache was last brought up to date with
+        self._plc_polled_tags: frozenset = frozenset()
+        self._metrics = PollMetrics()
+        self._history: Dict[str, TagHistory] = {}
         self._is_running = False
         self._start_time = None
         self._service_name = "tag_cache"
@@ -43,9 +105,48 @@ class TagCacheService:
         # Get polling config from tag mapping service
         self._polling = tag_mapping._config["communication"]["polling"]
         
+        # Client links, reconnected automatically when they drop
+        reconnect = tag_mapping._config["communication"].get("reconnect", {})
+        self._plc_link = ConnectionSupervisor("plc", plc_client, reconnect)
+        self._ssh_link = ConnectionSupervisor("ssh", ssh_client, reconnect) if ssh_client else None
+        
+        # Shared memory snapshot of the cache for co-located services
+        self._snapshot_config = tag_mapping._config["communication"].get("snapshot", {})
+        self._snapshot: Optional[TagSnapshotPublisher] = None
+        self._snapshot_stale: Optional[List[str]] = None
+        
         # State change callbacks
         self._state_callbacks: List[Callable[[str, Any], None]] = []
         
+        # Equipment sub-state builders and the states each tag feeds into
+        self._state_builders: Dict[str, Callable[[], Any]] = {
+            "gas": self._build_gas_state,
+            "vacuum": self._build_vacuum_state,
+            "feeder1": lambda: self._build_feeder_state("feeder1"),
+            "feeder2": lambda: self._build_feeder_state("feeder2"),
+            "nozzle": self._build_nozzle_state,
+            "pressures": self._build_pressure_state,
+            "deagg1": lambda: self._build_deagg_state("deagg1"),
+            "deagg2": lambda: self._build_deagg_state("deagg2"),
+        }
+        self._state_dependents: Dict[str, List[str]] = {}
+        for state, tags in self.STATE_TAGS.items():
+            for tag in tags:
+                self._state_dependents.setdefault(tag, []).append(state)
+        self._dirty_tags: Dict[str, Any] = {}
+        
+        # Coalesced writes waiting for the next flush
+        self._pending_writes: Dict[str, Any] = {}
+        self._write_flush_task: Optional[asyncio.Task] = None
+        
+        # Tag change subscriptions, indexed by the tags they match
+        self._subscriptions: List[TagSubscription] = []
+        self._subscribers_by_tag: Dict[str, List[TagSubscription]] = {}
+        
+        # wait_for() callers, indexed by the tag they wait on, with the reads issued before they started
+        self._waiters: Dict[str, List[Tuple[Callable[[Any], bool], asyncio.Future, int]]] = {}
+        self._read_count = 0
+        
         logger.info("\n Tag cache service initialized")
 
     @property
@@ -58,6 +159,11 @@ class TagCacheService:
         """Get service version."""
         return self._version
 
+    @property
+    def tag_mapping(self) -> TagMappingService:
+        """Get tag mapping service the cache polls through."""
+        return self._tag_mapping
+
     @property
     def uptime(self) -> float:
         """Get service uptime in seconds."""
@@ -74,9 +180,10 @@ class TagCacheService:
                 logger.debug("Tag cache service already initialized")
                 return
             
-            # Initialize tag list from mapping service
+            # Initialize tag list and poll plan from mapping service
             for tag in self._tag_mapping._tag_map.keys():
                 self._cache[tag] = None
+            self._rebuild_poll_plan()
                 
             # Initialize state cache
             self._state_cache = {
@@ -85,8 +192,12 @@ class TagCacheService:
                 "vacuum": None,
                 "feeder1": None,
                 "feeder2": None,
-                "nozzle": None
+                "nozzle": None,
+                "pressures": None,
+                "deagg1": None,
+                "deagg2": None
             }
+            self._dirty_tags.clear()
                 
             self._initialized = True
             logger.info("Tag cache service initialized")
@@ -113,13 +224,25 @@ class TagCacheService:
             if not self._initialized:
                 await self.initialize()
             
-            # Connect to PLC client
-            if isinstance(self._plc_client, MockPLCClient):
-                await self._plc_client.connect()
+            # Connect clients, a feeder that is slow to answer must not hold up startup
+            await self._plc_link.start()
+            if self._ssh_link:
+                await self._ssh_link.start(wait=False)
+            
+            if self._snapshot_config.get("enabled", False):
+                try:
+                    self._snapshot = TagSnapshotPublisher(
+                        self._snapshot_config.get("name", DEFAULT_NAME),
+                        self._snapshot_config.get("size", DEFAULT_SIZE)
+                    )
+                except Exception as e:
+                    logger.warning(f"Tag snapshot disabled, failed to create shared memory: {str(e)}")
             
             self._is_running = True
             self._start_time = datetime.now()
             self._polling_task = asyncio.create_task(self._poll_tags())
+            if self._ssh_client:
+                self._ssh_polling_task = asyncio.create_task(self._poll_ssh_tags())
             logger.info("Tag cache service started")
             
         except Exception as e:
@@ -140,22 +263,54 @@ class TagCacheService:
             if not self.is_running:
                 return
             
-            self._is_running = False
-            if self._polling_task:
-                self._polling_task.cancel()
+            # Let coalesced writes go out before shutting down
+            if self._write_flush_task:
                 try:
-                    await self._polling_task
-                except asyncio.CancelledError:
-                    pass
-                self._polling_task = None
+                    await self._write_flush_task
+                except Exception:
+                    pass  # Already logged by the write
             
-            # Disconnect from PLC client
-            if isinstance(self._plc_client, MockPLCClient):
-                await self._plc_client.disconnect()
+            self._is_running = False
+            for task in (self._polling_task, self._ssh_polling_task):
+                if task:
+                    task.cancel()
+                    try:
+                        await task
+                    except asyncio.CancelledError:
+                        pass
+            self._polling_task = None
+            self._ssh_polling_task = None
+            
+            # Disconnect clients
+            await self._plc_link.stop()
+            if self._ssh_link:
+                await self._ssh_link.stop()
+            
+            # End all subscriptions and waits
+            for subscription in list(self._subscriptions):
+                subscription.close()
+            for waiters in self._waiters.values():
+                for _, future, _ in waiters:
+                    if not future.done():
+                        future.set_exception(create_error(
+                            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                            message="Tag cache service stopped"
+                        ))
+            self._waiters.clear()
+            
+            if self._snapshot:
+                self._snapshot.close()
+                self._snapshot = None
+                self._snapshot_stale = None
             
             self._start_time = None
             self._cache.clear()
             self._state_cache.clear()
+            self._poll_plan = ()
+            self._poll_plan_version = None
+            self._poll_plan_tag_map = {}
+            self._history.clear()
+            self._ssh_updated.clear()
             self._initialized = False
             logger.info("Tag cache service stopped")
             
@@ -167,50 +322,252 @@ class TagCacheService:
                 message=error_msg
             )
 
+    def _build_poll_plan(self, affected: Optional[FrozenSet[str]] = None) -> Tuple[PollGroup, ...]:
+        """Compile the tag map into per-period poll groups.
+        
+        Tags use the poll_rate of their tag group, or the global
+        ``polling.interval`` if none is set. Internal tags are left out.
+        
+        Args:
+            affected: Tags changed since the current plan was built. Only
+                groups that held or now hold one of them are rebuilt, the
+                rest of the plan is kept as is. Rebuilds everything if None.
+        
+        Returns:
+            Poll groups, one per polling period
+        """
+        plc_tags: Dict[float, List[Tuple[str, str]]] = {}
+        ssh_tags: Dict[float, List[Tuple[str, str]]] = {}
+        tag_map = self._tag_mapping._tag_map
+        kept: Dict[float, PollGroup] = {}
+        if affected is None:
+            tags = tag_map.keys()
+        else:
+            tags = affected
+            for group in self._poll_plan:
+                if any(tag in affected for tag, _ in group.plc_tags + group.ssh_tags):
+                    plc_tags[group.period] = [pair for pair in group.plc_tags if pair[0] not in affected]
+                    ssh_tags[group.period] = [pair for pair in group.ssh_tags if pair[0] not in affected]
+                else:
+                    kept[group.period] = group
+        
+        for tag in tags:
+            tag_info = tag_map.get(tag)
+            if tag_info is None:
+                continue
+            if "plc_tag" in tag_info:
+                target = plc_tags
+                source = tag_info["plc_tag"]
+            elif tag.startswith("ssh."):
+                target = ssh_tags
+                source = tag[len("ssh."):]
+            else:
+                continue
+            
+            rate = self._tag_mapping.get_poll_rate(tag)
+            period = 1.0 / rate if rate else self._polling["interval"]
+            if period in kept:
+                # A group untouched so far gains a tag, rebuild it too
+                group = kept.pop(period)
+                plc_tags[period] = list(group.plc_tags)
+                ssh_tags[period] = list(group.ssh_tags)
+            target.setdefault(period, []).append((tag, source))
+        
+        plan = []
+        for period in sorted(set(plc_tags) | set(ssh_tags) | set(kept)):
+            if period in kept:
+                plan.append(kept[period])
+                continue
+            group_plc = tuple(plc_tags.get(period, ()))
+            group_ssh = tuple(ssh_tags.get(period, ()))
+            if not group_plc and not group_ssh:
+                continue  # Every tag of the group was removed
+            plan.append(PollGroup(
+                period=period,
+                plc_tags=group_plc,
+                ssh_tags=group_ssh,
+                plc_names=tuple(dict.fromkeys(plc_tag for _, plc_tag in group_plc)),
+                scaler=self._tag_mapping.get_scaler(tag for tag, _ in group_plc)
+            ))
+            logger.info(f"Polling {len(group_plc)} PLC and {len(group_ssh)} SSH tags every {period:g}s")
+        
+        return tuple(plan)
+
+    def _rebuild_poll_plan(self) -> Optional[FrozenSet[str]]:
+        """Bring the poll plan and cache up to date with the tag map.
+        
+        After a tag map reload only the poll groups of added, removed or
+        changed tags are rebuilt. If the changes since the last update are
+        no longer known, the whole plan is rebuilt and every tag is checked
+        against the tag map the cache was last updated with. Either way,
+        removed tags leave the cache, and tags that are new or whose PLC tag,
+        type or scaling changed lose their value and history. Every other tag
+        keeps its value, added tags are in the cache right away.
+        
+        Returns:
+            Tags whose values were reset and need a fresh read, None if
+            everything was rebuilt
+        """
+        tag_map = self._tag_mapping._tag_map
+        old_map = self._poll_plan_tag_map
+        diff = None
+        if self._poll_plan_version is not None:
+            diff = self._tag_mapping.changes_since(self._poll_plan_version)
+        
+        if diff is None:
+            candidates = self._cache.keys() | tag_map.keys()
+            readded: FrozenSet[str] = frozenset()
+        else:
+            candidates = diff.tags
+            readded = diff.added & diff.removed  # Removed and added again over several reloads
+        reset = set()
+        for tag in candidates:
+            tag_info = tag_map.get(tag)
+            if tag_info is not None and tag not in readded and same_value_source(old_map.get(tag), tag_info):
+                continue
+            reset.add(tag)
+            self._history.pop(tag, None)
+            self._ssh_updated.pop(tag, None)
+            self._dirty_tags.pop(tag, None)
+            if tag_info is None:
+                self._cache.pop(tag, None)
+            else:
+                self._cache[tag] = None  # No value yet, or it came from another PLC tag or scaling
+        if diff is not None:
+            logger.info(f"Updating poll plan for {len(diff.tags)} changed tags, {len(reset)} reset")
+        elif old_map:
+            logger.info(f"Rebuilding poll plan after several tag map reloads, {len(reset)} tags reset")
+        
+        self._poll_plan = self._build_poll_plan(diff.tags if diff is not None else None)
+        self._poll_plan_version = self._tag_mapping.map_version
+        self._poll_plan_tag_map = tag_map
+        self._plc_polled_tags = frozenset(tag for group in self._poll_plan for tag, _ in group.plc_tags)
+        self._build_history()
+        self._index_subscriptions()
+        return frozenset(reset) if diff is not None else None
+
+    def _build_history(self) -> None:
+        """Allocate sample history for numeric polled tags.
+        
+        Each buffer holds ``polling.history_seconds`` of samples at its tag's
+        polling period, so total memory is fixed once the plan is built.
+        """
+        history_seconds = self._polling.get("history_seconds", 600)
+        history = {}
+        for group in self._poll_plan:
+            capacity = math.ceil(history_seconds / group.period) + 1
+            for tag, _ in group.plc_tags + group.ssh_tags:
+                if self._tag_mapping.get_tag_type(tag) not in ("float", "integer"):
+                    continue
+                existing = self._history.get(tag)
+                history[tag] = existing if existing and existing.capacity == capacity else TagHistory(capacity)
+        self._history = history
+        logger.info(
+            f"Keeping {history_seconds:g}s of history for {len(history)} tags "
+            f"({sum(h.nbytes for h in history.values()) / 1024:.0f} KiB)"
+        )
+
     async def _poll_tags(self) -> None:
-        """Poll PLC tags and update cache."""
+        """Poll PLC tags and update cache.
+        
+        SSH tags are polled by their own task, see ``_poll_ssh_tags``.
+        Each poll group keeps its own deadline. Groups that are due
+        together are merged into a single read, and a group whose next
+        deadline has already passed once the read is done counts as an overrun.
+        """
         prev_values = {}  # Track previous values to reduce logging
+        loop = asyncio.get_running_loop()
+        plan: Tuple[PollGroup, ...] = ()
+        next_due: List[float] = []
         
         while self._is_running:
             try:
-                # Get all tag values
-                for tag in self._cache.keys():
-                    # Get tag mapping info
-                    tag_info = self._tag_mapping.get_tag_info(tag)
-                    if not tag_info:
-                        continue
-
-                    # Check if tag is mapped to PLC or SSH
-                    is_plc_tag = "plc_tag" in tag_info
-                    is_ssh_tag = tag.startswith("ssh.")
-
-                    try:
-                        if is_plc_tag:
-                            # Read from PLC
-                            plc_tag = tag_info["plc_tag"]
-                            value = await self._plc_client.read_tag(plc_tag)
-                        elif is_ssh_tag and self._ssh_client:
-                            # Read from SSH
-                            ssh_tag = tag.replace("ssh.", "")  # Remove ssh. prefix
-                            value = await self._ssh_client.read_tag(ssh_tag)
-                        else:
-                            # Internal tag - skip polling
-                            continue
+                # Pick up a reloaded tag map
+                reset: FrozenSet[str] = frozenset()
+                if self._poll_plan_version != self._tag_mapping.map_version:
+                    affected = self._rebuild_poll_plan()
+                    if affected is None:
+                        # Rebuilt from scratch, read everything right away
+                        prev_values.clear()
+                        plan, next_due = (), []
+                    else:
+                        reset = affected
+                        for tag in reset:
+                            prev_values.pop(tag, None)
+                if plan is not self._poll_plan:
+                    # Groups that kept their period keep their deadline, unless they have tags to read afresh
+                    deadlines = {group.period: deadline for group, deadline in zip(plan, next_due)}
+                    plan = self._poll_plan
+                    now = loop.time()
+                    next_due = [
+                        now if any(tag in reset for tag, _ in group.plc_tags) else deadlines.get(group.period, now)
+                        for group in plan
+                    ]
+                
+                if not plan:
+                    await asyncio.sleep(self._polling["interval"])
+                    continue
 
+                # Merge every group that is due into one read
+                cycle_start = loop.time()
+                due = [i for i, deadline in enumerate(next_due) if deadline <= cycle_start + self.SCHEDULE_SLACK]
+                if due:
+                    # Jitter is how late this cycle started against its deadline
+                    self._metrics.jitter.observe(max(cycle_start - min(next_due[i] for i in due), 0.0))
+                plc_tags = [pair for i in due for pair in plan[i].plc_tags]
+                for i in due:
+                    next_due[i] += plan[i].period
+                
+                if due:
+                    self._read_count += 1
+                    read_id = self._read_count
+                    if not self._plc_link.connected:
+                        values = {}  # Reconnecting, cached values are stale until then
+                    elif self._polling.get("batch_mode", True):
+                        plc_names = [name for i in due for name in plan[i].plc_names]
+                        values = await self._read_tags_batched(plc_names, plc_tags)
+                    else:
+                        values = await self._read_tags_individually(plc_tags)
+                    
+                    # Analog tags arrive as raw counts, scale each group in one step
+                    if values:
+                        for i in due:
+                            values.update(plan[i].scaler.to_engineering(values))
+                    
+                    sample_time = clock.monotonic()
+                    for tag, value in values.items():
+                        if tag in self._history and isinstance(value, (int, float)):
+                            self._history[tag].append(sample_time, value)
+                        
                         # Only log and update if value changed
                         if tag not in prev_values or value != prev_values[tag]:
                             self._cache[tag] = value
                             prev_values[tag] = value
+                            self._dirty_tags[tag] = value
                             logger.debug(f"Updated tag {tag} = {value}")
-
-                    except Exception as e:
-                        logger.error(f"Error polling tag {tag}: {str(e)}")
-                        continue
+                    if self._waiters:
+                        self._resolve_waiters(values, read_id)
+                    
+                    # Update equipment states and subscribers affected by changed tags
+                    changes, self._dirty_tags = self._dirty_tags, {}
+                    await self._update_equipment_states(changes)
+                    self._publish_changes(changes)
                 
-                # Update equipment states
-                await self._update_equipment_states()
+                # Report groups that could not keep up and resync them
+                now = loop.time()
+                if due:
+                    self._metrics.cycle.observe(now - cycle_start)
+                for i in due:
+                    if next_due[i] < now:
+                        group = plan[i]
+                        missed = self._metrics.miss_deadline(group.period)
+                        logger.warning(
+                            f"Polling overrun for {len(group.plc_tags)} tags every {group.period:g}s "
+                            f"({missed} total)"
+                        )
+                        next_due[i] = now + group.period
                         
-                await asyncio.sleep(self._polling["interval"])
+                await asyncio.sleep(max(min(next_due) - loop.time(), 0))
                 
             except asyncio.CancelledError:
                 break
@@ -218,85 +575,248 @@ class TagCacheService:
                 logger.error(f"Error polling tags: {str(e)}")
                 await asyncio.sleep(1.0)  # Delay before retry
 
-    async def _update_equipment_states(self) -> None:
-        """Update cached equipment states."""
-        try:
-            # Update gas state
-            gas_state = GasState(
-                main_flow=self._cache.get("gas_control.main_flow.setpoint", 0),
-                main_flow_measured=self._cache.get("gas_control.main_flow.measured", 0),
-                feeder_flow=self._cache.get("gas_control.feeder_flow.setpoint", 0),
-                feeder_flow_measured=self._cache.get("gas_control.feeder_flow.measured", 0),
-                main_valve=self._cache.get("gas_control.main_valve.open", False),
-                feeder_valve=self._cache.get("gas_control.feeder_valve.open", False)
-            )
-            
-            # Update vacuum state
-            vacuum_state = VacuumState(
-                chamber_pressure=self._cache.get("vacuum.chamber_pressure", 0),
-                gate_valve=self._cache.get("vacuum.gate_valve.open", False),
-                mech_pump=self._cache.get("vacuum.mechanical_pump.start", False),
-                booster_pump=self._cache.get("vacuum.booster_pump.start", False),
-                vent_valve=self._cache.get("vacuum.vent_valve", False)
-            )
-            
-            # Update feeder states
-            feeder1_state = FeederState(
-                running=self._cache.get("feeders.feeder1.running", False),
-                frequency=self._cache.get("feeders.feeder1.frequency", 0)
-            )
+    async def _read_tags_individually(self, plc_tags: List[Tuple[str, str]]) -> Dict[str, Any]:
+        """Read PLC tags with one client request per tag.
+        
+        Args:
+            plc_tags: (internal name, PLC tag) pairs to read
             
-            feeder2_state = FeederState(
-                running=self._cache.get("feeders.feeder2.running", False),
-                frequency=self._cache.get("feeders.feeder2.frequency", 0)
-            )
+        Returns:
+            Dict mapping internal tag names to values
+        """
+        values = {}
+        for tag, plc_tag in plc_tags:
+            started = time.perf_counter()
+            try:
+                values[tag] = await self._plc_client.read_tag(plc_tag)
+                self._metrics.observe_read("plc", time.perf_counter() - started)
+                self._plc_link.record_success()
+            except Exception as e:
+                self._metrics.observe_read("plc", time.perf_counter() - started, ok=False)
+                self._plc_link.record_failure(e)
+                logger.error(f"Error polling tag {tag}: {str(e)}")
+        
+        return values
+
+    async def _read_tags_batched(self, plc_names: List[str], plc_tags: List[Tuple[str, str]]) -> Dict[str, Any]:
+        """Read PLC tags with one bulk request per batch.
+        
+        PLC tags are read ``polling.batch_size`` at a time (a single request
+        per cycle if the batch size is 0 or not set) and fanned out to every
+        internal tag mapped onto them. The Productivity PLC client fetches
+        every tag on each request, so only set a batch size for clients
+        whose request cost grows with the number of tags.
+        
+        Args:
+            plc_names: PLC tag names to request
+            plc_tags: (internal name, PLC tag) pairs to fan the results out to
             
-            # Update nozzle state
-            nozzle_state = NozzleState(
-                active_nozzle=2 if self._cache.get("nozzle.select", False) else 1,
-                shutter_open=self._cache.get("nozzle.shutter.open", False),
-                pressure=self._cache.get("nozzle.pressure", 0)
-            )
+        Returns:
+            Dict mapping internal tag names to values
+        """
+        plc_values = {}
+        batch_size = self._polling.get("batch_size") or len(plc_names) or 1
+        for start in range(0, len(plc_names), batch_size):
+            batch = plc_names[start:start + batch_size]
+            started = time.perf_counter()
+            try:
+                plc_values.update(await self._plc_client.read_many(batch))
+                self._metrics.observe_read("plc", time.perf_counter() - started)
+                self._plc_link.record_success()
+            except Exception as e:
+                self._metrics.observe_read("plc", time.perf_counter() - started, ok=False)
+                self._plc_link.record_failure(e)
+                logger.error(f"Error polling PLC batch of {len(batch)} tags: {str(e)}")
+        
+        # Several internal tags may share one PLC tag
+        return {tag: plc_values[plc_tag] for tag, plc_tag in plc_tags if plc_tag in plc_values}
+
+    async def _poll_ssh_tags(self) -> None:
+        """Poll SSH tags and update cache.
+        
+        Runs beside the PLC poll loop at ``polling.ssh_interval`` so a slow
+        or unreachable feeder never delays PLC polling. Changes are picked
+        up by the next PLC cycle for state updates and subscribers.
+        """
+        interval = self._polling.get("ssh_interval", 1.0)
+        loop = asyncio.get_running_loop()
+        next_due = loop.time()
+        
+        while self._is_running:
+            try:
+                ssh_tags = [pair for group in self._poll_plan for pair in group.ssh_tags]
+                self._read_count += 1
+                read_id = self._read_count
+                values = await self._read_ssh_tags(ssh_tags)
+                
+                sample_time = clock.monotonic()
+                for tag, value in values.items():
+                    self._ssh_updated[tag] = sample_time
+                    if tag in self._history and isinstance(value, (int, float)):
+                        self._history[tag].append(sample_time, value)
+                    if value != self._cache.get(tag):
+                        self._cache[tag] = value
+                        self._dirty_tags[tag] = value
+                        logger.debug(f"Updated tag {tag} = {value}")
+                if self._waiters:
+                    self._resolve_waiters(values, read_id)
+                
+                # Keep the period, but never try to catch up on missed cycles
+                next_due = max(next_due + interval, loop.time())
+                await asyncio.sleep(next_due - loop.time())
+                
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error polling SSH tags: {str(e)}")
+                await asyncio.sleep(1.0)  # Delay before retry
+
+    def is_stale(self, tag: str) -> bool:
+        """Check if a tag's cached value is out of date.
+        
+        PLC and SSH tags are stale while their link is down. SSH values are
+        also stale if never read or last read more than
+        ``polling.ssh_stale_after`` seconds ago (default three SSH
+        intervals). Internal tags are never stale.
+        
+        Args:
+            tag: Tag name
             
-            # Update pressure state
-            pressure_state = PressureState(
-                nozzle=self._cache.get("nozzle.pressure", 0),
-                chamber=self._cache.get("vacuum.chamber_pressure", 0),
-                feeder=self._cache.get("pressure.feeder_pressure", 0),
-                main_supply=self._cache.get("pressure.main_supply_pressure", 0),
-                regulator=self._cache.get("pressure.regulator_pressure", 0)
-            )
+        Returns:
+            True if the cached value is stale
+        """
+        if not tag.startswith("ssh."):
+            return tag in self._plc_polled_tags and not self._plc_link.connected
+        if not self._ssh_link or not self._ssh_link.connected:
+            return True
+        stale_after = self._polling.get("ssh_stale_after", 3 * self._polling.get("ssh_interval", 1.0))
+        updated = self._ssh_updated.get(tag)
+        return updated is None or clock.monotonic() - updated > stale_after
+
+    def get_stale_tags(self) -> List[str]:
+        """Get polled tags whose cached values are stale.
+        
+        Returns:
+            Stale tag names
+        """
+        stale = [tag for group in self._poll_plan for tag, _ in group.ssh_tags if self.is_stale(tag)]
+        if not self._plc_link.connected:
+            stale.extend(sorted(self._plc_polled_tags))
+        return stale
+
+    async def _read_ssh_tags(self, ssh_tags: List[Tuple[str, str]]) -> Dict[str, Any]:
+        """Read SSH registers in a single exchange.
+        
+        Args:
+            ssh_tags: (internal name, SSH register) pairs to read
             
-            # Update deagglomerator states
-            deagg1_state = DeagglomeratorState(
-                duty_cycle=self._cache.get("deagglomerators.deagg1.duty_cycle", 0),
-                frequency=self._cache.get("deagglomerators.deagg1.frequency", 0)
-            )
+        Returns:
+            Dict mapping internal tag names to values
+        """
+        if not self._ssh_link or not self._ssh_link.connected or not ssh_tags:
+            return {}
+        
+        registers = list(dict.fromkeys(register for _, register in ssh_tags))
+        started = time.perf_counter()
+        try:
+            register_values = await self._ssh_client.read_tags(registers)
+            self._metrics.observe_read("ssh", time.perf_counter() - started)
+            self._ssh_link.record_success()
+        except Exception as e:
+            self._metrics.observe_read("ssh", time.perf_counter() - started, ok=False)
+            self._ssh_link.record_failure(e)
+            logger.error(f"Error polling SSH tags {registers}: {str(e)}")
+            return {}
+        
+        return {tag: register_values[register] for tag, register in ssh_tags if register in register_values}
+
+    def _build_gas_state(self) -> GasState:
+        """Build gas state from cached tags."""
+        return GasState(
+            main_flow=self._cache.get("gas_control.main_flow.setpoint", 0),
+            main_flow_measured=self._cache.get("gas_control.main_flow.measured", 0),
+            feeder_flow=self._cache.get("gas_control.feeder_flow.setpoint", 0),
+            feeder_flow_measured=self._cache.get("gas_control.feeder_flow.measured", 0),
+            main_valve=self._cache.get("gas_control.main_valve.open", False),
+            feeder_valve=self._cache.get("gas_control.feeder_valve.open", False)
+        )
+
+    def _build_vacuum_state(self) -> VacuumState:
+        """Build vacuum state from cached tags."""
+        return VacuumState(
+            chamber_pressure=self._cache.get("vacuum.chamber_pressure", 0),
+            gate_valve=self._cache.get("vacuum.gate_valve.open", False),
+            mech_pump=self._cache.get("vacuum.mechanical_pump.start", False),
+            booster_pump=self._cache.get("vacuum.booster_pump.start", False),
+            vent_valve=self._cache.get("vacuum.vent_valve", False)
+        )
+
+    def _build_feeder_state(self, feeder: str) -> FeederState:
+        """Build feeder state from cached tags."""
+        return FeederState(
+            running=self._cache.get(f"feeders.{feeder}.running", False),
+            frequency=self._cache.get(f"feeders.{feeder}.frequency", 0)
+        )
+
+    def _build_nozzle_state(self) -> NozzleState:
+        """Build nozzle state from cached tags."""
+        return NozzleState(
+            active_nozzle=2 if self._cache.get("nozzle.select", False) else 1,
+            shutter_open=self._cache.get("nozzle.shutter.open", False),
+            pressure=self._cache.get("nozzle.pressure", 0)
+        )
+
+    def _build_pressure_state(self) -> PressureState:
+        """Build pressure state from cached tags."""
+        return PressureState(
+            nozzle=self._cache.get("nozzle.pressure", 0),
+            chamber=self._cache.get("vacuum.chamber_pressure", 0),
+            feeder=self._cache.get("pressure.feeder_pressure", 0),
+            main_supply=self._cache.get("pressure.main_supply_pressure", 0),
+            regulator=self._cache.get("pressure.regulator_pressure", 0)
+        )
+
+    def _build_deagg_state(self, deagg: str) -> DeagglomeratorState:
+        """Build deagglomerator state from cached tags."""
+        return DeagglomeratorState(
+            duty_cycle=self._cache.get(f"deagglomerators.{deagg}.duty_cycle", 0),
+            frequency=self._cache.get(f"deagglomerators.{deagg}.frequency", 0)
+        )
+
+    async def _update_equipment_states(self, dirty_tags: Dict[str, Any]) -> None:
+        """Update cached equipment states.
+        
+        Only sub-states that depend on a tag changed since the last update
+        are rebuilt, and callbacks are only notified if one of them differs
+        from its cached value.
+        
+        Args:
+            dirty_tags: Tags changed since the last update
+        """
+        try:
+            # Rebuild everything the first time, otherwise only dirty sub-states
+            if self._state_cache.get("equipment") is None:
+                dirty_states = set(self._state_builders)
+            else:
+                dirty_states = {
+                    state for tag in dirty_tags for state in self._state_dependents.get(tag, ())
+                }
             
-            deagg2_state = DeagglomeratorState(
-                duty_cycle=self._cache.get("deagglomerators.deagg2.duty_cycle", 0),
-                frequency=self._cache.get("deagglomerators.deagg2.frequency", 0)
-            )
+            changed = False
+            for name in dirty_states:
+                state = self._state_builders[name]()
+                if state != self._state_cache.get(name):
+                    self._state_cache[name] = state
+                    changed = True
+                    
+            if not changed:
+                return
             
             # Update equipment state
             equipment_state = EquipmentState(
-                gas=gas_state,
-                vacuum=vacuum_state,
-                feeder1=feeder1_state,
-                feeder2=feeder2_state,
-                nozzle=nozzle_state,
-                pressures=pressure_state,
-                deagg1=deagg1_state,
-                deagg2=deagg2_state
+                **{name: self._state_cache[name] for name in self._state_builders}
             )
-            
-            # Update state cache
             self._state_cache["equipment"] = equipment_state
-            self._state_cache["gas"] = gas_state
-            self._state_cache["vacuum"] = vacuum_state
-            self._state_cache["feeder1"] = feeder1_state
-            self._state_cache["feeder2"] = feeder2_state
-            self._state_cache["nozzle"] = nozzle_state
             
             # Notify state change callbacks
             for callback in self._state_callbacks:
@@ -308,6 +828,170 @@ class TagCacheService:
         except Exception as e:
             logger.error(f"Error updating equipment states: {str(e)}")
 
+    def subscribe(self, patterns: List[str], min_interval: float = 0.0, deadband: float = 0.0) -> TagSubscription:
+        """Subscribe to changes of matching tags.
+        
+        The returned subscription is an async iterator of change batches.
+        The first batch holds the current value of every matching tag.
+        
+        Args:
+            patterns: Glob patterns of internal tag names (e.g. "motion.position.*")
+            min_interval: Minimum seconds between batches
+            deadband: Minimum change of a numeric value before it is reported
+            
+        Returns:
+            Tag subscription, close it when done
+            
+        Raises:
+            HTTPException: If service not running
+        """
+        if not self.is_running:
+            raise create_error(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                message="Tag cache service not running"
+            )
+        
+        subscription = TagSubscription(patterns, min_interval, deadband, on_close=self._unsubscribe)
+        self._subscriptions.append(subscription)
+        self._index_subscriptions()
+        
+        # Seed with current values
+        for tag in subscription.match_tags(self._cache.keys()):
+            if self._cache[tag] is not None:
+                subscription.offer(tag, self._cache[tag])
+        subscription.flush()
+        
+        logger.debug(f"Added tag subscription for {patterns} ({len(self._subscriptions)} total)")
+        return subscription
+
+    def _unsubscribe(self, subscription: TagSubscription) -> None:
+        """Remove closed subscription."""
+        if subscription in self._subscriptions:
+            self._subscriptions.remove(subscription)
+            self._index_subscriptions()
+
+    def _index_subscriptions(self) -> None:
+        """Rebuild the tag to subscribers index."""
+        index: Dict[str, List[TagSubscription]] = {}
+        for subscription in self._subscriptions:
+            for tag in subscription.match_tags(self._cache.keys()):
+                index.setdefault(tag, []).append(subscription)
+        self._subscribers_by_tag = index
+
+    def _publish_changes(self, changes: Dict[str, Any]) -> None:
+        """Fan changed tags out to the snapshot and subscribers in a single pass.
+        
+        Args:
+            changes: Tags changed this cycle
+        """
+        if self._snapshot:
+            self._publish_snapshot(changes)
+        if not self._subscribers_by_tag:
+            return
+        
+        notified = set()
+        for tag, value in changes.items():
+            for subscription in self._subscribers_by_tag.get(tag, ()):
+                subscription.offer(tag, value)
+                notified.add(subscription)
+        for subscription in notified:
+            subscription.flush()
+
+    def _publish_snapshot(self, changes: Dict[str, Any]) -> None:
+        """Publish the cache to shared memory, or only refresh its timestamp if nothing changed.
+        
+        Args:
+            changes: Tags changed this cycle
+        """
+        stale = self.get_stale_tags()
+        if changes or stale != self._snapshot_stale:
+            self._snapshot.publish(self._cache, stale)
+            self._snapshot_stale = stale
+        else:
+            self._snapshot.touch()
+
+    def _resolve_waiters(self, values: Dict[str, Any], read_id: int) -> None:
+        """Wake waiters whose tag was read with a value they accept.
+        
+        Every polled value counts, changed or not, but only from reads
+        issued after the waiter started.
+        
+        Args:
+            values: Tag values of one poll read
+            read_id: Number of the read, see ``_read_count``
+        """
+        for tag, value in values.items():
+            waiters = self._waiters.get(tag)
+            if not waiters:
+                continue
+            for predicate, future, since in waiters:
+                if future.done() or read_id <= since:
+                    continue
+                try:
+                    if predicate(value):
+                        future.set_result(value)
+                except Exception as e:
+                    future.set_exception(e)
+
+    async def wait_for(
+        self,
+        tag: str,
+        predicate: Callable[[Any], bool],
+        timeout: float,
+        current: bool = False
+    ) -> Any:
+        """Wait until a polled value of a tag satisfies a predicate.
+        
+        Only values from poll reads issued after the call count, so a check
+        right after a write sees the device's response, not the value from
+        before the write or the written value itself. The regular poll
+        reads are used, so no extra reads are made.
+        
+        Args:
+            tag: Tag name
+            predicate: Called with each polled value, returns True to stop waiting
+            timeout: Maximum seconds to wait
+            current: Also accept the value already in the cache
+            
+        Returns:
+            The value that satisfied the predicate
+            
+        Raises:
+            HTTPException: If service not running, tag not found or the wait timed out
+        """
+        if not self.is_running:
+            raise create_error(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                message="Tag cache service not running"
+            )
+        
+        if tag not in self._cache:
+            raise create_error(
+                status_code=status.HTTP_404_NOT_FOUND,
+                message=f"Tag not found: {tag}"
+            )
+        
+        value = self._cache[tag]
+        if current and value is not None and predicate(value):
+            return value
+        
+        future = asyncio.get_running_loop().create_future()
+        waiter = (predicate, future, self._read_count)
+        self._waiters.setdefault(tag, []).append(waiter)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            raise create_error(
+                status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+                message=f"Timed out after {timeout:g}s waiting for {tag} (last value: {self._cache.get(tag)})"
+            )
+        finally:
+            waiters = self._waiters.get(tag)
+            if waiters and waiter in waiters:
+                waiters.remove(waiter)
+                if not waiters:
+                    del self._waiters[tag]
+
     def add_state_callback(self, callback: Callable[[str, Any], None]) -> None:
         """Add state change callback.
         
@@ -345,6 +1029,54 @@ class TagCacheService:
             )
         return self._cache.get(tag)
 
+    def get_history(self, tag: str, seconds: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Get recent samples of a numeric tag.
+        
+        Args:
+            tag: Tag name
+            seconds: How far back to look
+            
+        Returns:
+            Tuple of (timestamps, values) arrays, timestamps in event loop clock seconds
+            
+        Raises:
+            HTTPException: If service not running or tag has no history
+        """
+        return self._get_tag_history(tag).window(seconds, clock.monotonic())
+
+    def get_stats(self, tag: str, window: float) -> Dict[str, Optional[float]]:
+        """Get statistics of a numeric tag over a time window.
+        
+        Args:
+            tag: Tag name
+            window: Window length in seconds
+            
+        Returns:
+            Dict with count, mean, std, min, max and slope (units per second)
+            
+        Raises:
+            HTTPException: If service not running or tag has no history
+        """
+        return self._get_tag_history(tag).stats(window, clock.monotonic())
+
+    def _get_tag_history(self, tag: str) -> TagHistory:
+        """Get history buffer for tag.
+        
+        Raises:
+            HTTPException: If service not running or tag has no history
+        """
+        if not self.is_running:
+            raise create_error(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                message="Tag cache service not running"
+            )
+        if tag not in self._history:
+            raise create_error(
+                status_code=status.HTTP_404_NOT_FOUND,
+                message=f"No history for tag: {tag}"
+            )
+        return self._history[tag]
+
     async def get_state(self, state_type: str) -> Optional[Any]:
         """Get cached state.
         
@@ -374,57 +1106,135 @@ class TagCacheService:
         Raises:
             HTTPException: If service not running
         """
+        await self.set_tags({tag: value})
+
+    async def set_tags(self, values: Dict[str, Any], coalesce: bool = False) -> None:
+        """Set multiple tag values.
+        
+        All tags are validated before anything is written, then every PLC
+        tag goes out in a single request. The PLC library writes discrete
+        values before registers, so write parameters and the trigger that
+        acts on them as separate calls.
+        
+        With ``coalesce`` the values are held for ``polling.write_coalesce``
+        seconds and merged with other coalesced writes, so rapid updates to
+        the same tag (e.g. a setpoint slider) only send the latest value.
+        
+        Args:
+            values: Dict mapping tag names to values
+            coalesce: Merge with other writes in the coalescing window
+            
+        Raises:
+            HTTPException: If service not running, a tag is unknown or the write fails
+        """
         if not self.is_running:
             raise create_error(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 message="Tag cache service not running"
             )
 
-        # Get tag mapping info
-        tag_info = self._tag_mapping.get_tag_info(tag)
-        if not tag_info:
+        # Validate every tag before writing any of them
+        unknown = [tag for tag in values if not self._tag_mapping.has_tag(tag)]
+        if unknown:
             raise create_error(
                 status_code=status.HTTP_404_NOT_FOUND,
-                message=f"Tag not found: {tag}"
+                message=f"Tag not found: {', '.join(unknown)}"
             )
 
-        # Check if tag is mapped to PLC or SSH
-        is_plc_tag = "plc_tag" in tag_info
-        is_ssh_tag = tag.startswith("ssh.")
-
-        # Only write to client if we're not in mock mode
-        if isinstance(self._plc_client, MockPLCClient):
-            # In mock mode, just update the cache
-            await self._plc_client.write_tag(tag, value)
-            self._cache[tag] = value
-            logger.debug(f"Set mock tag {tag} = {value}")
+        if coalesce:
+            self._pending_writes.update(values)
+            if self._write_flush_task is None:
+                self._write_flush_task = asyncio.create_task(
+                    self._flush_pending_writes(self._polling.get("write_coalesce", 0.05))
+                )
+            await asyncio.shield(self._write_flush_task)
             return
 
+        # A coalesced value still waiting for its window is older, it must not overwrite this one
+        for tag in values:
+            self._pending_writes.pop(tag, None)
+        await self._write_tags(values)
+
+    async def _flush_pending_writes(self, delay: float) -> None:
+        """Write coalesced values once the coalescing window closes.
+        
+        Values coalesced while a write is in flight go out right after it,
+        their callers wait on this task too. The task stays registered until
+        the last write finished, so stop() waits for it.
+        
+        Args:
+            delay: Coalescing window in seconds
+        """
         try:
-            if is_plc_tag:
-                # Write to PLC
-                plc_tag = tag_info["plc_tag"]
-                await self._plc_client.write_tag(plc_tag, value)
-                self._cache[tag] = value
-                logger.debug(f"Set PLC tag {plc_tag} = {value}")
-            elif is_ssh_tag and self._ssh_client:
-                # Write to SSH
-                ssh_tag = tag.replace("ssh.", "")  # Remove ssh. prefix
-                await self._ssh_client.write_tag(ssh_tag, value)
-                self._cache[tag] = value
-                logger.debug(f"Set SSH tag {ssh_tag} = {value}")
-            else:
-                # Internal tag - just update cache
-                self._cache[tag] = value
-                logger.debug(f"Set internal tag {tag} = {value}")
+            await asyncio.sleep(delay)
+            while self._pending_writes:
+                values, self._pending_writes = self._pending_writes, {}
+                await self._write_tags(values)
+        except Exception:
+            # Every waiter gets this error, drop the values they were waiting on
+            self._pending_writes = {}
+            raise
+        finally:
+            self._write_flush_task = None
+
+    async def _write_tags(self, values: Dict[str, Any]) -> None:
+        """Write validated tag values to their clients and update cache.
+        
+        Values of analog tags are in engineering units and written to the
+        PLC as raw counts, the cache keeps the engineering values. PLC and
+        internal tags are written before SSH tags. If the SSH write fails,
+        the cache still takes the values that were written.
+        
+        Args:
+            values: Dict mapping tag names to values
+            
+        Raises:
+            HTTPException: If a write fails
+        """
+        raw_values = {**values, **self._tag_mapping.get_scaler().to_raw(values)}
+        plc_values = self._tag_mapping.translate_many(raw_values, to_plc=True)
+        ssh_writes = {tag: value for tag, value in values.items() if tag.startswith("ssh.")} if self._ssh_client else {}
+        
+        written: Dict[str, Any] = {}
+        try:
+            if plc_values:
+                # Write to PLC in one request
+                if not self._plc_link.connected:
+                    raise ConnectionError("PLC link down, reconnecting")
+                await self._plc_client.write_many(plc_values)
+                logger.debug(f"Set PLC tags {plc_values}")
+            written = {tag: value for tag, value in values.items() if tag not in ssh_writes}
+            if ssh_writes:
+                # Write to SSH in one command, without the ssh. prefix
+                if not self._ssh_link.connected:
+                    raise ConnectionError("SSH link down, reconnecting")
+                await self._ssh_client.write_tags({tag.replace("ssh.", ""): value for tag, value in ssh_writes.items()})
+                logger.debug(f"Set SSH tags {ssh_writes}")
+            written = values
 
         except Exception as e:
-            error_msg = f"Failed to set tag {tag} = {value}"
+            error_msg = f"Failed to set tags {', '.join(tag for tag in values if tag not in written)}"
+            if written:
+                error_msg += f" (set {', '.join(written)})"
             logger.error(f"{error_msg}: {str(e)}")
             raise create_error(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 message=error_msg
             )
+        
+        finally:
+            # Internal tags only live in the cache
+            self._cache.update(written)
+            self._dirty_tags.update(written)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Get poll loop metrics.
+        
+        Returns:
+            Dict with cycle duration and jitter histograms, missed deadlines
+            per poll group and read latency per client
+        """
+        return self._metrics.snapshot()
 
     def get_all_tags(self) -> Dict[str, Any]:
         """Get all cached tag values.
@@ -452,14 +1262,49 @@ class TagCacheService:
             # Check cache status
             cache_ok = self.is_running and isinstance(self._cache, dict)
             
+            # Overruns are reported but do not fail the health check
+            overruns = self._metrics.total_missed
+            history_bytes = sum(h.nbytes for h in self._history.values())
+            stale_tags = self.get_stale_tags()
+            ssh_stale = [tag for tag in stale_tags if tag.startswith("ssh.")]
+            
             # Build component statuses
             components = {
                 "cache": {
                     "status": "ok" if cache_ok else "error",
                     "error": None if cache_ok else "Cache not initialized"
+                },
+                "polling": {
+                    "status": "ok",
+                    "error": f"{overruns} polling overruns" if overruns else None,
+                    "details": self._metrics.snapshot()
+                },
+                "ssh": {
+                    "status": "ok",
+                    "error": f"{len(ssh_stale)} stale SSH tags" if ssh_stale else None
+                },
+                "plc_link": self._plc_link.health(),
+                "history": {
+                    "status": "ok",
+                    "error": None,
+                    "details": {
+                        "tags": len(self._history),
+                        "samples": sum(len(h) for h in self._history.values()),
+                        "capacity": sum(h.capacity for h in self._history.values()),
+                        "memory_bytes": history_bytes
+                    }
                 }
             }
             
+            if self._ssh_link:
+                components["ssh_link"] = self._ssh_link.health()
+            if self._snapshot:
+                components["snapshot"] = {
+                    "status": "ok",
+                    "error": None,
+                    "details": {"name": self._snapshot.name, "version": self._snapshot.version}
+                }
+            
             # Overall status is error if any component is in error
             overall_status = "error" if any(c["status"] == "error" for c in components.values()) else "ok"
             
@@ -0,0 +1,102 @@
+"""Fixed-size sample history for numeric tags."""
+
+from typing import Dict, Optional, Tuple
+import numpy as np
+
+
+class TagHistory:
+    """Preallocated ring buffer of timestamped numeric samples."""
+
+    def __init__(self, capacity: int):
+        """Initialize tag history.
+        
+        Args:
+            capacity: Maximum number of samples kept
+        """
+        self._capacity = max(int(capacity), 1)
+        self._times = np.zeros(self._capacity, dtype=np.float64)
+        self._values = np.zeros(self._capacity, dtype=np.float64)
+        self._next = 0
+        self._count = 0
+
+    @property
+    def capacity(self) -> int:
+        """Get maximum number of samples."""
+        return self._capacity
+
+    @property
+    def nbytes(self) -> int:
+        """Get memory used by the sample buffers in bytes."""
+        return self._times.nbytes + self._values.nbytes
+
+    def __len__(self) -> int:
+        """Get number of samples currently stored."""
+        return self._count
+
+    def append(self, timestamp: float, value: float) -> None:
+        """Append a sample, overwriting the oldest one when full.
+        
+        Args:
+            timestamp: Monotonic sample time in seconds
+            value: Sample value
+        """
+        self._times[self._next] = timestamp
+        self._values[self._next] = value
+        self._next = (self._next + 1) % self._capacity
+        if self._count < self._capacity:
+            self._count += 1
+
+    def window(self, seconds: float, now: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Get samples newer than ``now - seconds`` in time order.
+        
+        Args:
+            seconds: Window length in seconds
+            now: Monotonic reference time in seconds
+        
+        Returns:
+            Tuple of (timestamps, values) arrays
+        """
+        start = (self._next - self._count) % self._capacity
+        if start + self._count <= self._capacity:
+            times = self._times[start:start + self._count]
+            values = self._values[start:start + self._count]
+        else:
+            times = np.concatenate((self._times[start:], self._times[:self._next]))
+            values = np.concatenate((self._values[start:], self._values[:self._next]))
+        
+        # Timestamps are sorted, so the window is a suffix of the buffer
+        first = int(np.searchsorted(times, now - seconds, side="left"))
+        return times[first:].copy(), values[first:].copy()
+
+    def stats(self, seconds: float, now: float) -> Dict[str, Optional[float]]:
+        """Get summary statistics over a time window.
+        
+        Args:
+            seconds: Window length in seconds
+            now: Monotonic reference time in seconds
+        
+        Returns:
+            Dict with count, mean, std, min, max and slope (units per second),
+            None where the window has too few samples
+        """
+        times, values = self.window(seconds, now)
+        count = len(values)
+        if count == 0:
+            return {"count": 0, "mean": None, "std": None, "min": None, "max": None, "slope": None}
+        
+        # Least-squares slope, centred on the window mean to keep precision
+        slope = None
+        if count > 1:
+            dt = times - times.mean()
+            denom = float(np.dot(dt, dt))
+            if denom > 0:
+                slope = float(np.dot(dt, values - values.mean()) / denom)
+        
+        return {
+            "count": count,
+            "mean": float(values.mean()),
+            "std": float(values.std()),
+            "min": float(values.min()),
+            "max": float(values.max()),
+            "slope": slope
+        }
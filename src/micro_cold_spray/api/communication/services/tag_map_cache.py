@@ -0,0 +1,113 @@
+"""Compiled cache of the flattened tag map.
+
+Parsing tags.yaml and walking its groups dominates tag mapping startup. The
+flattened map is saved with ``marshal`` under a SHA-256 hash of the YAML
+content, so later starts load it directly and only parse the YAML after it
+was edited.
+
+The cache file is ``<magic><source digest><payload digest>`` followed by
+the marshalled flattened config tuple. The source digest also covers the
+Python and marshal versions, a cache written by another interpreter is just
+a miss. The payload digest is checked before unmarshalling, and marshal
+data is only trusted from a file and directory no other user can write to.
+Anything else is treated as a miss.
+"""
+
+import hashlib
+import marshal
+import os
+import stat
+import sys
+from pathlib import Path
+from typing import Any, Optional, Tuple
+from loguru import logger
+
+
+MAGIC = b"MCSTAGS3"
+
+_DIGEST_SIZE = hashlib.sha256().digest_size
+_FORMAT = f"{sys.version_info[0]}.{sys.version_info[1]}/{marshal.version}".encode()
+
+
+def source_digest(source: bytes) -> bytes:
+    """Hash tag config file content into a cache key.
+    
+    Args:
+        source: Raw tags.yaml content
+    
+    Returns:
+        SHA-256 digest
+    """
+    return hashlib.sha256(_FORMAT + b"\0" + source).digest()
+
+
+def _writable_by_others(path: Path) -> bool:
+    """Check if another user could have written a file or directory."""
+    if os.name != "posix":
+        return False
+    info = path.stat()
+    return info.st_uid != os.getuid() or bool(info.st_mode & (stat.S_IWGRP | stat.S_IWOTH))
+
+
+def load_compiled(path: Path, digest: bytes) -> Optional[Tuple[Any, ...]]:
+    """Load a compiled tag map if it was built from the same content.
+    
+    Args:
+        path: Cache file path
+        digest: Digest of the current tags.yaml content
+    
+    Returns:
+        Flattened config tuple, None if the cache is missing, stale, corrupt,
+        writable by other users or unreadable
+    """
+    try:
+        with open(path, "rb") as f:
+            header = f.read(len(MAGIC) + _DIGEST_SIZE)
+            if header != MAGIC + digest:
+                return None
+            if _writable_by_others(path) or _writable_by_others(path.parent):
+                logger.warning(f"Ignoring tag map cache {path}, other users can write to it")
+                return None
+            payload_digest = f.read(_DIGEST_SIZE)
+            payload = f.read()
+        if hashlib.sha256(payload).digest() != payload_digest:
+            logger.warning(f"Ignoring corrupt tag map cache {path}")
+            return None
+        compiled = marshal.loads(payload)
+        if not isinstance(compiled, tuple):
+            logger.warning(f"Ignoring tag map cache {path}, unexpected content")
+            return None
+        return compiled
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable tag map cache {path}: {str(e)}")
+        return None
+
+
+def save_compiled(path: Path, digest: bytes, compiled: Tuple[Any, ...]) -> None:
+    """Save a compiled tag map, replacing the cache atomically.
+    
+    A missing cache directory is created private to the service's user.
+    Failures are logged and otherwise ignored, the cache only saves time.
+    
+    Args:
+        path: Cache file path
+        digest: Digest of the tags.yaml content the map was parsed from
+        compiled: Flattened config, plain Python types only
+    """
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        payload = marshal.dumps(compiled)
+        with open(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "wb") as f:
+            f.write(MAGIC + digest + hashlib.sha256(payload).digest())
+            f.write(payload)
+        os.replace(tmp_path, path)
+        logger.debug(f"Saved compiled tag map to {path}")
+    except Exception as e:
+        logger.warning(f"Failed to save tag map cache {path}: {str(e)}")
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
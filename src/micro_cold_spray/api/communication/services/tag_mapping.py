@@ -1,18 +1,74 @@
 """Service for mapping between internal tag names and PLC tags."""
 
+import asyncio
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, FrozenSet, Iterable, NamedTuple, Optional, Tuple
 from datetime import datetime
 import yaml
-from fastapi import status
+from fastapi import HTTPException, status
 from loguru import logger
 
 from micro_cold_spray.utils.errors import create_error
 from micro_cold_spray.utils.health import get_uptime, ServiceHealth
+from micro_cold_spray.api.communication.services.tag_scaling import EMPTY_SCALER, TagScaler, scaling_params
+from micro_cold_spray.api.communication.services.tag_map_cache import load_compiled, save_compiled, source_digest
+from micro_cold_spray.api.communication.services.tag_templates import HARDWARE_SETS, TagTemplate, compile_template
+
+# libyaml is several times faster than the pure Python loader when installed
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Tag definition keys that change where a tag's value comes from or what it means
+_VALUE_KEYS = ("mapped", "plc_tag", "type", "scaling", "range")
+
+
+def same_value_source(old: Optional[Dict[str, Any]], new: Optional[Dict[str, Any]]) -> bool:
+    """Check whether a tag's cached value stays valid across two tag definitions.
+    
+    Args:
+        old: Previous tag definition, None if the tag was not defined
+        new: Current tag definition, None if the tag is not defined
+    
+    Returns:
+        True if both define the tag with the same PLC tag, type and scaling
+    """
+    if old is None or new is None:
+        return False
+    return all(old.get(key) == new.get(key) for key in _VALUE_KEYS)
+
+
+class TagConfig(NamedTuple):
+    """Flattened tag config file."""
+    tag_map: Dict[str, Dict[str, Any]]
+    poll_rates: Dict[str, Optional[float]]
+    hardware_sets: Dict[str, Dict[str, str]]  # Set -> component -> tag group
+
+
+class TagMapDiff(NamedTuple):
+    """Tags that differ between two versions of the tag map."""
+    added: FrozenSet[str]
+    removed: FrozenSet[str]
+    changed: FrozenSet[str]  # Definition or poll rate changed
+    remapped: FrozenSet[str] = frozenset()  # Changed tags whose PLC tag, type or scaling changed
+
+    @property
+    def tags(self) -> FrozenSet[str]:
+        """Get every affected tag."""
+        return self.added | self.removed | self.changed
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
 
 
 class TagMappingService:
-    """Service for mapping between internal tag names and PLC tags."""
+    """Service for mapping between internal tag names and PLC tags.
+    
+    The tag config file is watched while the service runs. A changed file is
+    parsed off the event loop and swapped in as a whole, so lookups always
+    see either the old or the new map.
+    """
+
+    # Tag map versions whose changes are kept for changes_since
+    MAX_DIFFS = 32
 
     def __init__(self, config: Dict[str, Any]):
         """Initialize tag mapping service.
@@ -23,6 +79,18 @@ class TagMappingService:
         self._service_name = "tag_mapping"
         self._version = "1.0.0"
         self._tag_map: Dict[str, Dict[str, Any]] = {}
+        self._poll_rates: Dict[str, Optional[float]] = {}
+        self._plc_tags: Dict[str, str] = {}  # Internal name -> PLC tag
+        self._aliases: Dict[str, Tuple[str, ...]] = {}  # PLC tag -> internal names, in definition order
+        self._scaler: TagScaler = EMPTY_SCALER  # Every scaled PLC tag, by internal name
+        self._plc_scaler: TagScaler = EMPTY_SCALER  # The same, by PLC tag name
+        self._hardware_sets: Dict[str, Dict[str, str]] = {}
+        self._templates: Dict[str, TagTemplate] = {}  # Compiled templates handed out, by template
+        self._map_version = 0
+        self._diffs: Dict[int, TagMapDiff] = {}  # Map version -> changes from the version before
+        self._config_mtime: Optional[int] = None
+        self._reload_error: Optional[str] = None
+        self._watch_task: Optional[asyncio.Task] = None
         self._is_running = False
         self._start_time = None
         self._config = config
@@ -33,49 +101,162 @@ class TagMappingService:
         """Check if service is running."""
         return self._is_running
 
+    @property
+    def map_version(self) -> int:
+        """Get tag map version, incremented every time the map is loaded."""
+        return self._map_version
+
+    def _config_path(self) -> Path:
+        """Get tag config file path."""
+        return Path(self._config["communication"]["services"]["tag_mapping"]["config_file"])
+
+    def _cache_path(self) -> Optional[Path]:
+        """Get compiled tag map cache path, None if caching is disabled."""
+        cache_file = self._config["communication"]["services"]["tag_mapping"].get("compiled_cache")
+        return Path(cache_file).expanduser() if cache_file else None
+
+    @classmethod
+    def _read_config(
+        cls,
+        config_path: Path,
+        cache_path: Optional[Path] = None
+    ) -> TagConfig:
+        """Read a tag config file, from the compiled cache if the file is unchanged.
+        
+        Touches no service state, so it is safe to run in a worker thread.
+        
+        Args:
+            config_path: Tag config file path
+            cache_path: Compiled tag map cache path, None to always parse
+            
+        Returns:
+            Flattened tag config
+            
+        Raises:
+            FileNotFoundError: If the file does not exist
+            ValueError: If the file is not a tag config
+        """
+        if not config_path.exists():
+            raise FileNotFoundError(f"Tag config not found: {config_path}")
+        
+        source = config_path.read_bytes()
+        digest = source_digest(source)
+        if cache_path is not None:
+            compiled = load_compiled(cache_path, digest)
+            if (
+                compiled is not None
+                and len(compiled) == len(TagConfig._fields)
+                and all(isinstance(part, dict) for part in compiled)
+            ):
+                logger.debug(f"Loaded compiled tag map from {cache_path}")
+                return TagConfig(*compiled)
+        
+        logger.debug(f"Loading tag config from {config_path}")
+        try:
+            tag_config = cls._parse_config(source)
+        except yaml.YAMLError as e:
+            raise ValueError(f"Invalid YAML in {config_path}: {str(e)}")
+        if cache_path is not None:
+            save_compiled(cache_path, digest, tuple(tag_config))
+        return tag_config
+
+    @staticmethod
+    def _parse_config(source: bytes) -> TagConfig:
+        """Parse tag config YAML and flatten its groups.
+        
+        Args:
+            source: Tag config file content
+            
+        Returns:
+            Flattened tag config
+            
+        Raises:
+            ValueError: If the content is not a tag config
+        """
+        tag_config = yaml.load(source, Loader=_YAML_LOADER)
+        if not isinstance(tag_config, dict):
+            raise ValueError(f"Invalid tag config format - expected dict, got {type(tag_config)}")
+        
+        tag_map: Dict[str, Dict[str, Any]] = {}
+        poll_rates: Dict[str, Optional[float]] = {}
+        
+        # Process tag groups recursively, groups may set a poll_rate (Hz) inherited by their tags
+        def process_group(group: Dict[str, Any], prefix: str = "", poll_rate: Optional[float] = None) -> None:
+            poll_rate = group.get("poll_rate", poll_rate)
+            for name, data in group.items():
+                if isinstance(data, dict):
+                    full_path = f"{prefix}{name}" if prefix else name
+                    if "plc_tag" in data or data.get("internal", False):
+                        # This is a tag definition
+                        tag_map[full_path] = data
+                        poll_rates[full_path] = data.get("poll_rate", poll_rate)
+                        logger.debug(f"Added tag definition: {full_path} -> {data}")
+                    else:
+                        # This is a nested group
+                        new_prefix = f"{full_path}." if full_path else f"{name}."
+                        logger.debug(f"Processing group: {new_prefix}")
+                        process_group(data, new_prefix, poll_rate)
+        
+        # Start with top level groups
+        if "tag_groups" in tag_config:
+            logger.debug("Processing tag groups...")
+            process_group(tag_config["tag_groups"])
+        else:
+            # No groups - process top level directly
+            logger.debug("Processing top level tags...")
+            process_group(tag_config)
+        
+        # Log loaded mappings for debugging
+        for internal_name, tag_info in tag_map.items():
+            if "plc_tag" in tag_info:
+                logger.debug(f"Loaded tag mapping: {internal_name} -> {tag_info['plc_tag']}")
+        
+        hardware_sets = tag_config.get(HARDWARE_SETS) or {}
+        if not isinstance(hardware_sets, dict):
+            raise ValueError(f"Invalid {HARDWARE_SETS} section - expected dict, got {type(hardware_sets)}")
+        
+        return TagConfig(tag_map, poll_rates, hardware_sets)
+
+    def _diff(self, tag_map: Dict[str, Dict[str, Any]], poll_rates: Dict[str, Optional[float]]) -> TagMapDiff:
+        """Compare a parsed tag map against the current one."""
+        old_map, old_rates = self._tag_map, self._poll_rates
+        return TagMapDiff(
+            added=frozenset(tag_map.keys() - old_map.keys()),
+            removed=frozenset(old_map.keys() - tag_map.keys()),
+            changed=frozenset(
+                tag for tag in tag_map.keys() & old_map.keys()
+                if tag_map[tag] != old_map[tag] or poll_rates.get(tag) != old_rates.get(tag)
+            ),
+            remapped=frozenset(
+                tag for tag in tag_map.keys() & old_map.keys()
+                if not same_value_source(old_map[tag], tag_map[tag])
+            )
+        )
+
+    def _swap(self, tag_config: TagConfig) -> TagMapDiff:
+        """Replace the tag map and its indexes.
+        
+        Runs without awaiting, so no other task sees a half-built map.
+        
+        Returns:
+            Changes against the previous map
+        """
+        diff = self._diff(tag_config.tag_map, tag_config.poll_rates)
+        self._tag_map = tag_config.tag_map
+        self._poll_rates = tag_config.poll_rates
+        self._hardware_sets = tag_config.hardware_sets
+        self._build_indexes()
+        self._map_version += 1
+        self._diffs[self._map_version] = diff
+        self._diffs.pop(self._map_version - self.MAX_DIFFS, None)
+        return diff
+
     def _load_config(self) -> None:
         """Load tag configuration from YAML file."""
         try:
-            # Load and parse YAML file
-            config_path = Path(self._config["communication"]["services"]["tag_mapping"]["config_file"])
-            if not config_path.exists():
-                raise FileNotFoundError(f"Tag config not found: {config_path}")
-
-            logger.debug(f"Loading tag config from {config_path}")
-            with open(config_path) as f:
-                tag_config = yaml.safe_load(f)
-                if not isinstance(tag_config, dict):
-                    raise ValueError(f"Invalid tag config format - expected dict, got {type(tag_config)}")
-
-            # Process tag groups recursively
-            def process_group(group: Dict[str, Any], prefix: str = "") -> None:
-                for name, data in group.items():
-                    if isinstance(data, dict):
-                        full_path = f"{prefix}{name}" if prefix else name
-                        if "plc_tag" in data or data.get("internal", False):
-                            # This is a tag definition
-                            self._tag_map[full_path] = data
-                            logger.debug(f"Added tag definition: {full_path} -> {data}")
-                        else:
-                            # This is a nested group
-                            new_prefix = f"{full_path}." if full_path else f"{name}."
-                            logger.debug(f"Processing group: {new_prefix}")
-                            process_group(data, new_prefix)
-
-            # Start with top level groups
-            if "tag_groups" in tag_config:
-                logger.debug("Processing tag groups...")
-                process_group(tag_config["tag_groups"])
-            else:
-                # No groups - process top level directly
-                logger.debug("Processing top level tags...")
-                process_group(tag_config)
-
-            # Log loaded mappings for debugging
-            for internal_name, tag_info in self._tag_map.items():
-                if "plc_tag" in tag_info:
-                    logger.debug(f"Loaded tag mapping: {internal_name} -> {tag_info['plc_tag']}")
-
+            config_path = self._config_path()
+            self._config_mtime = config_path.stat().st_mtime_ns if config_path.exists() else None
+            self._swap(self._read_config(config_path, self._cache_path()))
             logger.info(f"Loaded {len(self._tag_map)} tag definitions")
 
         except Exception as e:
@@ -86,6 +267,39 @@ class TagMappingService:
                 message=error_msg
             )
 
+    def _build_indexes(self) -> None:
+        """Build the internal -> PLC tag index, its reverse and the tag scaler from the tag map."""
+        plc_tags: Dict[str, str] = {}
+        aliases: Dict[str, Tuple[str, ...]] = {}
+        scaling: Dict[str, Tuple[float, float, int]] = {}
+        plc_scaling: Dict[str, Tuple[float, float, int]] = {}
+        for internal_name, tag_info in self._tag_map.items():
+            plc_tag = tag_info.get("plc_tag")
+            if tag_info.get("mapped", False) and plc_tag:
+                plc_tags[internal_name] = plc_tag
+                aliases[plc_tag] = aliases.get(plc_tag, ()) + (internal_name,)
+                try:
+                    params = scaling_params(tag_info)
+                except ValueError as e:
+                    logger.warning(f"Not scaling {internal_name}: {str(e)}")
+                    continue
+                if params is not None:
+                    scaling[internal_name] = params
+                    plc_scaling.setdefault(plc_tag, params)
+        self._plc_tags = plc_tags
+        self._aliases = aliases
+        self._scaler = TagScaler(scaling)
+        self._plc_scaler = TagScaler(plc_scaling)
+        logger.info(f"Scaling {len(scaling)} analog tags to engineering units")
+        
+        # Handles given out keep working across reloads
+        for template, handle in self._templates.items():
+            try:
+                handle._update(compile_template(template, self._hardware_sets, self._tag_map))
+            except ValueError as e:
+                handle._update(TagTemplate(template, {}))
+                logger.warning(f"Tag template no longer resolves: {str(e)}")
+
     async def initialize(self) -> None:
         """Initialize tag mapping service.
         
@@ -123,6 +337,9 @@ class TagMappingService:
                 await self.initialize()
 
             self._start_time = datetime.now()
+            watch_interval = self._config["communication"]["services"]["tag_mapping"].get("watch_interval", 0)
+            if watch_interval and self._watch_task is None:
+                self._watch_task = asyncio.create_task(self._watch_config(watch_interval))
             logger.info("Tag mapping service started")
 
         except Exception as e:
@@ -139,7 +356,23 @@ class TagMappingService:
             if not self.is_running:
                 return
 
-            self._tag_map.clear()
+            if self._watch_task:
+                self._watch_task.cancel()
+                try:
+                    await self._watch_task
+                except asyncio.CancelledError:
+                    pass
+                self._watch_task = None
+            
+            self._tag_map = {}
+            self._poll_rates = {}
+            self._diffs.clear()
+            self._plc_tags = {}
+            self._aliases = {}
+            self._scaler = EMPTY_SCALER
+            self._plc_scaler = EMPTY_SCALER
+            self._hardware_sets = {}
+            self._templates.clear()
             self._is_running = False
             self._start_time = None
             logger.info("Tag mapping service stopped")
@@ -149,6 +382,93 @@ class TagMappingService:
             logger.error(error_msg)
             # Don't raise during shutdown
 
+    async def reload(self) -> TagMapDiff:
+        """Reload the tag config file and swap in the new map if it changed.
+        
+        The file is parsed in a worker thread. If it cannot be parsed the
+        current map stays in place.
+        
+        Returns:
+            Changes against the previous map, empty if nothing changed
+            
+        Raises:
+            HTTPException: If the service is not running or the file is invalid
+        """
+        if not self.is_running:
+            raise create_error(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                message="Service not running"
+            )
+        
+        config_path = self._config_path()
+        try:
+            # Take the mtime first, a write during parsing triggers another reload
+            self._config_mtime = config_path.stat().st_mtime_ns
+            tag_config = await asyncio.to_thread(self._read_config, config_path, self._cache_path())
+        except Exception as e:
+            self._reload_error = f"Failed to reload tag config, keeping current map: {str(e)}"
+            logger.error(self._reload_error)
+            raise create_error(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                message=self._reload_error
+            )
+        self._reload_error = None
+        
+        if not self.is_running:
+            # Stopped while parsing
+            return TagMapDiff(frozenset(), frozenset(), frozenset())
+        diff = self._diff(tag_config.tag_map, tag_config.poll_rates)
+        if not diff and tag_config.hardware_sets == self._hardware_sets:
+            logger.info(f"Tag config {config_path} reloaded, no changes")
+            return diff
+        self._swap(tag_config)
+        logger.info(
+            f"Reloaded tag map version {self._map_version}: {len(diff.added)} added, "
+            f"{len(diff.removed)} removed, {len(diff.changed)} changed"
+        )
+        return diff
+
+    async def _watch_config(self, interval: float) -> None:
+        """Reload the tag config file whenever its modification time changes.
+        
+        Args:
+            interval: Seconds between checks
+        """
+        config_path = self._config_path()
+        logger.info(f"Watching {config_path} for changes every {interval:g}s")
+        while self._is_running:
+            try:
+                await asyncio.sleep(interval)
+                mtime = config_path.stat().st_mtime_ns if config_path.exists() else None
+                if mtime is not None and mtime != self._config_mtime:
+                    await self.reload()
+            except asyncio.CancelledError:
+                break
+            except Exception:
+                pass  # Logged by reload, keep watching
+
+    def changes_since(self, version: int) -> Optional[TagMapDiff]:
+        """Get every tag changed since a tag map version.
+        
+        Args:
+            version: Map version the caller last saw
+            
+        Returns:
+            Combined changes, None if they are no longer known and the
+            caller has to rebuild from the whole map
+        """
+        if version == self._map_version:
+            return TagMapDiff(frozenset(), frozenset(), frozenset())
+        diffs = [self._diffs.get(v) for v in range(version + 1, self._map_version + 1)]
+        if version <= 0 or not diffs or None in diffs:
+            return None
+        return TagMapDiff(
+            added=frozenset().union(*(d.added for d in diffs)),
+            removed=frozenset().union(*(d.removed for d in diffs)),
+            changed=frozenset().union(*(d.changed for d in diffs)),
+            remapped=frozenset().union(*(d.remapped for d in diffs))
+        )
+
     def get_plc_tag(self, internal_tag: str) -> Optional[str]:
         """Get PLC tag name for internal tag.
         
@@ -162,22 +482,9 @@ class TagMappingService:
             logger.error("Tag mapping service not running")
             return None
 
-        logger.debug(f"Looking up PLC tag for {internal_tag}")
-        if internal_tag not in self._tag_map:
+        plc_tag = self._plc_tags.get(internal_tag)
+        if plc_tag is None and internal_tag not in self._tag_map:
             logger.error(f"Tag not found in mapping: {internal_tag}")
-            return None
-            
-        tag_info = self._tag_map[internal_tag]
-        logger.debug(f"Found tag info: {tag_info}")
-        if not tag_info.get("mapped", False):
-            logger.debug(f"Tag is not mapped: {internal_tag}")
-            return None
-            
-        plc_tag = tag_info.get("plc_tag")
-        if not plc_tag:
-            logger.error(f"No PLC tag defined for: {internal_tag}")
-            return None
-            
         return plc_tag
 
     def get_internal_tag(self, plc_tag: str) -> Optional[str]:
@@ -187,19 +494,159 @@ class TagMappingService:
             plc_tag: PLC tag name
             
         Returns:
-            Internal tag name if mapped, None if not found
+            First internal tag name mapped onto it, None if not found
         """
         if not self.is_running:
             logger.error("Tag mapping service not running")
             return None
 
-        # Search for PLC tag in mappings
-        for internal_name, tag_info in self._tag_map.items():
-            if tag_info.get("mapped", False) and tag_info.get("plc_tag") == plc_tag:
-                return internal_name
-                
-        logger.error(f"No mapping found for PLC tag: {plc_tag}")
-        return None
+        aliases = self._aliases.get(plc_tag)
+        if not aliases:
+            logger.error(f"No mapping found for PLC tag: {plc_tag}")
+            return None
+        return aliases[0]
+
+    def get_aliases(self, plc_tag: str) -> Tuple[str, ...]:
+        """Get every internal tag name mapped onto a PLC tag.
+        
+        Args:
+            plc_tag: PLC tag name
+            
+        Returns:
+            Internal tag names in definition order, empty if not mapped
+        """
+        return self._aliases.get(plc_tag, ())
+
+    def translate_many(self, values: Dict[str, Any], to_plc: bool = False) -> Dict[str, Any]:
+        """Translate a batch of tag values between PLC and internal names.
+        
+        Unmapped tags are dropped without logging, so this is safe to call
+        on every poll cycle or write.
+        
+        Args:
+            values: Dict mapping PLC tag names (or internal names if to_plc) to values
+            to_plc: Translate internal names to PLC tags instead of the reverse
+            
+        Returns:
+            Dict mapping translated names to values. PLC values fan out to
+            every internal alias.
+        """
+        if to_plc:
+            plc_tags = self._plc_tags
+            return {plc_tags[tag]: value for tag, value in values.items() if tag in plc_tags}
+        aliases = self._aliases
+        return {alias: value for plc_tag, value in values.items() for alias in aliases.get(plc_tag, ())}
+
+    def get_scaler(self, internal_tags: Optional[Iterable[str]] = None) -> TagScaler:
+        """Get a scaler between raw PLC counts and engineering units.
+        
+        Build one per batch of tags when the tag map is loaded and reuse it,
+        conversions then run without looking at scaling types.
+        
+        Args:
+            internal_tags: Internal tag names to cover, every scaled tag if None
+            
+        Returns:
+            Scaler over the scaled tags among internal_tags
+        """
+        if internal_tags is None:
+            return self._scaler
+        return self._scaler.subset(internal_tags)
+
+    def get_plc_scaler(self) -> TagScaler:
+        """Get a scaler keyed by PLC tag name, for clients simulating the PLC.
+        
+        Returns:
+            Scaler over every scaled PLC tag
+        """
+        return self._plc_scaler
+
+    def compile_template(self, template: str) -> TagTemplate:
+        """Compile a hardware set tag template such as ``hardware_sets.set{1|2}.feeder.frequency``.
+        
+        Compile templates once, e.g. when loading actions, and resolve tags
+        through the returned handle. Handles are shared per template and
+        recompiled when the tag map is reloaded.
+        
+        Args:
+            template: Tag template, a plain tag name is also accepted
+            
+        Returns:
+            Compiled template
+            
+        Raises:
+            HTTPException: If the template is malformed or refers to undefined tags
+        """
+        handle = self._templates.get(template)
+        if handle is not None:
+            return handle
+        try:
+            handle = compile_template(template, self._hardware_sets, self._tag_map)
+        except ValueError as e:
+            raise create_error(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message=str(e)
+            )
+        self._templates[template] = handle
+        return handle
+
+    def compile_templates(self, templates: Iterable[str]) -> Dict[str, TagTemplate]:
+        """Compile several templates, validating all of them before use.
+        
+        Args:
+            templates: Tag templates
+            
+        Returns:
+            Dict mapping templates to compiled templates
+            
+        Raises:
+            HTTPException: If any template is malformed or refers to undefined tags
+        """
+        handles = {}
+        errors = []
+        for template in templates:
+            try:
+                handles[template] = self.compile_template(template)
+            except HTTPException as e:
+                errors.append(e.detail["message"])
+        if errors:
+            raise create_error(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message="; ".join(errors)
+            )
+        return handles
+
+    def resolve_template(self, template: str, set_id: int) -> str:
+        """Get the concrete tag of a template for a hardware set.
+        
+        Args:
+            template: Tag template
+            set_id: Hardware set number
+            
+        Returns:
+            Internal tag name
+            
+        Raises:
+            HTTPException: If the template does not compile or cover the set
+        """
+        try:
+            return self.compile_template(template).resolve(set_id)
+        except ValueError as e:
+            raise create_error(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message=str(e)
+            )
+
+    def has_tag(self, internal_tag: str) -> bool:
+        """Check whether a tag is defined.
+        
+        Args:
+            internal_tag: Internal tag name
+            
+        Returns:
+            True if the tag is in the tag map
+        """
+        return internal_tag in self._tag_map
 
     def get_tag_type(self, internal_tag: str) -> Optional[str]:
         """Get tag type.
@@ -229,6 +676,17 @@ class TagMappingService:
             
         return self._tag_map[internal_tag].get("access")
 
+    def get_poll_rate(self, internal_tag: str) -> Optional[float]:
+        """Get tag polling rate.
+        
+        Args:
+            internal_tag: Internal tag name
+            
+        Returns:
+            Polling rate in Hz if set on the tag or one of its groups, None otherwise
+        """
+        return self._poll_rates.get(internal_tag)
+
     def get_tag_info(self, internal_name: str) -> Dict[str, Any]:
         """Get all tag information.
         
@@ -274,11 +732,16 @@ class TagMappingService:
             # Check mappings status
             mappings_ok = self.is_running and isinstance(self._tag_map, dict)
             
-            # Build component statuses
+            # Build component statuses, a failed reload leaves the previous map running
             components = {
                 "mappings": {
                     "status": "ok" if mappings_ok else "error",
                     "error": None if mappings_ok else "Mappings not initialized"
+                },
+                "reload": {
+                    "status": "ok",
+                    "error": self._reload_error,
+                    "details": {"map_version": self._map_version}
                 }
             }
             
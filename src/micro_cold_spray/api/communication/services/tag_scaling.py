@@ -0,0 +1,140 @@
+"""Engineering unit scaling for analog tags.
+
+Analog tags carry ``scaling`` and ``range`` in tags.yaml. The PLC exchanges
+raw ADC/DAC counts for them, the cache and everything above it works in the
+engineering units of the range. Scaling types are resolved to a slope and
+offset once, when the tag map is loaded, so converting a poll batch is a
+single multiply-add over an array.
+"""
+
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
+import numpy as np
+
+
+# Scaling type -> counts at the top of the range
+SCALINGS: Dict[str, int] = {
+    "12bit_linear": 4095,  # ADC input
+    "12bit_dac": 4095,  # DAC output
+}
+
+
+def scaling_params(tag_info: Mapping[str, Any]) -> Optional[Tuple[float, float, int]]:
+    """Resolve a tag definition's scaling to linear parameters.
+    
+    Args:
+        tag_info: Tag definition from tags.yaml
+    
+    Returns:
+        (slope, offset, full scale counts) with ``value = counts * slope + offset``,
+        None if the tag is not scaled
+    
+    Raises:
+        ValueError: If the scaling type is unknown or the range is invalid
+    """
+    scaling = tag_info.get("scaling")
+    if scaling is None:
+        return None
+    if scaling not in SCALINGS:
+        raise ValueError(f"Unknown scaling '{scaling}', expected one of {', '.join(SCALINGS)}")
+    value_range = tag_info.get("range")
+    if not isinstance(value_range, (list, tuple)) or len(value_range) != 2:
+        raise ValueError(f"Scaling '{scaling}' needs a [min, max] range, got {value_range}")
+    low, high = float(value_range[0]), float(value_range[1])
+    if high <= low:
+        raise ValueError(f"Invalid range [{low}, {high}]")
+    full_scale = SCALINGS[scaling]
+    return (high - low) / full_scale, low, full_scale
+
+
+class TagScaler:
+    """Converts batches of tag values between raw counts and engineering units."""
+
+    def __init__(self, params: Mapping[str, Tuple[float, float, int]]):
+        """Precompute per-tag scaling arrays.
+        
+        Args:
+            params: Dict mapping tag names to (slope, offset, full scale counts)
+        """
+        self._names: Tuple[str, ...] = tuple(params)
+        self._slope = np.array([p[0] for p in params.values()], dtype=np.float64)
+        self._offset = np.array([p[1] for p in params.values()], dtype=np.float64)
+        self._full_scale = np.array([p[2] for p in params.values()], dtype=np.float64)
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        """Get scaled tag names."""
+        return self._names
+
+    def __len__(self) -> int:
+        """Get number of scaled tags."""
+        return len(self._names)
+
+    def _gather(self, values: Mapping[str, Any]) -> np.ndarray:
+        """Collect the scaled tags' values, NaN where missing or not numeric."""
+        try:
+            return np.array([values.get(name) for name in self._names], dtype=np.float64)
+        except (TypeError, ValueError):
+            return np.array([_as_float(values.get(name)) for name in self._names], dtype=np.float64)
+
+    def _scatter(self, result: np.ndarray) -> Dict[str, Any]:
+        """Pair converted values with their tag names, skipping NaN."""
+        if not np.isnan(result).any():
+            return dict(zip(self._names, result.tolist()))
+        return {name: value for name, value in zip(self._names, result.tolist()) if value == value}
+
+    def to_engineering(self, values: Mapping[str, Any]) -> Dict[str, float]:
+        """Convert raw counts to engineering units.
+        
+        Args:
+            values: Dict mapping tag names to values, tags this scaler does
+                not know are ignored
+        
+        Returns:
+            Dict mapping the scaled tags present in values to engineering values
+        """
+        if not self._names:
+            return {}
+        return self._scatter(self._gather(values) * self._slope + self._offset)
+
+    def to_raw(self, values: Mapping[str, Any]) -> Dict[str, int]:
+        """Convert engineering units to raw counts, clamped to the counts range.
+        
+        Args:
+            values: Dict mapping tag names to values, tags this scaler does
+                not know are ignored
+        
+        Returns:
+            Dict mapping the scaled tags present in values to integer counts
+        """
+        if not self._names:
+            return {}
+        counts = np.clip(np.rint((self._gather(values) - self._offset) / self._slope), 0, self._full_scale)
+        return {name: int(value) for name, value in self._scatter(counts).items()}
+
+    def subset(self, names: Iterable[str]) -> "TagScaler":
+        """Get a scaler for the scaled tags among names.
+        
+        Args:
+            names: Tag names, unscaled ones are left out
+        
+        Returns:
+            Scaler over the scaled tags, in the order given
+        """
+        index = {name: i for i, name in enumerate(self._names)}
+        params = {}
+        for name in names:
+            i = index.get(name)
+            if i is not None:
+                params[name] = (float(self._slope[i]), float(self._offset[i]), int(self._full_scale[i]))
+        return TagScaler(params)
+
+
+def _as_float(value: Any) -> float:
+    """Convert a tag value to float, NaN if it is not numeric."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+EMPTY_SCALER = TagScaler({})
@@ -0,0 +1,137 @@
+"""Filtered tag change subscriptions."""
+
+import asyncio
+from fnmatch import fnmatchcase
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+
+class TagSubscription:
+    """Async iterator of tag change batches for one subscriber.
+
+    Changes are accumulated between reads, so a slow consumer gets the
+    latest value of every tag that moved instead of a growing backlog.
+    """
+
+    def __init__(
+        self,
+        patterns: List[str],
+        min_interval: float = 0.0,
+        deadband: float = 0.0,
+        on_close: Optional[Callable[["TagSubscription"], None]] = None
+    ):
+        """Initialize subscription.
+        
+        Args:
+            patterns: Glob patterns of internal tag names (e.g. "motion.position.*")
+            min_interval: Minimum seconds between batches
+            deadband: Minimum change of a numeric value before it is reported
+            on_close: Called once when the subscription is closed
+        """
+        self.patterns = list(patterns)
+        self.min_interval = min_interval
+        self.deadband = deadband
+        self._on_close = on_close
+        self._pending: Dict[str, Any] = {}
+        self._last_sent: Dict[str, Any] = {}
+        self._ready = asyncio.Event()
+        self._last_emit: Optional[float] = None
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        """Check if subscription is closed."""
+        return self._closed
+
+    def matches(self, tag: str) -> bool:
+        """Check if tag matches any subscription pattern.
+        
+        Args:
+            tag: Internal tag name
+        
+        Returns:
+            True if tag matches
+        """
+        return any(fnmatchcase(tag, pattern) for pattern in self.patterns)
+
+    def match_tags(self, tags: Iterable[str]) -> List[str]:
+        """Filter tag names down to the ones this subscription covers.
+        
+        Args:
+            tags: Internal tag names
+        
+        Returns:
+            Matching tag names
+        """
+        return [tag for tag in tags if self.matches(tag)]
+
+    def offer(self, tag: str, value: Any) -> None:
+        """Queue a changed value if it moved past the deadband.
+        
+        Args:
+            tag: Internal tag name
+            value: New value
+        """
+        if tag not in self._last_sent:
+            moved = True
+        else:
+            last = self._last_sent[tag]
+            if (
+                self.deadband > 0
+                and isinstance(value, (int, float)) and not isinstance(value, bool)
+                and isinstance(last, (int, float)) and not isinstance(last, bool)
+            ):
+                moved = abs(value - last) > self.deadband
+            else:
+                moved = value != last
+        
+        if moved:
+            self._pending[tag] = value
+        else:
+            # Drifted back inside the deadband before being sent
+            self._pending.pop(tag, None)
+
+    def flush(self) -> None:
+        """Wake the consumer if changes are pending."""
+        if self._pending:
+            self._ready.set()
+
+    def close(self) -> None:
+        """Close subscription and end iteration."""
+        if self._closed:
+            return
+        self._closed = True
+        self._ready.set()
+        if self._on_close:
+            self._on_close(self)
+
+    def __aiter__(self) -> "TagSubscription":
+        return self
+
+    async def __anext__(self) -> Dict[str, Any]:
+        """Wait for the next batch of changes.
+        
+        Returns:
+            Dict mapping changed tag names to values
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            if self._closed:
+                raise StopAsyncIteration
+            
+            # Rate limit before collecting, so late changes join this batch
+            if self._last_emit is not None and self.min_interval > 0:
+                delay = self._last_emit + self.min_interval - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            
+            await self._ready.wait()
+            self._ready.clear()
+            if self._closed:
+                raise StopAsyncIteration
+            if not self._pending:
+                continue
+            
+            batch, self._pending = self._pending, {}
+            self._last_sent.update(batch)
+            self._last_emit = loop.time()
+            return batch
@@ -0,0 +1,159 @@
+"""Hardware set tag templates.
+
+Atomic actions in process.yaml address the tags of either hardware set with
+a template such as ``hardware_sets.set{1|2}.feeder.frequency``. The
+``hardware_sets`` section of tags.yaml maps each set's components onto tag
+groups, e.g. ``set1.feeder`` onto ``feeders.feeder1``. A template is compiled
+once against the tag map into the concrete tag of every set, so resolving a
+(template, set) pair while an action runs is a single lookup.
+"""
+
+import re
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+
+HARDWARE_SETS = "hardware_sets"
+
+_ALTERNATIVES = re.compile(r"\{([^{}]*)\}")
+
+
+class TagTemplate:
+    """Compiled tag template, the handle actions resolve tags through."""
+
+    __slots__ = ("_template", "_tags", "_default")
+
+    def __init__(self, template: str, tags: Dict[int, str], default: Optional[str] = None):
+        """Initialize template.
+        
+        Args:
+            template: Template it was compiled from
+            tags: Dict mapping hardware set numbers to concrete tag names
+            default: Tag name for every set, for templates without alternatives
+        """
+        self._template = template
+        self._tags = tags
+        self._default = default
+
+    @property
+    def template(self) -> str:
+        """Get template it was compiled from."""
+        return self._template
+
+    @property
+    def tags(self) -> Dict[int, str]:
+        """Get concrete tag names by hardware set number."""
+        return dict(self._tags)
+
+    @property
+    def sets(self) -> Tuple[int, ...]:
+        """Get hardware set numbers the template covers, empty if it covers any."""
+        return tuple(self._tags)
+
+    def resolve(self, set_id: int) -> str:
+        """Get the concrete tag name for a hardware set.
+        
+        Args:
+            set_id: Hardware set number
+        
+        Returns:
+            Internal tag name
+        
+        Raises:
+            ValueError: If the template does not cover the set
+        """
+        tag = self._tags.get(set_id, self._default)
+        if tag is None:
+            raise ValueError(f"Hardware set {set_id} not in template {self._template}")
+        return tag
+
+    def _update(self, compiled: "TagTemplate") -> None:
+        """Take over another compilation, so handles survive a tag map reload."""
+        self._tags = compiled._tags
+        self._default = compiled._default
+
+    def __repr__(self) -> str:
+        return f"TagTemplate({self._template!r}, {self._tags or self._default})"
+
+
+def expand_template(template: str) -> Dict[int, str]:
+    """Expand a template's ``{a|b}`` alternatives.
+    
+    Args:
+        template: Tag name with one ``{1|2}`` style group of hardware set numbers
+    
+    Returns:
+        Dict mapping set numbers to names, empty if there are no alternatives
+    
+    Raises:
+        ValueError: If there is more than one group or an alternative is not a number
+    """
+    groups = _ALTERNATIVES.findall(template)
+    if not groups:
+        return {}
+    if len(groups) > 1:
+        raise ValueError(f"Template {template} has more than one {{...}} group")
+    match = _ALTERNATIVES.search(template)
+    names = {}
+    for alternative in groups[0].split("|"):
+        alternative = alternative.strip()
+        if not alternative.isdigit():
+            raise ValueError(f"Template {template} alternative '{alternative}' is not a hardware set number")
+        names[int(alternative)] = f"{template[:match.start()]}{alternative}{template[match.end():]}"
+    return names
+
+
+def resolve_hardware_set(name: str, hardware_sets: Mapping[str, Mapping[str, str]]) -> str:
+    """Translate a ``hardware_sets.<set>.<component>.<tag>`` name to its tag group.
+    
+    Args:
+        name: Tag name, names outside hardware_sets are returned as is
+        hardware_sets: The hardware_sets section of tags.yaml
+    
+    Returns:
+        Internal tag name
+    
+    Raises:
+        ValueError: If the set or component is not defined
+    """
+    if not name.startswith(f"{HARDWARE_SETS}."):
+        return name
+    parts = name.split(".", 3)
+    if len(parts) < 4:
+        raise ValueError(f"{name} does not address a hardware set component")
+    _, set_name, component, tag = parts
+    prefix = hardware_sets.get(set_name, {}).get(component)
+    if not prefix:
+        raise ValueError(f"Hardware set component {set_name}.{component} not defined")
+    return f"{prefix}.{tag}"
+
+
+def compile_template(
+    template: str,
+    hardware_sets: Mapping[str, Mapping[str, str]],
+    tag_map: Mapping[str, Any]
+) -> TagTemplate:
+    """Compile a template against the tag map.
+    
+    Args:
+        template: Tag template, a plain tag name is also accepted
+        hardware_sets: The hardware_sets section of tags.yaml
+        tag_map: Tag definitions by internal name
+    
+    Returns:
+        Compiled template
+    
+    Raises:
+        ValueError: If the template is malformed or a concrete tag is not defined
+    """
+    names = expand_template(template)
+    if names:
+        tags = {set_id: resolve_hardware_set(name, hardware_sets) for set_id, name in names.items()}
+        compiled = TagTemplate(template, tags)
+    else:
+        tags = {0: resolve_hardware_set(template, hardware_sets)}
+        compiled = TagTemplate(template, {}, tags[0])
+    
+    missing = [tag for tag in tags.values() if tag not in tag_map]
+    if missing:
+        raise ValueError(f"Template {template} refers to undefined tags: {', '.join(missing)}")
+    return compiled
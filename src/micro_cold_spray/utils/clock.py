@@ -0,0 +1,108 @@
+"""Event loop clock with an optional virtual time mode.
+
+The mock PLC, the tag cache poll loop and process execution all wait with
+``asyncio.sleep``/``asyncio.wait_for`` and read time from the running loop.
+Running them on a ``VirtualClockEventLoop`` makes those waits return as soon
+as nothing else is ready, jumping loop time straight to the next timer, so
+simulated hours of a sequence run in seconds.
+
+Real I/O still works on a virtual clock loop, but timers do not wait for it:
+only use virtual time with the mock client.
+"""
+
+import asyncio
+import os
+import selectors
+import time
+from typing import Any, List, Optional, Tuple
+
+
+def monotonic() -> float:
+    """Get monotonic time in seconds from the running event loop.
+    
+    Returns:
+        Loop time, which is virtual on a virtual clock loop, or
+        time.monotonic() outside of a running loop
+    """
+    try:
+        return asyncio.get_running_loop().time()
+    except RuntimeError:
+        return time.monotonic()
+
+
+def virtual_clock_enabled() -> bool:
+    """Check if the VIRTUAL_CLOCK environment variable asks for virtual time."""
+    return os.getenv("VIRTUAL_CLOCK", "").lower() in ("true", "1", "yes")
+
+
+class _VirtualSelector:
+    """Selector that advances the loop clock instead of blocking on timers."""
+
+    def __init__(self, selector: selectors.BaseSelector, loop: "VirtualClockEventLoop"):
+        """Initialize selector.
+        
+        Args:
+            selector: Real selector to poll for I/O
+            loop: Loop whose clock to advance
+        """
+        self._selector = selector
+        self._loop = loop
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._selector, name)
+
+    def select(self, timeout: Optional[float] = None) -> List[Tuple[selectors.SelectorKey, int]]:
+        """Poll for I/O, jumping to the next timer when nothing is ready.
+        
+        Args:
+            timeout: Seconds until the next timer is due, None if there is none
+        
+        Returns:
+            Ready (key, events) pairs
+        """
+        ready = self._selector.select(0)
+        if ready or timeout == 0:
+            return ready
+        if timeout is None:
+            # Nothing scheduled, only real I/O can wake the loop
+            return self._selector.select(None)
+        self._loop.advance(timeout)
+        return []
+
+
+class VirtualClockEventLoop(asyncio.SelectorEventLoop):
+    """Event loop whose clock only moves when every task is waiting on a timer."""
+
+    def __init__(self, start: Optional[float] = None):
+        """Initialize loop.
+        
+        Args:
+            start: Initial loop time, defaults to time.monotonic()
+        """
+        self._virtual_time = time.monotonic() if start is None else start
+        super().__init__(_VirtualSelector(selectors.DefaultSelector(), self))
+
+    def time(self) -> float:
+        """Get virtual loop time in seconds."""
+        return self._virtual_time
+
+    def advance(self, seconds: float) -> None:
+        """Move virtual time forward.
+        
+        Args:
+            seconds: Seconds to advance by
+        """
+        if seconds > 0:
+            self._virtual_time += seconds
+
+
+class VirtualClockPolicy(asyncio.DefaultEventLoopPolicy):
+    """Event loop policy creating virtual clock loops."""
+
+    def new_event_loop(self) -> VirtualClockEventLoop:
+        return VirtualClockEventLoop()
+
+
+def install_virtual_clock() -> None:
+    """Make asyncio.run and new event loops use virtual time."""
+    asyncio.set_event_loop_policy(VirtualClockPolicy())
@@ -2,7 +2,7 @@
 
 import time
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 from pydantic import BaseModel, Field
 
 
@@ -23,6 +23,7 @@ class ComponentHealth(BaseModel):
     """Component health status."""
     status: str = Field(..., description="Component status (ok or error)")
     error: Optional[str] = Field(None, description="Error message if any")
+    details: Optional[Dict[str, Any]] = Field(None, description="Component specific details")
 
 
 class ServiceHealth(BaseModel):
@@ -0,0 +1,246 @@
+"""Shared memory snapshot of the latest tag table.
+
+The communication service publishes its tag cache into a named shared memory
+block every poll cycle. Services on the same machine read it with
+``TagSnapshotReader`` instead of polling the HTTP API, without adding any PLC
+load.
+
+The block starts with a header of ``<sequence uint64><version uint64>
+<timestamp float64><length uint32><owner pid uint64>`` followed by a JSON
+payload. The
+publisher makes the sequence odd while it writes and even when done, so
+readers retry until they see the same even sequence before and after their
+copy (a seqlock). The version only changes with the payload, which lets
+readers skip decoding a snapshot they already have. The owner pid lets a
+new publisher tell a block left by a crashed service from one in use.
+"""
+
+import json
+import os
+import struct
+import time
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Dict, FrozenSet, Iterable, NamedTuple
+from loguru import logger
+
+
+DEFAULT_NAME = "micro_cold_spray_tags"
+DEFAULT_SIZE = 1024 * 1024
+
+_SEQUENCE = struct.Struct("<Q")
+_BODY = struct.Struct("<QdI")
+_OWNER = struct.Struct("<Q")
+_OWNER_OFFSET = _SEQUENCE.size + _BODY.size
+_HEADER_SIZE = _OWNER_OFFSET + _OWNER.size
+
+
+class TagSnapshot(NamedTuple):
+    """Consistent copy of the tag table."""
+    version: int
+    timestamp: float
+    values: Dict[str, Any]
+    stale: FrozenSet[str]
+
+
+EMPTY_SNAPSHOT = TagSnapshot(0, 0.0, {}, frozenset())
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Attach without letting this process's resource tracker remove the block on exit."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # Python 3.13+
+    except TypeError:
+        shm = shared_memory.SharedMemory(name=name)
+        if os.name == "posix":
+            resource_tracker.unregister(shm._name, "shared_memory")
+        return shm
+
+
+def _owner_alive(pid: int) -> bool:
+    """Check if a block owner may still be running, True unless it is known to be gone."""
+    if pid <= 0 or os.name != "posix":
+        # Unknown owner, and Windows frees a block with its last handle
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+class TagSnapshotPublisher:
+    """Writes tag table snapshots into shared memory."""
+
+    def __init__(self, name: str = DEFAULT_NAME, size: int = DEFAULT_SIZE):
+        """Create the shared memory block, replacing one left by a crashed service.
+        
+        Args:
+            name: Shared memory block name
+            size: Block size in bytes
+        
+        Raises:
+            FileExistsError: If the name is used by a running publisher or
+                a block of unknown origin
+        """
+        try:
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            self._reclaim(name)
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        self._name = name
+        self._capacity = self._shm.size - _HEADER_SIZE
+        self._sequence = 0
+        self._version = 0
+        self._too_large = False
+        _SEQUENCE.pack_into(self._shm.buf, 0, 0)
+        _BODY.pack_into(self._shm.buf, _SEQUENCE.size, 0, 0.0, 0)
+        _OWNER.pack_into(self._shm.buf, _OWNER_OFFSET, os.getpid())
+        logger.info(f"Publishing tag snapshots to shared memory '{name}' ({size // 1024} KiB)")
+
+    @staticmethod
+    def _reclaim(name: str) -> None:
+        """Remove an existing block if the publisher that created it is gone.
+        
+        Args:
+            name: Shared memory block name
+        
+        Raises:
+            FileExistsError: If the owner may still be running
+        """
+        stale = shared_memory.SharedMemory(name=name)
+        owner = _OWNER.unpack_from(stale.buf, _OWNER_OFFSET)[0] if stale.size >= _HEADER_SIZE else 0
+        if _owner_alive(owner):
+            # Leave the block to its owner when this process exits
+            if os.name == "posix":
+                resource_tracker.unregister(stale._name, "shared_memory")
+            stale.close()
+            owner_name = f"process {owner}" if owner else "an unknown process"
+            raise FileExistsError(f"Shared memory '{name}' is in use by {owner_name}")
+        logger.warning(f"Replacing shared memory '{name}' left by stopped process {owner}")
+        stale.close()
+        stale.unlink()
+
+    @property
+    def name(self) -> str:
+        """Get shared memory block name."""
+        return self._name
+
+    @property
+    def version(self) -> int:
+        """Get number of snapshots published."""
+        return self._version
+
+    def publish(self, values: Dict[str, Any], stale: Iterable[str] = ()) -> bool:
+        """Publish a new snapshot.
+        
+        Args:
+            values: Tag values
+            stale: Tags whose values are stale
+        
+        Returns:
+            Whether the snapshot fit into the block
+        """
+        payload = json.dumps({"values": values, "stale": list(stale)}, separators=(",", ":"), default=str).encode()
+        if len(payload) > self._capacity:
+            if not self._too_large:
+                logger.error(f"Tag snapshot of {len(payload)} bytes does not fit into {self._capacity} bytes")
+                self._too_large = True
+            return False
+        self._too_large = False
+        
+        buf = self._shm.buf
+        _SEQUENCE.pack_into(buf, 0, self._sequence + 1)
+        buf[_HEADER_SIZE:_HEADER_SIZE + len(payload)] = payload
+        self._version += 1
+        _BODY.pack_into(buf, _SEQUENCE.size, self._version, time.time(), len(payload))
+        self._sequence += 2
+        _SEQUENCE.pack_into(buf, 0, self._sequence)
+        return True
+
+    def touch(self) -> None:
+        """Refresh the timestamp of the current snapshot without changing it."""
+        if self._version == 0:
+            return
+        buf = self._shm.buf
+        length = _BODY.unpack_from(buf, _SEQUENCE.size)[2]
+        _SEQUENCE.pack_into(buf, 0, self._sequence + 1)
+        _BODY.pack_into(buf, _SEQUENCE.size, self._version, time.time(), length)
+        self._sequence += 2
+        _SEQUENCE.pack_into(buf, 0, self._sequence)
+
+    def close(self) -> None:
+        """Remove the shared memory block."""
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+
+class TagSnapshotReader:
+    """Reads tag table snapshots published by the communication service.
+    
+    A reader stays attached to the block it opened, if the communication
+    service restarts the snapshot timestamp stops moving and a new reader
+    is needed.
+    """
+
+    def __init__(self, name: str = DEFAULT_NAME, retries: int = 1000):
+        """Attach to the shared memory block.
+        
+        Args:
+            name: Shared memory block name
+            retries: Read attempts while the publisher is writing
+        
+        Raises:
+            ConnectionError: If no snapshot is published under the name
+        """
+        try:
+            self._shm = _attach(name)
+        except FileNotFoundError:
+            raise ConnectionError(f"No tag snapshot published as '{name}', is the communication service running?")
+        self._retries = retries
+        self._last: TagSnapshot = EMPTY_SNAPSHOT
+
+    def read(self) -> TagSnapshot:
+        """Read the latest snapshot.
+        
+        Returns:
+            Latest snapshot, EMPTY_SNAPSHOT before the first publish
+        
+        Raises:
+            RuntimeError: If the snapshot kept changing for every attempt
+        """
+        buf = self._shm.buf
+        for _ in range(self._retries):
+            sequence = _SEQUENCE.unpack_from(buf, 0)[0]
+            if sequence % 2:
+                time.sleep(0)
+                continue
+            version, timestamp, length = _BODY.unpack_from(buf, _SEQUENCE.size)
+            # Only copy the payload if it changed since the last read
+            payload = None if version == self._last.version else bytes(buf[_HEADER_SIZE:_HEADER_SIZE + length])
+            if _SEQUENCE.unpack_from(buf, 0)[0] != sequence:
+                continue
+            if version == 0:
+                return EMPTY_SNAPSHOT
+            if payload is not None:
+                data = json.loads(payload)
+                self._last = TagSnapshot(version, timestamp, data["values"], frozenset(data["stale"]))
+            elif timestamp != self._last.timestamp:
+                self._last = self._last._replace(timestamp=timestamp)
+            return self._last
+        raise RuntimeError(f"Tag snapshot kept changing over {self._retries} read attempts")
+
+    def close(self) -> None:
+        """Detach from the shared memory block."""
+        if self._shm is not None:
+            self._shm.close()
+            self._shm = None
+
+    def __enter__(self) -> "TagSnapshotReader":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()